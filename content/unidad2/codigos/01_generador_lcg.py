@@ -3,6 +3,17 @@ Unidad 2 - Ejemplo 1: Generador Congruencial Lineal (LCG)
 Implementación y pruebas de calidad
 """
 
+import os
+import sys
+
+# periodo_lcg (periodo real de una semilla) está en scripts/ del repositorio
+RUTA_SCRIPTS = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                             '..', '..', '..', 'scripts'))
+if RUTA_SCRIPTS not in sys.path:
+    sys.path.append(RUTA_SCRIPTS)
+
+from periodo_lcg import longitud_sin_repeticion
+
 class GeneradorLCG:
     """Generador Congruencial Lineal"""
     
@@ -21,6 +32,39 @@ class GeneradorLCG:
     def generar_n(self, n):
         """Genera n números"""
         return [self.siguiente() for _ in range(n)]
+    
+    def saltar(self, k):
+        """
+        Avanza k pasos sin generar los números intermedios, en O(log k)
+        
+        Usa exponenciación binaria de la transformación x -> a*x + c:
+        aplicarla k veces equivale a x -> A*x + C (mod m)
+        """
+        A, C = 1, 0
+        a_pot, c_pot = self.a % self.m, self.c % self.m
+        while k > 0:
+            if k & 1:
+                A = (a_pot * A) % self.m
+                C = (a_pot * C + c_pot) % self.m
+            c_pot = (a_pot * c_pot + c_pot) % self.m
+            a_pot = (a_pot * a_pot) % self.m
+            k >>= 1
+        self.actual = (A * self.actual + C) % self.m
+    
+    def subflujo(self, i, longitud=2**20):
+        """Crea un generador que inicia i*longitud pasos después de la semilla"""
+        if i < 0 or longitud <= 0:
+            raise ValueError("Índice o longitud de subflujo inválidos")
+        # Se compara con el periodo real de la semilla, no con m: con c = 0 o
+        # parámetros que no cumplen Hull-Dobell los ciclos son más cortos
+        disponible = longitud_sin_repeticion(self.a, self.c, self.m, self.semilla % self.m)
+        if (i + 1) * longitud > disponible:
+            raise ValueError(f"El subflujo excede los {disponible} números sin "
+                             f"repetición de la semilla")
+        gen = GeneradorLCG(self.semilla, self.a, self.c, self.m)
+        gen.saltar(i * longitud)
+        gen.semilla = gen.actual
+        return gen
 
 def prueba_uniformidad_visual(numeros):
     """Prueba visual de uniformidad"""
@@ -62,9 +62,20 @@ TIEMPO_ENTRE_ORDENES = 6.0  # minutos (determinístico)
 class LineaProduccion:
     """Modelo de simulación de línea de producción"""
     
-    def __init__(self, env, config='baseline'):
+    def __init__(self, env, config='baseline', generador_contador=None):
+        """
+        Args:
+            env: Ambiente de SimPy
+            config: Escenario a simular
+            generador_contador: Generador con método uniforme(flujo, entidad,
+                indice), p. ej. GeneradorPhilox de scripts/generador_contador.py.
+                Con él, el tiempo de cada orden en cada estación depende sólo
+                de (estación, orden), de modo que cambiar una estación no
+                altera los números de las demás (números aleatorios comunes)
+        """
         self.env = env
         self.config = config
+        self.generador_contador = generador_contador
         
         # Recursos (estaciones)
         self.estacion1 = simpy.Resource(env, capacity=1)
@@ -87,6 +98,14 @@ class LineaProduccion:
         self.tiempos_por_estacion = {f'est{i}': [] for i in range(1, 6)}
         self.tiempos_espera = []
         
+    def tiempo_proceso(self, estacion, orden_id):
+        """Tiempo de proceso ~ Normal(media, std) de una orden en una estación"""
+        datos = DATOS_REALES[estacion]
+        if self.generador_contador is None:
+            return np.random.normal(datos['media'], datos['std'])
+        u = self.generador_contador.uniforme(estacion, orden_id)
+        return datos['media'] + datos['std'] * stats.norm.ppf(u)
+    
     def proceso_orden(self, orden_id):
         """Proceso completo de una orden"""
         llegada = self.env.now
@@ -98,10 +117,7 @@ class LineaProduccion:
             yield req
             tiempo_espera_total += self.env.now - inicio_espera
             
-            tiempo_proceso = np.random.normal(
-                DATOS_REALES['estacion1']['media'],
-                DATOS_REALES['estacion1']['std']
-            )
+            tiempo_proceso = self.tiempo_proceso('estacion1', orden_id)
             self.tiempos_por_estacion['est1'].append(tiempo_proceso)
             yield self.env.timeout(max(0, tiempo_proceso))
         
@@ -111,20 +127,14 @@ class LineaProduccion:
             yield req
             tiempo_espera_total += self.env.now - inicio_espera
             
-            tiempo_proceso = np.random.normal(
-                DATOS_REALES['estacion2']['media'],
-                DATOS_REALES['estacion2']['std']
-            )
+            tiempo_proceso = self.tiempo_proceso('estacion2', orden_id)
             self.tiempos_por_estacion['est2'].append(tiempo_proceso)
             yield self.env.timeout(max(0, tiempo_proceso))
         
         # Inspección 1
         with self.inspector1.request() as req:
             yield req
-            tiempo_proceso = np.random.normal(
-                DATOS_REALES['inspeccion1']['media'],
-                DATOS_REALES['inspeccion1']['std']
-            )
+            tiempo_proceso = self.tiempo_proceso('inspeccion1', orden_id)
             yield self.env.timeout(max(0, tiempo_proceso))
         
         # Estación 3 (posible cuello de botella)
@@ -133,10 +143,7 @@ class LineaProduccion:
             yield req
             tiempo_espera_total += self.env.now - inicio_espera
             
-            tiempo_proceso = np.random.normal(
-                DATOS_REALES['estacion3']['media'],
-                DATOS_REALES['estacion3']['std']
-            )
+            tiempo_proceso = self.tiempo_proceso('estacion3', orden_id)
             self.tiempos_por_estacion['est3'].append(tiempo_proceso)
             yield self.env.timeout(max(0, tiempo_proceso))
         
@@ -146,10 +153,7 @@ class LineaProduccion:
             yield req
             tiempo_espera_total += self.env.now - inicio_espera
             
-            tiempo_proceso = np.random.normal(
-                DATOS_REALES['estacion4']['media'],
-                DATOS_REALES['estacion4']['std']
-            )
+            tiempo_proceso = self.tiempo_proceso('estacion4', orden_id)
             self.tiempos_por_estacion['est4'].append(tiempo_proceso)
             yield self.env.timeout(max(0, tiempo_proceso))
         
@@ -159,20 +163,14 @@ class LineaProduccion:
             yield req
             tiempo_espera_total += self.env.now - inicio_espera
             
-            tiempo_proceso = np.random.normal(
-                DATOS_REALES['estacion5']['media'],
-                DATOS_REALES['estacion5']['std']
-            )
+            tiempo_proceso = self.tiempo_proceso('estacion5', orden_id)
             self.tiempos_por_estacion['est5'].append(tiempo_proceso)
             yield self.env.timeout(max(0, tiempo_proceso))
         
         # Inspección 2
         with self.inspector2.request() as req:
             yield req
-            tiempo_proceso = np.random.normal(
-                DATOS_REALES['inspeccion2']['media'],
-                DATOS_REALES['inspeccion2']['std']
-            )
+            tiempo_proceso = self.tiempo_proceso('inspeccion2', orden_id)
             yield self.env.timeout(max(0, tiempo_proceso))
         
         # Completado
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Ajuste de Distribuciones
+Estimación por máxima verosimilitud (exponencial, normal, lognormal,
+Weibull, gamma y triangular) y pruebas de bondad de ajuste contra
+cualquier función de distribución: Chi-cuadrada, Kolmogorov-Smirnov,
+Anderson-Darling y Cramér-von Mises
+"""
+
+import math
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+from scipy import special, stats
+
+from fuente_uniforme import FuenteLCG
+from generador_variables_aleatorias import GeneradorVariablesAleatorias
+from pruebas_estadisticas import PruebasEstadisticas
+from valores_criticos import critico_chi2, p_valor_chi2
+
+
+# ========== PRUEBAS DE BONDAD DE AJUSTE ==========
+
+def _p_valor_anderson_darling(a2: float) -> float:
+    """
+    p-valor asintótico de Anderson-Darling (Marsaglia y Marsaglia, 2004)
+    
+    Error absoluto menor que 2e-6 para la distribución límite.
+    """
+    if a2 <= 0:
+        return 1.0
+    if a2 < 2:
+        acumulada = math.exp(-1.2337141 / a2) / math.sqrt(a2) * (
+            2.00012 + (0.247105 - (0.0649821 - (0.0347962 - (0.011672 - 0.00168691 * a2)
+                                               * a2) * a2) * a2) * a2)
+    else:
+        acumulada = math.exp(-math.exp(
+            1.0776 - (2.30695 - (0.43424 - (0.082433 - (0.008056 - 0.0003146 * a2)
+                                            * a2) * a2) * a2) * a2))
+    return min(max(1.0 - acumulada, 0.0), 1.0)
+
+
+def pruebas_ajuste(datos, cdf: Callable[[np.ndarray], np.ndarray],
+                   parametros_estimados: int = 0, k: int = None,
+                   alpha: float = 0.05) -> Dict[str, Dict]:
+    """
+    Pruebas de bondad de ajuste de los datos contra una función de distribución
+    
+    Si X tiene distribución F, U = F(X) es U(0,1): las cuatro pruebas se
+    aplican a los valores F(x) ordenados una sola vez. Si los parámetros de
+    F se estimaron con los mismos datos, la Chi-cuadrada descuenta un grado
+    de libertad por parámetro; los p-valores de K-S, Anderson-Darling y
+    Cramér-von Mises suponen F conocida y resultan conservadores.
+    
+    Args:
+        datos: Observaciones
+        cdf: Función de distribución vectorizada (p. ej. stats.norm(0, 1).cdf)
+        parametros_estimados: Parámetros estimados con los mismos datos
+        k: Clases equiprobables de la Chi-cuadrada (None = ceil(2 n^(2/5)))
+        alpha: Nivel de significancia
+    
+    Returns:
+        Diccionario con los resultados de 'chi_cuadrada',
+        'kolmogorov_smirnov', 'anderson_darling' y 'cramer_von_mises'
+    """
+    x = np.asarray(datos, dtype=np.float64).reshape(-1)
+    n = len(x)
+    if n < 2:
+        raise ValueError("Se necesitan al menos 2 observaciones")
+    if np.ptp(x) == 0:
+        raise ValueError("Los datos son constantes: no hay distribución continua que ajustar")
+    u = np.sort(np.clip(cdf(x), 0.0, 1.0))
+    if not np.all(np.isfinite(u)):
+        raise ValueError("La función de distribución devolvió valores no finitos")
+    
+    # Chi-cuadrada con k clases equiprobables en la escala de F
+    k = k or max(int(math.ceil(2 * n ** 0.4)), parametros_estimados + 2)
+    clases = np.minimum((u * k).astype(np.int64), k - 1)
+    observadas = np.bincount(clases, minlength=k)
+    esperada = n / k
+    chi_cuadrado = float(np.sum((observadas - esperada) ** 2) / esperada)
+    gl = k - 1 - parametros_estimados
+    valor_critico = critico_chi2(alpha, gl)
+    chi = {
+        'prueba': 'Chi-cuadrada',
+        'estadistico': chi_cuadrado,
+        'grados_libertad': gl,
+        'valor_critico': valor_critico,
+        'p_valor': p_valor_chi2(chi_cuadrado, gl),
+        'nivel_significancia': alpha,
+        'acepta_h0': chi_cuadrado < valor_critico,
+        'frecuencias_observadas': observadas.tolist(),
+        'frecuencia_esperada': esperada
+    }
+    
+    ks = PruebasEstadisticas.prueba_kolmogorov_smirnov(u, alpha)
+    
+    # Anderson-Darling: A2 = -n - (1/n) sum (2i-1) [ln u_(i) + ln(1 - u_(n+1-i))]
+    extremos = np.clip(u, 1e-300, 1 - 1e-16)
+    pesos = np.arange(1, 2 * n, 2, dtype=np.float64)
+    a2 = float(-n - np.dot(pesos, np.log(extremos) + np.log1p(-extremos[::-1])) / n)
+    p_ad = _p_valor_anderson_darling(a2)
+    ad = {
+        'prueba': 'Anderson-Darling',
+        'estadistico': a2,
+        'p_valor': p_ad,
+        'nivel_significancia': alpha,
+        'acepta_h0': p_ad >= alpha
+    }
+    
+    # Con estadísticos enormes la serie de SciPy produce NaN: el p-valor es 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cvm_scipy = stats.cramervonmises(u, 'uniform')
+    p_cvm = float(np.nan_to_num(cvm_scipy.pvalue, nan=0.0))
+    cvm = {
+        'prueba': 'Cramér-von Mises',
+        'estadistico': float(cvm_scipy.statistic),
+        'p_valor': p_cvm,
+        'nivel_significancia': alpha,
+        'acepta_h0': p_cvm >= alpha
+    }
+    
+    resultados = {'chi_cuadrada': chi, 'kolmogorov_smirnov': ks,
+                  'anderson_darling': ad, 'cramer_von_mises': cvm}
+    for resultado in resultados.values():
+        resultado['conclusion'] = 'ACEPTA el ajuste' if resultado['acepta_h0'] else 'RECHAZA el ajuste'
+    return resultados
+
+
+# ========== ESTIMACIÓN POR MÁXIMA VEROSIMILITUD ==========
+
+def ajustar_exponencial(x: np.ndarray) -> Dict:
+    """λ = 1 / media"""
+    lambd = 1 / np.mean(x)
+    return {'parametros': {'lambd': float(lambd)},
+            'distribucion': stats.expon(scale=1 / lambd)}
+
+
+def ajustar_normal(x: np.ndarray) -> Dict:
+    """Media y desviación estándar (con divisor n)"""
+    mu, sigma = np.mean(x), np.std(x)
+    return {'parametros': {'mu': float(mu), 'sigma': float(sigma)},
+            'distribucion': stats.norm(mu, sigma)}
+
+
+def ajustar_lognormal(x: np.ndarray) -> Dict:
+    """Normal ajustada a ln(x)"""
+    logaritmos = np.log(x)
+    mu, sigma = np.mean(logaritmos), np.std(logaritmos)
+    return {'parametros': {'mu': float(mu), 'sigma': float(sigma)},
+            'distribucion': stats.lognorm(sigma, scale=math.exp(mu))}
+
+
+def ajustar_weibull(x: np.ndarray, tolerancia: float = 1e-10,
+                    iteraciones: int = 100) -> Dict:
+    """
+    Weibull con escala alpha y forma beta (como GeneradorVariablesAleatorias)
+    
+    La forma resuelve con Newton la ecuación de perfil
+        sum(x^b ln x) / sum(x^b) - 1/b - mean(ln x) = 0,
+    con z = ln x - mean(ln x) y exp(b (z - max z)) para evitar desbordes.
+    """
+    z = np.log(x)
+    media_log = np.mean(z)
+    z -= media_log
+    z_max = np.max(z)
+    beta = 1.2825 / np.std(z) if np.std(z) > 0 else 1.0  # pi / sqrt(6)
+    
+    for _ in range(iteraciones):
+        w = np.exp(beta * (z - z_max))
+        s0, s1, s2 = np.sum(w), np.dot(w, z), np.dot(w, z * z)
+        f = s1 / s0 - 1 / beta
+        derivada = (s2 * s0 - s1 * s1) / (s0 * s0) + 1 / beta ** 2
+        paso = f / derivada
+        beta = beta - paso if beta - paso > 0 else beta / 2
+        if abs(paso) < tolerancia * beta:
+            break
+    
+    w = np.exp(beta * (z - z_max))
+    alpha = math.exp(media_log + z_max + math.log(np.mean(w)) / beta)
+    return {'parametros': {'alpha': float(alpha), 'beta': float(beta)},
+            'distribucion': stats.weibull_min(beta, scale=alpha)}
+
+
+def ajustar_gamma(x: np.ndarray, tolerancia: float = 1e-10,
+                  iteraciones: int = 100) -> Dict:
+    """
+    Gamma con forma k y escala theta (iteración de Newton generalizada de Minka)
+    
+    Con s = ln(media) - mean(ln x), la forma cumple ln k - psi(k) = s y
+    theta = media / k.
+    """
+    media = np.mean(x)
+    s = math.log(media) - np.mean(np.log(x))
+    # Con datos (casi) constantes s <= 0 por redondeo o la iteración diverge;
+    # entonces k queda como NaN y ajustar_distribuciones omite la gamma
+    k = (3 - s + math.sqrt((s - 3) ** 2 + 24 * s)) / (12 * s) if s > 0 else math.nan
+    for _ in range(iteraciones):
+        nuevo = 1 / (1 / k + (math.log(k) - special.digamma(k) - s)
+                     / (k * k * (1 / k - special.polygamma(1, k))))
+        if not 0 < nuevo < math.inf:
+            k = math.nan
+            break
+        if abs(nuevo - k) < tolerancia * k:
+            k = nuevo
+            break
+        k = nuevo
+    theta = media / k
+    return {'parametros': {'k': float(k), 'theta': float(theta)},
+            'distribucion': stats.gamma(k, scale=theta)}
+
+
+def ajustar_triangular(x: np.ndarray) -> Dict:
+    """
+    Triangular con mínimo a, máximo b y moda c (como GeneradorVariablesAleatorias)
+    
+    Los extremos se estiman con el mínimo y el máximo extendidos
+    (max - min) / (n - 1), y dados a y b la moda de máxima verosimilitud
+    es la observación x_(r) que maximiza
+        sum_{j<r} ln u_j - (r-1) ln u_r + sum_{j>r} ln(1-u_j) - (n-r) ln(1-u_r),
+    con u = (x - a) / (b - a); todas las r se evalúan a la vez con sumas
+    acumuladas.
+    """
+    ordenados = np.sort(x)
+    n = len(ordenados)
+    margen = (ordenados[-1] - ordenados[0]) / (n - 1)
+    a, b = ordenados[0] - margen, ordenados[-1] + margen
+    u = (ordenados - a) / (b - a)
+    
+    log_u, log_1u = np.log(u), np.log1p(-u)
+    antes = np.concatenate(([0.0], np.cumsum(log_u)[:-1]))
+    despues = np.concatenate((np.cumsum(log_1u[::-1])[::-1][1:], [0.0]))
+    r = np.arange(n)
+    verosimilitud = antes - r * log_u + despues - (n - 1 - r) * log_1u
+    c = ordenados[int(np.argmax(verosimilitud))]
+    
+    return {'parametros': {'a': float(a), 'b': float(b), 'c': float(c)},
+            'distribucion': stats.triang((c - a) / (b - a), loc=a, scale=b - a)}
+
+
+# Candidatas: nombre -> (función de ajuste, número de parámetros, sólo positivos)
+AJUSTES = {
+    'exponencial': (ajustar_exponencial, 1, True),
+    'normal': (ajustar_normal, 2, False),
+    'lognormal': (ajustar_lognormal, 2, True),
+    'weibull': (ajustar_weibull, 2, True),
+    'gamma': (ajustar_gamma, 2, True),
+    'triangular': (ajustar_triangular, 3, False),
+}
+
+
+def ajustar_distribuciones(datos, candidatas: List[str] = None, k: int = None,
+                           alpha: float = 0.05) -> List[Dict]:
+    """
+    Ajusta las distribuciones candidatas y las ordena por AIC
+    
+    Las candidatas de soporte positivo se omiten si hay datos <= 0, y
+    también cualquier candidata cuyo ajuste da parámetros no finitos.
+    
+    Args:
+        datos: Observaciones
+        candidatas: Nombres de AJUSTES (None = todas)
+        k: Clases de la Chi-cuadrada (None = automático)
+        alpha: Nivel de significancia
+    
+    Returns:
+        Lista de ajustes de mejor a peor AIC; cada uno con parámetros,
+        log-verosimilitud, AIC, BIC y las cuatro pruebas de bondad de ajuste
+    """
+    x = np.asarray(datos, dtype=np.float64).reshape(-1)
+    candidatas = list(AJUSTES) if candidatas is None else candidatas
+    desconocidas = set(candidatas) - set(AJUSTES)
+    if desconocidas:
+        raise ValueError(f"Distribuciones no soportadas: {sorted(desconocidas)}")
+    
+    if len(x) < 2:
+        raise ValueError("Se necesitan al menos 2 observaciones")
+    if np.ptp(x) == 0:
+        raise ValueError("Los datos son constantes: no hay distribución continua que ajustar")
+    
+    positivos = bool(np.all(x > 0))
+    ajustes = []
+    for nombre in candidatas:
+        ajustar, num_parametros, solo_positivos = AJUSTES[nombre]
+        if solo_positivos and not positivos:
+            continue
+        with np.errstate(all='ignore'):
+            ajuste = ajustar(x)
+        if not all(math.isfinite(v) for v in ajuste['parametros'].values()):
+            continue
+        distribucion = ajuste['distribucion']
+        log_verosimilitud = float(np.sum(distribucion.logpdf(x)))
+        ajustes.append({
+            'distribucion': nombre,
+            'parametros': ajuste['parametros'],
+            'log_verosimilitud': log_verosimilitud,
+            'aic': 2 * num_parametros - 2 * log_verosimilitud,
+            'bic': num_parametros * math.log(len(x)) - 2 * log_verosimilitud,
+            'pruebas': pruebas_ajuste(x, distribucion.cdf, num_parametros, k, alpha)
+        })
+    
+    ajustes.sort(key=lambda a: a['aic'])
+    return ajustes
+
+
+def ejemplo_uso():
+    """Ejemplo de ajuste de distribuciones"""
+    print("=" * 70)
+    print("AJUSTE DE DISTRIBUCIONES - TecNM")
+    print("=" * 70)
+    
+    gen = GeneradorVariablesAleatorias(FuenteLCG(semilla=5735))
+    
+    print("\n1. Muestra Weibull(α=2, β=1.5) de GeneradorVariablesAleatorias (n = 10^4):")
+    muestra = [gen.weibull(2, 1.5) for _ in range(10**4)]
+    for ajuste in ajustar_distribuciones(muestra):
+        p = {nombre: r['p_valor'] for nombre, r in ajuste['pruebas'].items()}
+        parametros = ", ".join(f"{k}={v:.4f}" for k, v in ajuste['parametros'].items())
+        print(f"   {ajuste['distribucion']:<12} AIC = {ajuste['aic']:>10.1f}  ({parametros})")
+        print(f"   {'':<12} p: χ² {p['chi_cuadrada']:.3f}, K-S {p['kolmogorov_smirnov']:.3f}, "
+              f"A-D {p['anderson_darling']:.3f}, CvM {p['cramer_von_mises']:.3f}")
+    
+    print("\n2. Tiempos de proceso de una estación (normal μ=8.2, σ=1.5, n = 200):")
+    tiempos = [gen.normal(8.2, 1.5) for _ in range(200)]
+    mejor = ajustar_distribuciones(tiempos)[0]
+    print(f"   Mejor ajuste: {mejor['distribucion']} {mejor['parametros']}")
+    for nombre, r in mejor['pruebas'].items():
+        print(f"   {nombre:<20} p = {r['p_valor']:.4f}  {r['conclusion']}")
+    
+    print("\n3. Ajuste de 10^6 observaciones:")
+    datos = stats.gamma(2.5, scale=3).rvs(10**6, random_state=5735)
+    inicio = time.perf_counter()
+    ajustes = ajustar_distribuciones(datos)
+    print(f"   Tiempo (6 candidatas y 4 pruebas cada una): {time.perf_counter() - inicio:.2f} s")
+    print(f"   Mejor ajuste: {ajustes[0]['distribucion']} {ajustes[0]['parametros']}")
+    
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    ejemplo_uso()
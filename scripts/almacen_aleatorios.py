@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Almacén Binario de Números Pseudoaleatorios
+Guarda una secuencia generada en un archivo con encabezado y la vuelve a
+leer con np.memmap, sin copiarla, para reutilizarla entre ejecuciones
+"""
+
+import json
+import os
+import struct
+import tempfile
+import time
+from typing import Dict, Union
+
+import numpy as np
+
+from fuente_uniforme import FuenteLCG, FuenteUniforme
+from generador_pseudoaleatorios import GeneradorPseudoaleatorios, coeficientes_salto
+from generador_variables_aleatorias import GeneradorVariablesAleatorias
+from pruebas_estadisticas import PruebasEstadisticas
+
+
+# Formato: MAGIA (8 bytes) | versión (uint32) | longitud del encabezado
+# (uint32) | encabezado JSON | datos alineados a ALINEACION bytes
+MAGIA = b'TECNMRNG'
+VERSION_FORMATO = 1
+ALINEACION = 64
+
+DTYPES_ALMACEN = {
+    'uniforme': np.dtype('<f8'),
+    'estado': np.dtype('<u8'),
+}
+
+
+def guardar_aleatorios(ruta: str, generador: GeneradorPseudoaleatorios, n: int,
+                       metodo: str = 'congruencial_lineal', tipo: str = 'uniforme',
+                       desplazamiento: int = 0, tam_bloque: int = 2**20,
+                       **params) -> Dict:
+    """
+    Genera n números y los escribe por bloques en un archivo binario
+    
+    La secuencia guardada empieza `desplazamiento` pasos después de la
+    semilla original del generador, de modo que el encabezado (método,
+    parámetros, semilla y desplazamiento) la describe por completo. La
+    memoria usada es la de un bloque, sin importar n.
+    
+    El generador recibido no se modifica: se genera con un generador nuevo
+    que parte de su semilla original.
+    
+    Args:
+        ruta: Archivo de destino (se sobrescribe)
+        generador: Generador del que se toma la semilla original
+        n: Cantidad de números a guardar
+        metodo: Método congruencial (como en GeneradorPseudoaleatorios.iterar)
+        tipo: 'uniforme' (float64 en [0,1)) o 'estado' (enteros X(n) en uint64)
+        desplazamiento: Pasos a saltar desde la semilla original
+        tam_bloque: Números generados y escritos por bloque
+        **params: Parámetros a, c, m del método
+    
+    Returns:
+        Diccionario con el encabezado escrito
+    """
+    if tipo not in DTYPES_ALMACEN:
+        raise ValueError(f"Tipo '{tipo}' no soportado; use uno de {sorted(DTYPES_ALMACEN)}")
+    if n < 0 or desplazamiento < 0:
+        raise ValueError("La cantidad y el desplazamiento deben ser no negativos")
+    
+    if metodo not in GeneradorPseudoaleatorios.PARAMETROS_CONGRUENCIALES:
+        raise ValueError(
+            f"Método '{metodo}' no soportado; use uno de "
+            f"{sorted(GeneradorPseudoaleatorios.PARAMETROS_CONGRUENCIALES)}"
+        )
+    a, c, m = GeneradorPseudoaleatorios.PARAMETROS_CONGRUENCIALES[metodo]
+    a, c, m = params.get('a', a), params.get('c', c), params.get('m', m)
+    dtype = DTYPES_ALMACEN[tipo]
+    
+    copia = GeneradorPseudoaleatorios(generador.semilla_original, guardar_historial=False)
+    estado_inicial = copia.saltar(desplazamiento, a, c, m)
+    
+    encabezado = {
+        'metodo': metodo,
+        'parametros': {'a': a, 'c': c, 'm': m},
+        'semilla': generador.semilla_original,
+        'desplazamiento': desplazamiento,
+        'estado_inicial': estado_inicial,
+        'tipo': tipo,
+        'dtype': dtype.str,
+        'n': n
+    }
+    
+    texto = json.dumps(encabezado, ensure_ascii=False).encode('utf-8')
+    prefijo = len(MAGIA) + 8
+    relleno = -(prefijo + len(texto)) % ALINEACION
+    texto += b' ' * relleno
+    
+    with open(ruta, 'wb') as archivo:
+        archivo.write(MAGIA)
+        archivo.write(struct.pack('<II', VERSION_FORMATO, len(texto)))
+        archivo.write(texto)
+        for bloque in copia.iterar(n, metodo, tam_bloque, dtype=dtype, a=a, c=c, m=m):
+            archivo.write(memoryview(np.ascontiguousarray(bloque)))
+    
+    return encabezado
+
+
+def leer_encabezado(ruta: str) -> Dict:
+    """
+    Lee el encabezado de un almacén sin tocar los datos
+    
+    Args:
+        ruta: Archivo creado con guardar_aleatorios
+    
+    Returns:
+        Diccionario del encabezado más 'inicio_datos' (desplazamiento en bytes)
+    """
+    with open(ruta, 'rb') as archivo:
+        if archivo.read(len(MAGIA)) != MAGIA:
+            raise ValueError(f"'{ruta}' no es un almacén de números aleatorios")
+        version, longitud = struct.unpack('<II', archivo.read(8))
+        if version != VERSION_FORMATO:
+            raise ValueError(f"Versión de formato {version} no soportada")
+        encabezado = json.loads(archivo.read(longitud).decode('utf-8'))
+    
+    encabezado['inicio_datos'] = len(MAGIA) + 8 + longitud
+    return encabezado
+
+
+class AlmacenAleatorios(FuenteUniforme):
+    """
+    Lectura de un almacén mediante np.memmap
+    
+    Los datos no se cargan en memoria: el sistema operativo trae las
+    páginas bajo demanda y, en lecturas repetidas, desde su caché. El
+    objeto es una FuenteUniforme: siguiente() lee por tramos del memmap y
+    llenar(n) copia n números de una vez, así que GeneradorVariablesAleatorias
+    genera sus muestras en bloque directamente del almacén.
+    """
+    
+    def __init__(self, ruta: str):
+        """
+        Abre el almacén en modo de sólo lectura
+        
+        Args:
+            ruta: Archivo creado con guardar_aleatorios
+        """
+        self.ruta = ruta
+        self.encabezado = leer_encabezado(ruta)
+        self.datos = np.memmap(ruta, dtype=np.dtype(self.encabezado['dtype']), mode='r',
+                               offset=self.encabezado['inicio_datos'],
+                               shape=(self.encabezado['n'],))
+        self.posicion = 0
+        super().__init__(self._leer)
+    
+    def __len__(self) -> int:
+        return len(self.datos)
+    
+    def __getitem__(self, indice):
+        return self.datos[indice]
+    
+    def uniformes(self, inicio: int = 0, fin: int = None) -> np.ndarray:
+        """
+        Números uniformes en [0,1) de un tramo del almacén
+        
+        Para un almacén de tipo 'uniforme' se devuelve una vista del
+        memmap (sin copia); para uno de tipo 'estado' se calcula X(n) / m.
+        
+        Args:
+            inicio: Primer índice
+            fin: Índice final (exclusivo); None para el final del almacén
+        
+        Returns:
+            Arreglo de NumPy con los números del tramo
+        """
+        tramo = self.datos[inicio:fin]
+        if self.encabezado['tipo'] == 'uniforme':
+            return tramo
+        return tramo / np.float64(self.encabezado['parametros']['m'])
+    
+    def _leer(self, n: int) -> np.ndarray:
+        """Siguientes n números (menos si el almacén se acaba) a partir de posicion"""
+        if self.posicion >= len(self.datos):
+            raise IndexError(f"Se agotaron los {len(self.datos)} números del almacén")
+        fin = min(self.posicion + n, len(self.datos))
+        tramo = self.uniformes(self.posicion, fin)
+        self.posicion = fin
+        return tramo
+    
+    def llenar(self, destino: Union[int, np.ndarray]) -> np.ndarray:
+        """
+        Entrega varios números a la vez desde el almacén
+        
+        Args:
+            destino: Cantidad n de números, o un arreglo de flotantes que
+                     se llena completo
+        
+        Returns:
+            Arreglo con los números (el mismo destino si se pasó un arreglo)
+        """
+        n = int(destino) if isinstance(destino, (int, np.integer)) else len(destino)
+        disponibles = len(self._pendientes) + len(self.datos) - self.posicion
+        if n > disponibles:
+            raise IndexError(f"Se piden {n} números y quedan {disponibles} en el almacén")
+        return super().llenar(destino)
+    
+    def reiniciar(self, posicion: int = 0):
+        """Vuelve a leer la secuencia desde la posición indicada"""
+        self.posicion = posicion
+        self._pendientes = []
+    
+    def generador(self) -> GeneradorPseudoaleatorios:
+        """
+        Generador posicionado justo después del último número guardado,
+        para continuar la secuencia sin repetir valores
+        
+        Returns:
+            Nuevo GeneradorPseudoaleatorios
+        """
+        p = self.encabezado['parametros']
+        A, C = coeficientes_salto(p['a'], p['c'], p['m'], self.encabezado['n'])
+        generador = GeneradorPseudoaleatorios(self.encabezado['semilla'])
+        generador.semilla_actual = (A * self.encabezado['estado_inicial'] + C) % p['m']
+        return generador
+
+
+def ejemplo_uso():
+    """Ejemplo de uso del almacén de números aleatorios"""
+    print("=" * 70)
+    print("ALMACÉN BINARIO DE NÚMEROS PSEUDOALEATORIOS - TecNM")
+    print("=" * 70)
+    
+    ruta = os.path.join(tempfile.gettempdir(), 'aleatorios_5735.rng')
+    gen = GeneradorPseudoaleatorios(semilla=5735, guardar_historial=False)
+    
+    print("\n1. Guardar 10^6 números uniformes:")
+    encabezado = guardar_aleatorios(ruta, gen, 10**6, desplazamiento=1000)
+    print(f"   Archivo: {ruta} ({os.path.getsize(ruta)} bytes)")
+    print(f"   Encabezado: {encabezado}")
+    
+    print("\n2. Lectura con np.memmap:")
+    almacen = AlmacenAleatorios(ruta)
+    print(f"   Números disponibles: {len(almacen)}")
+    print(f"   Primeros 5: {[f'{u:.6f}' for u in almacen.uniformes(0, 5)]}")
+    
+    print("\n3. Pruebas estadísticas sobre los primeros 10^4 números:")
+    resultados = PruebasEstadisticas.ejecutar_todas_pruebas(almacen.uniformes(0, 10**4))
+    for nombre, resultado in resultados.items():
+        print(f"   {nombre}: {resultado['conclusion']}")
+    
+    print("\n4. Fuente uniforme para variables aleatorias:")
+    variables = GeneradorVariablesAleatorias(generador_uniforme=almacen)
+    muestra = [variables.exponencial(2.0) for _ in range(10000)]
+    print(f"   Media exponencial(λ=2): {sum(muestra) / len(muestra):.4f} (esperado 0.5)")
+    
+    print("\n5. Muestra en bloque desde el almacén (10^6 exponenciales):")
+    almacen.reiniciar()
+    tiempos = {}
+    for nombre, fuente in (('almacén', almacen), ('FuenteLCG', FuenteLCG(semilla=5735))):
+        variables = GeneradorVariablesAleatorias(generador_uniforme=fuente)
+        inicio = time.perf_counter()
+        variables.generar_muestra('exponencial', 10**6, lambd=2.0)
+        tiempos[nombre] = time.perf_counter() - inicio
+        print(f"   {nombre:<10} {tiempos[nombre]:.3f} s")
+    print(f"   Razón almacén / FuenteLCG: {tiempos['almacén'] / tiempos['FuenteLCG']:.2f}")
+    
+    print("\n6. Continuar la secuencia después del almacén:")
+    print(f"   Siguiente número: {almacen.generador().congruencial_lineal(1)[0]:.6f}")
+    
+    del almacen
+    os.remove(ruta)
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    ejemplo_uso()
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Generadores Pseudoaleatorios
+Mide números por segundo y bytes por número de cada generador en modo
+escalar y en bloque, emite JSON y compara contra una línea base
+
+Uso:
+    python benchmark_generadores.py --guardar-linea-base base.json
+    python benchmark_generadores.py --linea-base linea_base_benchmark.json
+El programa termina con código 1 si hay regresiones.
+
+linea_base_benchmark.json es la línea base de referencia (n = 10^3 a 10^7,
+sus metadatos indican la máquina). La tolerancia depende de la máquina:
+la de omisión se calibró en una máquina compartida de un núcleo, así que
+en otra máquina conviene generar una línea base propia y, si es estable,
+bajar --tolerancia. Las filas sin contraparte en la línea base se
+reportan en 'sin_linea_base'. Contra el ruido, la comparación descuenta
+la lentitud común de la corrida ('factor_maquina') y una caída de un caso
+se vuelve a medir antes de reportarla (CONFIRMACIONES).
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from generador_pseudoaleatorios import GeneradorPseudoaleatorios
+from generadores_modernos import MRG32k3a, PCG64, Xoshiro256SS
+
+
+# Tiempo mínimo de cada medición; con n pequeño se repite la llamada
+TIEMPO_MINIMO = 0.2
+
+# Repeticiones por medición (se toma la mejor) y caída relativa permitida
+REPETICIONES = 5
+TOLERANCIA = 0.25
+
+# Una caída de rendimiento sólo se reporta si persiste al volver a medir el
+# caso esta cantidad de veces: entre corridas idénticas se observaron caídas
+# aisladas de ~30 % que no aparecen en el ruido interno de cada corrida
+CONFIRMACIONES = 2
+
+# Al liberar un bloque obtenido con mmap, glibc sube su umbral de mmap hasta
+# 32 MiB; antes de eso los arreglos medianos (p. ej. 10^5 flotantes) se
+# piden y devuelven al sistema en cada llamada y el mismo caso llega a medir
+# 2.5 veces más lento según lo que se midió antes. Se reserva y libera un
+# bloque de este tamaño para medir siempre en el mismo estado.
+BYTES_CALENTAMIENTO = 32 * 2**20 - 8192
+
+# Exponentes por omisión: n = 10^3 a 10^7, los de la línea base
+EXPONENTES = range(3, 8)
+
+# Casos registrados: nombre -> {modo: fábrica}. Cada fábrica recibe una
+# semilla y devuelve una función f(n) que genera n números.
+CASOS: Dict[str, Dict[str, Callable[[int], Callable[[int], object]]]] = {}
+
+
+def registrar_caso(nombre: str, modo: str, fabrica: Callable[[int], Callable[[int], object]]):
+    """
+    Agrega un generador al benchmark
+    
+    Args:
+        nombre: Nombre del caso (p. ej. 'congruencial_lineal')
+        modo: 'escalar' o 'bloque'
+        fabrica: Función semilla -> f(n), donde f genera n números
+    """
+    CASOS.setdefault(nombre, {})[modo] = fabrica
+
+
+def _generador(semilla: int) -> GeneradorPseudoaleatorios:
+    return GeneradorPseudoaleatorios(semilla, guardar_historial=False,
+                                     calcular_estadisticas=False)
+
+
+def _escalar_moderno(clase, semilla: int) -> Callable[[int], List[float]]:
+    """Ciclo de Python con siguiente(), como lo usa un simulador"""
+    gen = clase(semilla, guardar_historial=False, calcular_estadisticas=False)
+    return lambda n: [gen.siguiente() for _ in range(n)]
+
+
+registrar_caso('cuadrados_medios', 'escalar',
+               lambda s: _generador(s).cuadrados_medios)
+for _metodo in GeneradorPseudoaleatorios.PARAMETROS_CONGRUENCIALES:
+    registrar_caso(_metodo, 'escalar',
+                   lambda s, m=_metodo: getattr(_generador(s), m))
+    registrar_caso(_metodo, 'bloque',
+                   lambda s, m=_metodo: getattr(_generador(s), m + '_bloque'))
+for _clase in (PCG64, Xoshiro256SS, MRG32k3a):
+    registrar_caso(_clase.__name__, 'escalar',
+                   lambda s, c=_clase: _escalar_moderno(c, s))
+    registrar_caso(_clase.__name__, 'bloque',
+                   lambda s, c=_clase: c(s, guardar_historial=False,
+                                         calcular_estadisticas=False).generar_bloque)
+
+
+def medir_caso(fabrica: Callable, n: int, repeticiones: int = REPETICIONES,
+               memoria: bool = True, semilla: int = 12345) -> Dict:
+    """
+    Mide un caso para un tamaño n
+    
+    El tiempo es el mejor de varias repeticiones; cada repetición agrupa
+    suficientes llamadas para durar al menos TIEMPO_MINIMO, y la distancia
+    relativa de la mediana al mejor se reporta como 'ruido' (informativo).
+    La memoria se
+    mide aparte con tracemalloc (que registra también los arreglos de
+    NumPy), para que su costo no afecte el tiempo. Antes de medir se fija
+    el umbral de mmap del asignador (BYTES_CALENTAMIENTO).
+    
+    Args:
+        fabrica: Fábrica registrada del caso
+        n: Números por llamada
+        repeticiones: Repeticiones de la medición de tiempo
+        memoria: Si es False, no se mide la memoria
+        semilla: Semilla del generador
+    
+    Returns:
+        Diccionario con segundos por llamada, números por segundo, ruido
+        relativo y bytes por número (pico de memoria entre n)
+    """
+    np.empty(BYTES_CALENTAMIENTO, dtype=np.uint8)
+    funcion = fabrica(semilla)
+    inicio = time.perf_counter()
+    funcion(n)
+    llamadas = max(1, math.ceil(TIEMPO_MINIMO / max(time.perf_counter() - inicio, 1e-9)))
+    
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for _ in range(llamadas):
+            funcion(n)
+        tiempos.append((time.perf_counter() - inicio) / llamadas)
+    mejor = min(tiempos)
+    
+    resultado = {
+        'segundos': mejor,
+        'numeros_por_segundo': n / mejor,
+        'ruido': statistics.median(tiempos) / mejor - 1,
+        'bytes_por_numero': None
+    }
+    
+    if memoria:
+        funcion = fabrica(semilla)
+        tracemalloc.start()
+        try:
+            funcion(n)
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        resultado['bytes_por_numero'] = pico / n
+    
+    return resultado
+
+
+def ejecutar_benchmark(casos: List[str] = None, modos: List[str] = ('escalar', 'bloque'),
+                       exponentes: List[int] = EXPONENTES, maximo_escalar: int = 10**6,
+                       repeticiones: int = REPETICIONES, memoria: bool = True,
+                       progreso: bool = False) -> Dict:
+    """
+    Ejecuta el benchmark completo
+    
+    Args:
+        casos: Nombres de los casos (None = todos los registrados)
+        modos: Modos a medir
+        exponentes: Se mide n = 10^e para cada exponente
+        maximo_escalar: n máximo en modo escalar (un ciclo de Python con
+                        10^8 números tarda minutos)
+        repeticiones: Repeticiones por medición
+        memoria: Si es False, no se mide la memoria
+        progreso: Imprime cada medición en stderr
+    
+    Returns:
+        Diccionario con 'metadatos' y la lista 'resultados'
+    """
+    casos = list(CASOS) if casos is None else casos
+    desconocidos = set(casos) - set(CASOS)
+    if desconocidos:
+        raise ValueError(f"Casos no registrados: {sorted(desconocidos)}")
+    
+    resultados = []
+    for nombre in casos:
+        for modo in modos:
+            if modo not in CASOS[nombre]:
+                continue
+            for e in exponentes:
+                n = 10 ** e
+                if modo == 'escalar' and n > maximo_escalar:
+                    continue
+                medicion = medir_caso(CASOS[nombre][modo], n, repeticiones, memoria)
+                resultados.append({'caso': nombre, 'modo': modo, 'n': n, **medicion})
+                if progreso:
+                    print(f"{nombre:<28}{modo:<9}n=10^{e}  "
+                          f"{medicion['numeros_por_segundo']:>14,.0f} números/s", file=sys.stderr)
+    
+    return {
+        'metadatos': {
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'plataforma': platform.platform(),
+            'procesador': platform.processor() or platform.machine(),
+            'repeticiones': repeticiones
+        },
+        'resultados': resultados
+    }
+
+
+def factor_maquina(actual: Dict, base: Dict) -> float:
+    """
+    Velocidad de la máquina respecto a la línea base: mediana de las razones
+    de números por segundo de las mediciones comunes (a lo más 1)
+    
+    En máquinas compartidas toda una corrida puede ser 25 % más lenta que
+    otra con el mismo código; ese factor común se descuenta al comparar.
+    
+    Args:
+        actual: Resultado de ejecutar_benchmark
+        base: Resultado guardado previamente
+    
+    Returns:
+        Factor en (0, 1]
+    """
+    referencia = {(r['caso'], r['modo'], r['n']): r for r in base['resultados']}
+    razones = [r['numeros_por_segundo'] / referencia[clave]['numeros_por_segundo']
+               for r in actual['resultados']
+               for clave in [(r['caso'], r['modo'], r['n'])] if clave in referencia]
+    return min(1.0, statistics.median(razones)) if razones else 1.0
+
+
+def comparar_con_linea_base(actual: Dict, base: Dict,
+                            tolerancia: float = TOLERANCIA) -> List[Dict]:
+    """
+    Busca regresiones respecto a una línea base
+    
+    Se compara cada (caso, modo, n) presente en ambas mediciones. Hay
+    regresión si el rendimiento cae más de la tolerancia (descontado el
+    factor_maquina de la corrida) o si los bytes por número crecen más de
+    la tolerancia. Una caída uniforme de todos los casos se atribuye a la
+    máquina y se reporta sólo como factor_maquina.
+    
+    Args:
+        actual: Resultado de ejecutar_benchmark
+        base: Resultado guardado previamente
+        tolerancia: Cambio relativo permitido (0.25 = 25 %)
+    
+    Returns:
+        Lista de regresiones (vacía si no hay)
+    """
+    referencia = {(r['caso'], r['modo'], r['n']): r for r in base['resultados']}
+    factor = factor_maquina(actual, base)
+    regresiones = []
+    for r in actual['resultados']:
+        b = referencia.get((r['caso'], r['modo'], r['n']))
+        if b is None:
+            continue
+        razon = r['numeros_por_segundo'] / b['numeros_por_segundo']
+        if razon < (1 - tolerancia) * factor:
+            regresiones.append({'caso': r['caso'], 'modo': r['modo'], 'n': r['n'],
+                                'metrica': 'numeros_por_segundo',
+                                'base': b['numeros_por_segundo'],
+                                'actual': r['numeros_por_segundo'], 'razon': razon,
+                                'factor_maquina': factor})
+        if r.get('bytes_por_numero') and b.get('bytes_por_numero'):
+            razon = r['bytes_por_numero'] / b['bytes_por_numero']
+            if razon > 1 + tolerancia:
+                regresiones.append({'caso': r['caso'], 'modo': r['modo'], 'n': r['n'],
+                                    'metrica': 'bytes_por_numero',
+                                    'base': b['bytes_por_numero'],
+                                    'actual': r['bytes_por_numero'], 'razon': razon})
+    return regresiones
+
+
+def confirmar_regresiones(regresiones: List[Dict], base: Dict,
+                          tolerancia: float = TOLERANCIA,
+                          repeticiones: int = REPETICIONES) -> List[Dict]:
+    """
+    Vuelve a medir los casos con caída de rendimiento y descarta las
+    transitorias
+    
+    Una regresión de numeros_por_segundo se conserva sólo si ninguna de
+    CONFIRMACIONES mediciones nuevas queda dentro de la tolerancia (con el
+    mismo factor_maquina de la comparación); las de bytes
+    por número no dependen del ruido y se conservan sin volver a medir.
+    
+    Args:
+        regresiones: Resultado de comparar_con_linea_base
+        base: Línea base usada en la comparación
+        tolerancia: Cambio relativo permitido
+        repeticiones: Repeticiones por medición
+    
+    Returns:
+        Lista de regresiones confirmadas
+    """
+    referencia = {(r['caso'], r['modo'], r['n']): r for r in base['resultados']}
+    confirmadas = []
+    for r in regresiones:
+        if r['metrica'] != 'numeros_por_segundo':
+            confirmadas.append(r)
+            continue
+        b = referencia[(r['caso'], r['modo'], r['n'])]
+        for _ in range(CONFIRMACIONES):
+            medicion = medir_caso(CASOS[r['caso']][r['modo']], r['n'], repeticiones,
+                                  memoria=False)
+            minimo = (1 - tolerancia) * r['factor_maquina'] * b['numeros_por_segundo']
+            if medicion['numeros_por_segundo'] >= minimo:
+                break
+        else:
+            confirmadas.append(r)
+    return confirmadas
+
+
+def filas_sin_linea_base(actual: Dict, base: Dict) -> List[Dict]:
+    """
+    Mediciones de actual sin (caso, modo, n) correspondiente en la línea base
+    
+    Args:
+        actual: Resultado de ejecutar_benchmark
+        base: Resultado guardado previamente
+    
+    Returns:
+        Lista de {'caso', 'modo', 'n'} que no se compararon
+    """
+    referencia = {(r['caso'], r['modo'], r['n']) for r in base['resultados']}
+    return [{'caso': r['caso'], 'modo': r['modo'], 'n': r['n']}
+            for r in actual['resultados']
+            if (r['caso'], r['modo'], r['n']) not in referencia]
+
+
+def main(argumentos: List[str] = None) -> int:
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark de los generadores pseudoaleatorios (TecNM)")
+    parser.add_argument('--casos', nargs='+', choices=sorted(CASOS),
+                        help="Casos a medir (por omisión, todos)")
+    parser.add_argument('--modos', nargs='+', choices=['escalar', 'bloque'],
+                        default=['escalar', 'bloque'])
+    parser.add_argument('--exponentes', nargs='+', type=int, default=list(EXPONENTES),
+                        help="Tamaños n = 10^e (por omisión 3 a 7)")
+    parser.add_argument('--maximo-escalar', type=float, default=1e6,
+                        help="n máximo en modo escalar")
+    parser.add_argument('--repeticiones', type=int, default=REPETICIONES)
+    parser.add_argument('--sin-memoria', action='store_true',
+                        help="No medir bytes por número")
+    parser.add_argument('--salida', help="Archivo JSON de resultados (por omisión, stdout)")
+    parser.add_argument('--linea-base', help="Archivo JSON contra el cual comparar")
+    parser.add_argument('--guardar-linea-base', help="Guarda los resultados como línea base")
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA,
+                        help="Regresión relativa permitida (0.25 = 25 %%; depende "
+                             "de la máquina)")
+    args = parser.parse_args(argumentos)
+    
+    resultado = ejecutar_benchmark(args.casos, args.modos, args.exponentes,
+                                   int(args.maximo_escalar), args.repeticiones,
+                                   not args.sin_memoria, progreso=True)
+    
+    if args.guardar_linea_base:
+        with open(args.guardar_linea_base, 'w', encoding='utf-8') as archivo:
+            json.dump(resultado, archivo, indent=2, ensure_ascii=False)
+    
+    codigo = 0
+    if args.linea_base:
+        with open(args.linea_base, encoding='utf-8') as archivo:
+            base = json.load(archivo)
+        regresiones = confirmar_regresiones(
+            comparar_con_linea_base(resultado, base, args.tolerancia), base,
+            args.tolerancia, args.repeticiones)
+        resultado['regresiones'] = regresiones
+        resultado['factor_maquina'] = factor_maquina(resultado, base)
+        resultado['sin_linea_base'] = filas_sin_linea_base(resultado, base)
+        for r in resultado['sin_linea_base']:
+            print(f"SIN LÍNEA BASE {r['caso']} ({r['modo']}, n={r['n']}): no se comparó",
+                  file=sys.stderr)
+        for r in regresiones:
+            print(f"REGRESIÓN {r['caso']} ({r['modo']}, n={r['n']}): {r['metrica']} "
+                  f"{r['base']:.4g} -> {r['actual']:.4g}", file=sys.stderr)
+        codigo = 1 if regresiones else 0
+    
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as archivo:
+            archivo.write(texto)
+    else:
+        print(texto)
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Fuente Uniforme Común
+Protocolo único para los números U(0,1) que consumen las variables
+aleatorias, los simuladores y las pruebas: siguiente() escalar y
+llenar(n) en bloque, con un buffer interno que amortiza las llamadas
+"""
+
+import time
+from typing import Callable, Union
+
+import numpy as np
+
+from generador_pseudoaleatorios import coeficientes_salto, estados_lcg
+from periodo_lcg import longitud_sin_repeticion
+
+
+class FuenteUniforme:
+    """
+    Fuente de números uniformes en [0,1) con buffer de recarga
+    
+    El productor genera bloques con NumPy; siguiente() entrega los números
+    uno por uno desde el buffer y llenar(n) los entrega en bloque. Ambos
+    caminos leen la misma secuencia en el mismo orden, así que pueden
+    mezclarse libremente.
+    """
+    
+    # Números producidos por cada recarga del buffer
+    TAM_BUFFER = 4096
+    
+    def __init__(self, productor: Callable[[int], np.ndarray], tam_buffer: int = None):
+        """
+        Inicializa la fuente
+        
+        Args:
+            productor: Función que recibe n y devuelve n uniformes en un arreglo
+            tam_buffer: Números por recarga (None usa TAM_BUFFER)
+        """
+        self.productor = productor
+        self.tam_buffer = tam_buffer or self.TAM_BUFFER
+        self._pendientes = []
+    
+    def siguiente(self) -> float:
+        """
+        Siguiente número uniforme
+        
+        Returns:
+            Número en [0,1)
+        """
+        if not self._pendientes:
+            # Invertido para que pop() entregue los números en orden
+            self._pendientes = self.productor(self.tam_buffer)[::-1].tolist()
+        return self._pendientes.pop()
+    
+    __call__ = siguiente
+    
+    def llenar(self, destino: Union[int, np.ndarray]) -> np.ndarray:
+        """
+        Entrega varios números a la vez
+        
+        Args:
+            destino: Cantidad n de números, o un arreglo de flotantes que
+                     se llena completo
+        
+        Returns:
+            Arreglo con los números (el mismo destino si se pasó un arreglo)
+        """
+        if isinstance(destino, (int, np.integer)):
+            destino = np.empty(int(destino), dtype=np.float64)
+        n = len(destino)
+        
+        # Primero los que ya están en el buffer, para conservar el orden
+        usados = min(n, len(self._pendientes))
+        if usados:
+            destino[:usados] = self._pendientes[:-usados - 1:-1]
+            del self._pendientes[-usados:]
+        if n > usados:
+            destino[usados:] = self.productor(n - usados)
+        return destino
+    
+    def saltar(self, k: int):
+        """
+        Descarta los siguientes k números (en O(k); las subclases que
+        conocen su estado lo hacen en O(log k))
+        
+        Args:
+            k: Cantidad de números a descartar
+        """
+        while k > 0:
+            tam = min(k, 2**20)
+            self.llenar(tam)
+            k -= tam
+
+
+class FuenteFuncion(FuenteUniforme):
+    """
+    Adaptador de una función escalar (p. ej. PCG64(s).siguiente) al protocolo
+    
+    No se adelantan números: siguiente() llama a la función en cada
+    extracción, de modo que la secuencia no cambia si la función también
+    se usa en otra parte.
+    """
+    
+    def __init__(self, funcion: Callable[[], float]):
+        super().__init__(lambda n: np.fromiter((funcion() for _ in range(n)),
+                                               dtype=np.float64, count=n))
+        self.funcion = funcion
+    
+    def siguiente(self) -> float:
+        return self.funcion()
+    
+    __call__ = siguiente
+
+
+class FuenteLCG(FuenteUniforme):
+    """
+    Fuente basada en el congruencial X(n+1) = (a X(n) + c) mod m
+    
+    Entrega X(1)/m, X(2)/m, ... igual que el congruencial escalar, pero los
+    bloques se generan con estados_lcg. Con m <= 2^53 los números coinciden
+    exactamente con los del cálculo escalar.
+    """
+    
+    def __init__(self, semilla: int = 1234, a: int = 1103515245, c: int = 12345,
+                 m: int = 2**31, tam_buffer: int = None):
+        """
+        Inicializa la fuente
+        
+        Args:
+            semilla: Estado inicial X(0)
+            a: Multiplicador
+            c: Incremento
+            m: Módulo
+            tam_buffer: Números por recarga del buffer
+        """
+        super().__init__(self._producir, tam_buffer)
+        self.semilla = semilla
+        self.a, self.c, self.m = a, c, m
+        self.x = semilla % m
+    
+    def _producir(self, n: int) -> np.ndarray:
+        estados = estados_lcg(self.x, n, self.a, self.c, self.m)
+        if n > 0:
+            self.x = int(estados[-1])
+        return estados / np.float64(self.m)
+    
+    def saltar(self, k: int):
+        """
+        Avanza k números en O(log k), descontando los que están en el buffer
+        
+        Args:
+            k: Cantidad de números a saltar
+        """
+        if k < 0:
+            raise ValueError("El salto debe ser no negativo")
+        usados = min(k, len(self._pendientes))
+        if usados:
+            del self._pendientes[-usados:]
+        A, C = coeficientes_salto(self.a, self.c, self.m, k - usados)
+        self.x = (A * self.x + C) % self.m
+    
+    def subflujo(self, i: int, longitud: int = 2**20) -> 'FuenteLCG':
+        """
+        Fuente que empieza i * longitud números después de la semilla
+        
+        Args:
+            i: Índice del subflujo
+            longitud: Cantidad de números garantizada por subflujo
+        
+        Returns:
+            Nueva fuente posicionada al inicio del subflujo
+        """
+        if i < 0 or longitud <= 0:
+            raise ValueError("Índice o longitud de subflujo inválidos")
+        disponible = longitud_sin_repeticion(self.a, self.c, self.m, self.semilla % self.m)
+        if (i + 1) * longitud > disponible:
+            raise ValueError(
+                f"El subflujo {i} de longitud {longitud} excede los {disponible} "
+                f"números sin repetición de la semilla"
+            )
+        A, C = coeficientes_salto(self.a, self.c, self.m, i * longitud)
+        return FuenteLCG((A * self.semilla + C) % self.m, self.a, self.c, self.m,
+                         self.tam_buffer)
+
+
+def como_fuente(generador) -> FuenteUniforme:
+    """
+    Convierte cualquier generador uniforme al protocolo común
+    
+    Args:
+        generador: FuenteUniforme, objeto con generar_bloque(n) (como los
+                   generadores modernos) o función sin argumentos
+    
+    Returns:
+        Fuente uniforme equivalente
+    """
+    if isinstance(generador, FuenteUniforme):
+        return generador
+    if hasattr(generador, 'generar_bloque'):
+        return FuenteUniforme(generador.generar_bloque)
+    if callable(generador):
+        return FuenteFuncion(generador)
+    raise TypeError(f"{type(generador).__name__} no es una fuente de números uniformes")
+
+
+def ejemplo_uso():
+    """Ejemplo de uso de la fuente uniforme"""
+    print("=" * 70)
+    print("FUENTE UNIFORME COMÚN - TecNM")
+    print("=" * 70)
+    
+    fuente = FuenteLCG(semilla=5735)
+    print("\n1. Extracciones escalares y en bloque de la misma secuencia:")
+    print(f"   siguiente(): {[round(fuente.siguiente(), 6) for _ in range(3)]}")
+    print(f"   llenar(3):   {[round(u, 6) for u in fuente.llenar(3).tolist()]}")
+    
+    print("\n2. Costo por número (10^6 extracciones):")
+    a, c, m = 1103515245, 12345, 2**31
+    x = 5735
+    inicio = time.perf_counter()
+    for _ in range(10**6):
+        x = (a * x + c) % m
+        u = x / m
+    print(f"   Congruencial en Python puro: {time.perf_counter() - inicio:.3f} s")
+    
+    fuente = FuenteLCG(semilla=5735)
+    inicio = time.perf_counter()
+    for _ in range(10**6):
+        u = fuente.siguiente()
+    print(f"   FuenteLCG.siguiente():       {time.perf_counter() - inicio:.3f} s")
+    
+    inicio = time.perf_counter()
+    fuente.llenar(10**6)
+    print(f"   FuenteLCG.llenar(10^6):      {time.perf_counter() - inicio:.3f} s")
+    
+    print("\n3. Subflujos disjuntos para réplicas:")
+    for i in range(3):
+        print(f"   Réplica {i}: {fuente.subflujo(i).siguiente():.6f}")
+    
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    ejemplo_uso()
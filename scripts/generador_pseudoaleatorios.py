@@ -5,22 +5,329 @@ Implementa varios métodos de generación para la materia de Simulación - TecNM
 """
 
 import math
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+def coeficientes_salto(a: int, c: int, m: int, k: int) -> Tuple[int, int]:
+    """
+    Coeficientes del salto de k pasos de un generador congruencial
+    X(n+k) = (A * X(n) + C) mod m
+    
+    Se obtienen por exponenciación binaria de la transformación afín
+    x -> (a * x + c) mod m, por lo que el costo es O(log k).
+    
+    Args:
+        a: Multiplicador
+        c: Incremento
+        m: Módulo
+        k: Número de pasos
+    
+    Returns:
+        Tupla (A, C) con A = a^k mod m y C = c(a^(k-1) + ... + a + 1) mod m
+    """
+    A, C = 1 % m, 0
+    a_pot, c_pot = a % m, c % m
+    
+    while k > 0:
+        if k & 1:
+            A = (a_pot * A) % m
+            C = (a_pot * C + c_pot) % m
+        # Componer la transformación consigo misma (duplicar el salto)
+        c_pot = (a_pot * c_pot + c_pot) % m
+        a_pot = (a_pot * a_pot) % m
+        k >>= 1
+    
+    return A, C
+
+
+def estados_lcg(x0: int, n: int, a: int, c: int, m: int) -> np.ndarray:
+    """
+    Genera los estados X(1), ..., X(n) de un congruencial en bloque
+    
+    El bloque se organiza en L carriles: la primera fila se calcula con el
+    método escalar y cada fila siguiente avanza todos los carriles L pasos
+    a la vez con los coeficientes precalculados (a^L, C_L). La secuencia
+    resultante es idéntica a la del método escalar.
+    
+    Args:
+        x0: Estado inicial (semilla)
+        n: Cantidad de estados a generar
+        a: Multiplicador
+        c: Incremento
+        m: Módulo (m <= 2^64)
+    
+    Returns:
+        Arreglo uint64 con los n estados
+    """
+    if m > 2**64:
+        raise ValueError("El modo en bloque requiere m <= 2^64")
+    
+    potencia_dos = m & (m - 1) == 0
+    if n <= 0:
+        return np.empty(0, dtype=np.uint64)
+    
+    if not potencia_dos and m > 2**32:
+        # El producto a * x no cabe en 64 bits: recorrido escalar
+        estados = np.empty(n, dtype=np.uint64)
+        x = x0
+        for i in range(n):
+            x = (a * x + c) % m
+            estados[i] = x
+        return estados
+    
+    carriles = min(n, max(64, math.isqrt(n)))
+    filas = -(-n // carriles)
+    estados = np.empty((filas, carriles), dtype=np.uint64)
+    
+    # Primera fila: X(1), ..., X(L)
+    x = x0
+    for j in range(carriles):
+        x = (a * x + c) % m
+        estados[0, j] = x
+    
+    A, C = coeficientes_salto(a, c, m, carriles)
+    A, C = np.uint64(A), np.uint64(C)
+    mascara = np.uint64((m - 1) & (2**64 - 1))
+    
+    for i in range(1, filas):
+        fila = estados[i]
+        np.multiply(estados[i - 1], A, out=fila)
+        fila += C
+        if potencia_dos:
+            if m < 2**64:
+                fila &= mascara
+        else:
+            fila %= np.uint64(m)
+    
+    return estados.reshape(-1)[:n]
+
+
+def paso_cuadrados_medios(estados: np.ndarray, digitos: int = 4) -> np.ndarray:
+    """
+    Aplica una iteración de Cuadrados Medios a muchos estados a la vez
+    
+    Sólo usa aritmética entera: para x < 10^d el cuadrado tiene (con ceros
+    a la izquierda) 2d dígitos y los d centrales son
+    (x^2 // 10^(d - d//2)) mod 10^d.
+    
+    Args:
+        estados: Arreglo de enteros en [0, 10^digitos)
+        digitos: Número de dígitos de la semilla (hasta 9)
+    
+    Returns:
+        Arreglo int64 con el estado siguiente de cada elemento
+    """
+    if digitos > 9:
+        raise ValueError("El paso vectorizado admite a lo más 9 dígitos")
+    
+    x = np.asarray(estados, dtype=np.int64)
+    return (x * x // 10 ** (digitos - digitos // 2)) % 10 ** digitos
+
+
+class AcumuladorEstadisticas:
+    """
+    Estadísticas en línea (Welford) combinables entre procesos (Chan/Pébay)
+    
+    Mantiene conteo, media, momentos centrales M2, M3, M4, mínimo y máximo
+    sin conservar los datos, y puede unirse con acumuladores parciales
+    calculados en otros procesos.
+    """
+    
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+    
+    def agregar(self, x: float):
+        """
+        Incorpora un solo valor (actualización de Welford)
+        
+        Args:
+            x: Valor observado
+        """
+        x = float(x)
+        n1 = self.n
+        self.n += 1
+        n = self.n
+        delta = x - self.media
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        termino = delta * delta_n * n1
+        
+        self.media += delta_n
+        self.m4 += (termino * delta_n2 * (n * n - 3 * n + 3)
+                    + 6 * delta_n2 * self.m2 - 4 * delta_n * self.m3)
+        self.m3 += termino * delta_n * (n - 2) - 3 * delta_n * self.m2
+        self.m2 += termino
+        self.minimo = min(self.minimo, x)
+        self.maximo = max(self.maximo, x)
+    
+    def actualizar(self, valores) -> 'AcumuladorEstadisticas':
+        """
+        Incorpora un bloque de valores
+        
+        Calcula los momentos del bloque con NumPy y los une a los actuales.
+        
+        Args:
+            valores: Secuencia o arreglo de valores
+        
+        Returns:
+            El mismo acumulador (para encadenar llamadas)
+        """
+        x = np.asarray(valores, dtype=np.float64).reshape(-1)
+        if len(x) == 0:
+            return self
+        
+        bloque = AcumuladorEstadisticas()
+        bloque.n = len(x)
+        bloque.media = float(x.mean())
+        d = x - bloque.media
+        d2 = d * d
+        bloque.m2 = float(d2.sum())
+        bloque.m3 = float(np.dot(d2, d))
+        bloque.m4 = float(np.dot(d2, d2))
+        bloque.minimo = float(x.min())
+        bloque.maximo = float(x.max())
+        
+        return self.combinar(bloque)
+    
+    def combinar(self, otro: 'AcumuladorEstadisticas') -> 'AcumuladorEstadisticas':
+        """
+        Une las estadísticas de otro acumulador a este
+        
+        Args:
+            otro: Acumulador con resultados parciales (p. ej. de otro proceso)
+        
+        Returns:
+            El mismo acumulador (para encadenar llamadas)
+        """
+        if otro.n == 0:
+            return self
+        if self.n == 0:
+            self.__dict__.update(otro.__dict__)
+            return self
+        
+        na, nb = self.n, otro.n
+        n = na + nb
+        delta = otro.media - self.media
+        delta2 = delta * delta
+        
+        m2 = self.m2 + otro.m2 + delta2 * na * nb / n
+        m3 = (self.m3 + otro.m3
+              + delta * delta2 * na * nb * (na - nb) / (n * n)
+              + 3 * delta * (na * otro.m2 - nb * self.m2) / n)
+        m4 = (self.m4 + otro.m4
+              + delta2 * delta2 * na * nb * (na * na - na * nb + nb * nb) / (n ** 3)
+              + 6 * delta2 * (na * na * otro.m2 + nb * nb * self.m2) / (n * n)
+              + 4 * delta * (na * otro.m3 - nb * self.m3) / n)
+        
+        self.media += delta * nb / n
+        self.n, self.m2, self.m3, self.m4 = n, m2, m3, m4
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        return self
+    
+    @classmethod
+    def unir(cls, acumuladores) -> 'AcumuladorEstadisticas':
+        """
+        Une varios acumuladores parciales en uno nuevo
+        
+        Args:
+            acumuladores: Iterable de acumuladores
+        
+        Returns:
+            Acumulador con las estadísticas combinadas
+        """
+        total = cls()
+        for acumulador in acumuladores:
+            total.combinar(acumulador)
+        return total
+    
+    def resultado(self) -> dict:
+        """
+        Estadísticas acumuladas
+        
+        Returns:
+            Diccionario con cantidad, media, varianza, desviación estándar,
+            mínimo, máximo, asimetría y curtosis (exceso)
+        """
+        if self.n == 0:
+            return {}
+        
+        varianza = self.m2 / self.n
+        if self.m2 > 0:
+            asimetria = math.sqrt(self.n) * self.m3 / self.m2 ** 1.5
+            curtosis = self.n * self.m4 / (self.m2 * self.m2) - 3
+        else:
+            asimetria = curtosis = 0.0
+        
+        return {
+            'cantidad': self.n,
+            'media': self.media,
+            'varianza': varianza,
+            'desviacion_estandar': math.sqrt(varianza),
+            'minimo': self.minimo,
+            'maximo': self.maximo,
+            'asimetria': asimetria,
+            'curtosis': curtosis
+        }
 
 
 class GeneradorPseudoaleatorios:
     """Clase para generar números pseudoaleatorios usando diferentes métodos"""
     
-    def __init__(self, semilla: int = 1234):
+    # Parámetros (a, c, m) por omisión de los métodos congruenciales
+    PARAMETROS_CONGRUENCIALES = {
+        'congruencial_lineal': (1103515245, 12345, 2**31),
+        'congruencial_multiplicativo': (16807, 0, 2147483647),
+        'congruencial_mixto': (1664525, 1013904223, 2**32),
+    }
+    
+    # Tamaño de bloque por omisión para el modo de flujo
+    TAM_BLOQUE = 2**16
+    
+    def __init__(self, semilla: int = 1234, guardar_historial: bool = True,
+                 calcular_estadisticas: bool = False):
         """
         Inicializa el generador con una semilla
         
         Args:
             semilla: Valor inicial para la generación
+            guardar_historial: Si es False, los números generados no se
+                               conservan en numeros_generados
+            calcular_estadisticas: Si es True, las estadísticas se actualizan
+                                   en línea al generar (incluso sin historial);
+                                   si es False, obtener_estadisticas las
+                                   calcula del historial
         """
         self.semilla_original = semilla
         self.semilla_actual = semilla
+        self.guardar_historial = guardar_historial
+        self.calcular_estadisticas = calcular_estadisticas
         self.numeros_generados = []
+        self.estadisticas = AcumuladorEstadisticas()
+    
+    def _registrar(self, numeros, acumular: bool = False):
+        """
+        Conserva los números generados si el historial está activo y
+        actualiza las estadísticas en línea
+        
+        Args:
+            numeros: Números del lote o bloque recién generado
+            acumular: Si es False, el bloque inicia un lote nuevo
+        """
+        if self.guardar_historial and not acumular:
+            self.numeros_generados = numeros
+        if self.calcular_estadisticas:
+            if not acumular:
+                self.estadisticas = AcumuladorEstadisticas()
+            self.estadisticas.actualizar(numeros)
     
     def cuadrados_medios(self, n: int, digitos: int = 4) -> List[float]:
         """
@@ -35,23 +342,31 @@ class GeneradorPseudoaleatorios:
         """
         numeros = []
         x = self.semilla_actual
+        modulo = 10 ** digitos
+        # Dígitos a descartar a la derecha: el cuadrado tiene 2*digitos
+        # dígitos (con ceros a la izquierda) y se toman los del medio
+        divisor = 10 ** (digitos - digitos // 2)
         
         for _ in range(n):
             # Elevar al cuadrado
             cuadrado = x ** 2
             
-            # Convertir a string y rellenar con ceros
-            str_cuadrado = str(cuadrado).zfill(digitos * 2)
-            
-            # Extraer dígitos del medio
-            inicio = (len(str_cuadrado) - digitos) // 2
-            x = int(str_cuadrado[inicio:inicio + digitos])
+            # Extraer dígitos del medio con aritmética entera
+            if x < modulo:
+                x = (cuadrado // divisor) % modulo
+            else:
+                # Semilla con más dígitos: el cuadrado es más largo
+                longitud = 2 * digitos
+                while cuadrado >= 10 ** longitud:
+                    longitud += 1
+                inicio = (longitud - digitos) // 2
+                x = (cuadrado // 10 ** (longitud - inicio - digitos)) % modulo
             
             # Normalizar a [0,1]
-            r = x / (10 ** digitos)
+            r = x / modulo
             numeros.append(r)
         
-        self.numeros_generados = numeros
+        self._registrar(numeros)
         return numeros
     
     def congruencial_lineal(self, n: int, a: int = 1103515245, 
@@ -78,7 +393,7 @@ class GeneradorPseudoaleatorios:
             numeros.append(r)
         
         self.semilla_actual = x
-        self.numeros_generados = numeros
+        self._registrar(numeros)
         return numeros
     
     def congruencial_multiplicativo(self, n: int, a: int = 16807, 
@@ -104,7 +419,7 @@ class GeneradorPseudoaleatorios:
             numeros.append(r)
         
         self.semilla_actual = x
-        self.numeros_generados = numeros
+        self._registrar(numeros)
         return numeros
     
     def congruencial_mixto(self, n: int, a: int = 1664525, 
@@ -123,33 +438,255 @@ class GeneradorPseudoaleatorios:
         """
         return self.congruencial_lineal(n, a, c, m)
     
+    # ========== MODO EN BLOQUE (NumPy) ==========
+    
+    def congruencial_lineal_bloque(self, n: int, a: int = 1103515245,
+                                   c: int = 12345, m: int = 2**31,
+                                   dtype=np.float64) -> np.ndarray:
+        """
+        Método Congruencial Lineal en bloque
+        Produce la misma secuencia que congruencial_lineal, pero vectorizada
+        (coincidencia exacta de los flotantes para m <= 2^53)
+        
+        Args:
+            n: Cantidad de números a generar
+            a: Multiplicador
+            c: Incremento
+            m: Módulo
+            dtype: Tipo del arreglo resultante. Si es entero se devuelven
+                   los estados X(n); si es flotante, X(n) / m
+        
+        Returns:
+            Arreglo de NumPy con los números generados
+        """
+        estados = self._estados_bloque(n, a, c, m)
+        
+        if np.issubdtype(np.dtype(dtype), np.integer):
+            numeros = estados.astype(dtype, copy=False)
+            # El historial y las estadísticas describen siempre X(n) / m
+            if self.guardar_historial or self.calcular_estadisticas:
+                self._registrar(estados / np.float64(m))
+        else:
+            numeros = (estados / np.float64(m)).astype(dtype, copy=False)
+            self._registrar(numeros)
+        
+        return numeros
+    
+    def _estados_bloque(self, n: int, a: int, c: int, m: int) -> np.ndarray:
+        """Genera n estados en bloque y avanza la semilla actual"""
+        estados = estados_lcg(self.semilla_actual, n, a, c, m)
+        if n > 0:
+            self.semilla_actual = int(estados[-1])
+        return estados
+    
+    def congruencial_multiplicativo_bloque(self, n: int, a: int = 16807,
+                                           m: int = 2147483647,
+                                           dtype=np.float64) -> np.ndarray:
+        """
+        Método Congruencial Multiplicativo en bloque
+        
+        Args:
+            n: Cantidad de números a generar
+            a: Multiplicador (debe ser raíz primitiva de m)
+            m: Módulo (debe ser primo)
+            dtype: Tipo del arreglo resultante
+        
+        Returns:
+            Arreglo de NumPy con los números generados
+        """
+        return self.congruencial_lineal_bloque(n, a, 0, m, dtype)
+    
+    def congruencial_mixto_bloque(self, n: int, a: int = 1664525,
+                                  c: int = 1013904223, m: int = 2**32,
+                                  dtype=np.float64) -> np.ndarray:
+        """
+        Método Congruencial Mixto en bloque
+        
+        Args:
+            n: Cantidad de números a generar
+            a: Multiplicador
+            c: Incremento
+            m: Módulo
+            dtype: Tipo del arreglo resultante
+        
+        Returns:
+            Arreglo de NumPy con los números generados
+        """
+        return self.congruencial_lineal_bloque(n, a, c, m, dtype)
+    
+    # ========== MODO DE FLUJO (MEMORIA ACOTADA) ==========
+    
+    def _parametros_flujo(self, metodo: str, params: dict) -> Tuple[int, int, int]:
+        """Resuelve (a, c, m) de un método congruencial para el modo de flujo"""
+        if metodo not in self.PARAMETROS_CONGRUENCIALES:
+            raise ValueError(
+                f"Método '{metodo}' no soportado en modo de flujo; use uno de "
+                f"{sorted(self.PARAMETROS_CONGRUENCIALES)}"
+            )
+        a, c, m = self.PARAMETROS_CONGRUENCIALES[metodo]
+        return params.get('a', a), params.get('c', c), params.get('m', m)
+    
+    def iterar(self, n: Optional[int] = None, metodo: str = 'congruencial_lineal',
+               tam_bloque: int = None, dtype=np.float64,
+               **params) -> Iterator[np.ndarray]:
+        """
+        Genera los números por bloques de tamaño fijo
+        
+        Ningún bloque se conserva en numeros_generados, de modo que la
+        memoria usada no depende de la cantidad total de números. Con
+        calcular_estadisticas=True las estadísticas en línea se reinician y
+        se actualizan con cada bloque; si no, el flujo no modifica las
+        estadísticas y obtener_estadisticas sigue describiendo el último
+        lote de los métodos congruenciales.
+        
+        Args:
+            n: Cantidad total de números (None para un flujo infinito)
+            metodo: Método congruencial a utilizar
+            tam_bloque: Cantidad de números por bloque
+            dtype: Tipo de los bloques (entero para estados crudos)
+            **params: Parámetros a, c, m del método
+        
+        Yields:
+            Arreglos de NumPy con a lo más tam_bloque números
+        """
+        a, c, m = self._parametros_flujo(metodo, params)
+        tam_bloque = tam_bloque or self.TAM_BLOQUE
+        entero = np.issubdtype(np.dtype(dtype), np.integer)
+        restantes = n
+        if self.calcular_estadisticas:
+            self.estadisticas = AcumuladorEstadisticas()
+        
+        while restantes is None or restantes > 0:
+            tam = tam_bloque if restantes is None else min(tam_bloque, restantes)
+            estados = self._estados_bloque(tam, a, c, m)
+            uniformes = estados / np.float64(m)
+            self._registrar(uniformes, acumular=True)
+            if entero:
+                yield estados.astype(dtype, copy=False)
+            else:
+                yield uniformes.astype(dtype, copy=False)
+            if restantes is not None:
+                restantes -= tam
+    
+    def llenar(self, buffer, metodo: str = 'congruencial_lineal',
+               tam_bloque: int = None, **params):
+        """
+        Escribe números pseudoaleatorios en un buffer del usuario
+        
+        Acepta cualquier objeto con protocolo de buffer escribible, por
+        ejemplo array('d'), array('f') o un arreglo de NumPy. Si el buffer
+        es de enteros se escriben los estados X(n) en lugar de X(n) / m.
+        Las estadísticas se tratan como en iterar.
+        
+        Args:
+            buffer: Buffer de destino (se llena completo)
+            metodo: Método congruencial a utilizar
+            tam_bloque: Cantidad de números por bloque
+            **params: Parámetros a, c, m del método
+        
+        Returns:
+            El mismo buffer, ya lleno
+        """
+        a, c, m = self._parametros_flujo(metodo, params)
+        tam_bloque = tam_bloque or self.TAM_BLOQUE
+        destino = np.asarray(memoryview(buffer)).reshape(-1)
+        entero = np.issubdtype(destino.dtype, np.integer)
+        if self.calcular_estadisticas:
+            self.estadisticas = AcumuladorEstadisticas()
+        
+        for inicio in range(0, len(destino), tam_bloque):
+            vista = destino[inicio:inicio + tam_bloque]
+            estados = self._estados_bloque(len(vista), a, c, m)
+            if entero:
+                vista[...] = estados
+                self._registrar(estados / np.float64(m), acumular=True)
+            else:
+                np.divide(estados, np.float64(m), out=vista, casting='unsafe')
+                self._registrar(vista, acumular=True)
+        
+        return buffer
+    
+    # ========== SALTOS Y SUBFLUJOS ==========
+    
+    def saltar(self, k: int, a: int = 1103515245, c: int = 12345,
+               m: int = 2**31) -> int:
+        """
+        Avanza el estado k pasos del congruencial en O(log k)
+        
+        Args:
+            k: Número de pasos a saltar
+            a: Multiplicador
+            c: Incremento
+            m: Módulo
+        
+        Returns:
+            Nuevo estado del generador
+        """
+        if k < 0:
+            raise ValueError("El salto debe ser no negativo")
+        
+        A, C = coeficientes_salto(a, c, m, k)
+        self.semilla_actual = (A * self.semilla_actual + C) % m
+        return self.semilla_actual
+    
+    def subflujo(self, i: int, longitud: int = 2**20, a: int = 1103515245,
+                 c: int = 12345, m: int = 2**31) -> 'GeneradorPseudoaleatorios':
+        """
+        Crea el i-ésimo subflujo disjunto de la secuencia
+        
+        El subflujo i comienza i * longitud pasos después de la semilla
+        original, de modo que los subflujos 0, 1, ... no se traslapan
+        mientras no se consuman más de `longitud` números de cada uno.
+        
+        Args:
+            i: Índice del subflujo
+            longitud: Cantidad de números garantizada por subflujo
+            a: Multiplicador
+            c: Incremento
+            m: Módulo
+        
+        Returns:
+            Nuevo generador posicionado al inicio del subflujo
+        """
+        if i < 0 or longitud <= 0:
+            raise ValueError("Índice o longitud de subflujo inválidos")
+        
+        # Importación local: periodo_lcg depende de este módulo
+        from periodo_lcg import longitud_sin_repeticion
+        
+        # Se compara con el periodo real de la semilla, no con m
+        disponible = longitud_sin_repeticion(a, c, m, self.semilla_original % m)
+        if (i + 1) * longitud > disponible:
+            raise ValueError(
+                f"El subflujo {i} de longitud {longitud} excede los {disponible} "
+                f"números sin repetición de la semilla"
+            )
+        
+        A, C = coeficientes_salto(a, c, m, i * longitud)
+        return GeneradorPseudoaleatorios((A * self.semilla_original + C) % m,
+                                         self.guardar_historial,
+                                         self.calcular_estadisticas)
+    
     def reiniciar(self):
         """Reinicia el generador a la semilla original"""
         self.semilla_actual = self.semilla_original
         self.numeros_generados = []
+        self.estadisticas = AcumuladorEstadisticas()
     
     def obtener_estadisticas(self) -> dict:
         """
-        Calcula estadísticas básicas de los números generados
+        Estadísticas del último lote generado (o del último flujo de
+        iterar/llenar)
+        
+        Con calcular_estadisticas se leen del acumulador en línea; si no, se
+        calculan en una pasada sobre numeros_generados.
         
         Returns:
-            Diccionario con media, varianza, min y max
+            Diccionario con media, varianza, min, max, asimetría y curtosis
         """
-        if not self.numeros_generados:
-            return {}
-        
-        n = len(self.numeros_generados)
-        media = sum(self.numeros_generados) / n
-        varianza = sum((x - media) ** 2 for x in self.numeros_generados) / n
-        
-        return {
-            'cantidad': n,
-            'media': media,
-            'varianza': varianza,
-            'desviacion_estandar': math.sqrt(varianza),
-            'minimo': min(self.numeros_generados),
-            'maximo': max(self.numeros_generados)
-        }
+        if not self.calcular_estadisticas and len(self.numeros_generados):
+            return AcumuladorEstadisticas().actualizar(self.numeros_generados).resultado()
+        return self.estadisticas.resultado()
 
 
 def ejemplo_uso():
@@ -4,32 +4,176 @@ Generador de Variables Aleatorias
 Implementa métodos para generar variables aleatorias discretas y continuas
 """
 
+import bisect
 import math
-from typing import List, Callable
+import time
+from functools import lru_cache
+from typing import Callable, Tuple
+
+import numpy as np
+from scipy import special
+
+from fuente_uniforme import FuenteLCG, como_fuente
+
+
+# A partir de esta λ la Poisson se genera con PTRS; debajo, por inversión tabulada
+LAMBDA_PTRS = 10
+
+
+@lru_cache(maxsize=256)
+def _tabla_poisson(lambd: float) -> Tuple[float, ...]:
+    """
+    Función de distribución acumulada de Poisson F(0), F(1), ... hasta que
+    la cola restante es despreciable (menor que 1e-16 para λ < LAMBDA_PTRS)
+    """
+    maximo = int(lambd + 12 * math.sqrt(lambd) + 20)
+    return tuple(special.pdtr(np.arange(maximo + 1), lambd).tolist())
+
+
+# A partir de esta media n min(p, 1-p) la binomial se genera con BTPE;
+# debajo, por inversión tabulada
+MEDIA_BTPE = 30
+
+
+@lru_cache(maxsize=256)
+def _tabla_binomial(ensayos: int, p: float) -> Tuple[float, ...]:
+    """
+    Función de distribución binomial F(0), F(1), ... para media menor que
+    MEDIA_BTPE, hasta moda + 12 sigma + 20 (la cola restante es menor que
+    1e-30): a lo más unas 120 entradas sin importar n
+    """
+    moda = int((ensayos + 1) * p)
+    fin = min(ensayos, moda + int(12 * math.sqrt(ensayos * p * (1 - p)) + 20))
+    return tuple(special.bdtr(np.arange(fin + 1), ensayos, p).tolist())
+
+
+def _resto_stirling(z: float) -> float:
+    """delta(z) = ln Gamma(z) - [(z - 1/2) ln z - z + ln(2 pi) / 2]"""
+    if z >= 10:
+        z2 = z * z
+        return (1 / 12 - (1 / 360 - (1 / 1260 - 1 / (1680 * z2)) / z2) / z2) / z
+    return math.lgamma(z) - ((z - 0.5) * math.log(z) - z + 0.5 * math.log(2 * math.pi))
+
+
+def _resto_stirling_arreglo(z: np.ndarray) -> np.ndarray:
+    """_resto_stirling vectorizado"""
+    z2 = z * z
+    serie = (1 / 12 - (1 / 360 - (1 / 1260 - 1 / (1680 * z2)) / z2) / z2) / z
+    pequenos = z < 10
+    if np.any(pequenos):
+        zp = z[pequenos]
+        serie[pequenos] = special.gammaln(zp) - ((zp - 0.5) * np.log(zp) - zp
+                                                 + 0.5 * math.log(2 * math.pi))
+    return serie
+
+
+@lru_cache(maxsize=4096)
+def _constantes_btpe(ensayos: int, r: float) -> Tuple[float, ...]:
+    """
+    Constantes del método BTPE de Kachitvichyanukul y Schmeiser (1988) para
+    n ensayos y probabilidad r <= 1/2 (costo O(1))
+    
+    Returns:
+        (m, xm, xl, xr, c, lambda_l, lambda_r, p1, p2, p3, p4, ln(r/q),
+         delta(m + 1) + delta(n - m + 1))
+    """
+    q = 1 - r
+    fm = ensayos * r + r
+    m = math.floor(fm)
+    p1 = math.floor(2.195 * math.sqrt(ensayos * r * q) - 4.6 * q) + 0.5
+    xm = m + 0.5
+    xl, xr = xm - p1, xm + p1
+    c = 0.134 + 20.5 / (15.3 + m)
+    a = (fm - xl) / (fm - xl * r)
+    lambda_l = a * (1 + a / 2)
+    a = (xr - fm) / (xr * q)
+    lambda_r = a * (1 + a / 2)
+    p2 = p1 * (1 + 2 * c)
+    p3 = p2 + c / lambda_l
+    p4 = p3 + c / lambda_r
+    restos = _resto_stirling(m + 1) + _resto_stirling(ensayos - m + 1)
+    return m, xm, xl, xr, c, lambda_l, lambda_r, p1, p2, p3, p4, math.log(r / q), restos
+
+
+@lru_cache(maxsize=256)
+def _constantes_ptrs(lambd: float) -> Tuple[float, ...]:
+    """
+    Constantes del método PTRS de Hörmann (1993) para una λ dada
+    
+    Returns:
+        (ln λ, b, a, ln(1/alpha), v_r)
+    """
+    b = 0.931 + 2.53 * math.sqrt(lambd)
+    a = -0.059 + 0.02483 * b
+    inv_alpha = 1.1239 + 1.1328 / (b - 3.4)
+    v_r = 0.9277 - 3.6224 / (b - 2)
+    return math.log(lambd), b, a, math.log(inv_alpha), v_r
+
+
+# Zigurat de Doornik (ZIGNOR, 2005): 128 capas de igual área V bajo la
+# densidad normal sin normalizar exp(-x^2/2); R es el inicio de la cola
+ZIGURAT_CAPAS = 128
+ZIGURAT_R = 3.442619855899
+ZIGURAT_V = 9.91256303526217e-3
+
+
+@lru_cache(maxsize=1)
+def _tablas_zigurat() -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """
+    Tablas del zigurat
+    
+    Returns:
+        (x, r): x[i] es el borde derecho de la capa i (x[0] = V / f(R) es la
+        base ficticia que incluye la cola, x[1] = R, x[128] = 0) y
+        r[i] = x[i+1] / x[i] es la fracción de la capa que cae por completo
+        bajo la curva
+    """
+    x = np.zeros(ZIGURAT_CAPAS + 1)
+    f = math.exp(-0.5 * ZIGURAT_R ** 2)
+    x[0] = ZIGURAT_V / f
+    x[1] = ZIGURAT_R
+    for i in range(2, ZIGURAT_CAPAS):
+        x[i] = math.sqrt(-2 * math.log(ZIGURAT_V / x[i - 1] + f))
+        f = math.exp(-0.5 * x[i] ** 2)
+    return tuple(x.tolist()), tuple((x[1:] / x[:-1]).tolist())
 
 
 class GeneradorVariablesAleatorias:
     """Clase para generar variables aleatorias usando diferentes distribuciones"""
     
-    def __init__(self, generador_uniforme: Callable[[], float] = None):
+    # Distribuciones con versión en bloque (método <nombre>_bloque)
+    DISTRIBUCIONES = ('uniforme_discreta', 'bernoulli', 'binomial', 'geometrica',
+                      'poisson', 'uniforme_continua', 'exponencial', 'normal',
+                      'triangular', 'weibull', 'lognormal')
+    
+    # Métodos para la normal (y la lognormal)
+    METODOS_NORMAL = ('box_muller', 'zigurat')
+    
+    def __init__(self, generador_uniforme: Callable[[], float] = None,
+                 metodo_normal: str = 'box_muller'):
         """
         Inicializa el generador
         
         Args:
-            generador_uniforme: Función que genera números uniformes en [0,1]
-                               Si es None, usa un generador congruencial simple
+            generador_uniforme: Fuente de números uniformes en [0,1]: una
+                               FuenteUniforme, un generador con generar_bloque
+                               o una función. Si es None, usa un generador
+                               congruencial simple (FuenteLCG con semilla 1234)
+            metodo_normal: 'box_muller' (por omisión; el segundo valor de cada
+                           par se guarda para la siguiente llamada) o
+                           'zigurat' (Doornik, más rápido)
         """
+        if metodo_normal not in self.METODOS_NORMAL:
+            raise ValueError(f"Método normal '{metodo_normal}' no soportado; "
+                             f"use uno de {self.METODOS_NORMAL}")
         if generador_uniforme is None:
-            self.x = 1234
-            self.generador_uniforme = self._uniforme_default
+            self.fuente = FuenteLCG(semilla=1234)
         else:
-            self.generador_uniforme = generador_uniforme
-    
-    def _uniforme_default(self) -> float:
-        """Generador uniforme por defecto (congruencial lineal)"""
-        a, c, m = 1103515245, 12345, 2**31
-        self.x = (a * self.x + c) % m
-        return self.x / m
+            self.fuente = como_fuente(generador_uniforme)
+        self.generador_uniforme = self.fuente.siguiente
+        self.metodo_normal = metodo_normal
+        # Segundo valor N(0,1) del último par de Box-Muller, aún sin usar
+        self._normal_pendiente = None
     
     # ========== DISTRIBUCIONES DISCRETAS ==========
     
@@ -62,7 +206,14 @@ class GeneradorVariablesAleatorias:
     
     def binomial(self, n: int, p: float) -> int:
         """
-        Genera variable aleatoria binomial usando método directo
+        Genera variable aleatoria binomial con costo O(1) por valor
+        
+        Se trabaja con r = min(p, 1-p) y se refleja el resultado si p > 1/2.
+        Si n r < MEDIA_BTPE se invierte la función de distribución tabulada
+        (un uniforme y una búsqueda binaria en a lo más ~120 valores); si no,
+        se usa BTPE: propuesta triángulo-paralelogramo-exponenciales y
+        aceptación con ln f(y)/f(m) por la fórmula de Stirling con resto
+        exacto. Las constantes se calculan una sola vez por (n, p).
         
         Args:
             n: Número de ensayos
@@ -71,7 +222,49 @@ class GeneradorVariablesAleatorias:
         Returns:
             Número de éxitos en n ensayos
         """
-        return sum(self.bernoulli(p) for _ in range(n))
+        r = min(p, 1 - p)
+        if n * r < MEDIA_BTPE:
+            y = min(bisect.bisect_right(_tabla_binomial(n, r), self.generador_uniforme()), n)
+        else:
+            y = self._binomial_btpe(n, r)
+        return n - y if p > 0.5 else y
+    
+    def _binomial_btpe(self, n: int, r: float) -> int:
+        """Binomial(n, r) con r <= 1/2 y n r >= MEDIA_BTPE por BTPE"""
+        m, xm, xl, xr, c, lambda_l, lambda_r, p1, p2, p3, p4, log_rq, restos = \
+            _constantes_btpe(n, r)
+        while True:
+            u = self.generador_uniforme() * p4
+            v = self.generador_uniforme()
+            if u <= p1:
+                # Triángulo central: aceptación inmediata
+                return math.floor(xm - p1 * v + u)
+            if u <= p2:
+                x = xl + (u - p1) / c
+                v = v * c + 1 - abs(m - x + 0.5) / p1
+                if v > 1 or v <= 0:
+                    continue
+                y = math.floor(x)
+            elif v == 0:
+                continue
+            elif u <= p3:
+                y = math.floor(xl + math.log(v) / lambda_l)
+                if y < 0:
+                    continue
+                v *= (u - p2) * lambda_l
+            else:
+                y = math.floor(xr - math.log(v) / lambda_r)
+                if y > n:
+                    continue
+                v *= (u - p3) * lambda_r
+            
+            # ln f(y)/f(m) con ln x! = (x + 1/2) ln(x + 1) - (x + 1) + ln(2 pi)/2 + delta(x + 1)
+            x1, w, z = y + 1, n - y + 1, n - m + 1
+            log_cociente = (xm * math.log((m + 1) / x1) + (n - m + 0.5) * math.log(z / w)
+                            + (y - m) * (math.log(w / x1) + log_rq)
+                            + restos - _resto_stirling(x1) - _resto_stirling(w))
+            if math.log(v) <= log_cociente:
+                return y
     
     def geometrica(self, p: float) -> int:
         """
@@ -88,7 +281,13 @@ class GeneradorVariablesAleatorias:
     
     def poisson(self, lambd: float) -> int:
         """
-        Genera variable aleatoria de Poisson usando transformada inversa
+        Genera variable aleatoria de Poisson con un método híbrido
+        
+        Para λ < LAMBDA_PTRS se invierte la función de distribución tabulada
+        (un uniforme y una búsqueda binaria); para λ mayor se usa el rechazo
+        transformado PTRS de Hörmann, con costo esperado constante
+        (unos 2.2 uniformes por valor) sin importar λ. La tabla y las
+        constantes se calculan una sola vez por λ.
         
         Args:
             lambd: Parámetro λ (tasa promedio)
@@ -96,16 +295,24 @@ class GeneradorVariablesAleatorias:
         Returns:
             Número de eventos
         """
-        a = math.exp(-lambd)
-        b = 1.0
-        i = 0
-        
-        while b >= a:
-            u = self.generador_uniforme()
-            b *= u
-            i += 1
+        if lambd < LAMBDA_PTRS:
+            return bisect.bisect_right(_tabla_poisson(lambd), self.generador_uniforme())
         
-        return i - 1
+        log_lambd, b, a, log_inv_alpha, v_r = _constantes_ptrs(lambd)
+        while True:
+            u = self.generador_uniforme() - 0.5
+            v = self.generador_uniforme()
+            us = 0.5 - abs(u)
+            if us == 0:
+                continue
+            k = math.floor((2 * a / us + b) * u + lambd + 0.43)
+            if us >= 0.07 and v <= v_r:
+                return k
+            if k < 0 or (us < 0.013 and v > us):
+                continue
+            if (math.log(v) + log_inv_alpha - math.log(a / (us * us) + b)
+                    <= -lambd + k * log_lambd - math.lgamma(k + 1)):
+                return k
     
     # ========== DISTRIBUCIONES CONTINUAS ==========
     
@@ -138,7 +345,11 @@ class GeneradorVariablesAleatorias:
     
     def normal(self, mu: float = 0, sigma: float = 1) -> float:
         """
-        Genera variable aleatoria normal usando método Box-Muller
+        Genera variable aleatoria normal con el método del generador
+        
+        Con 'zigurat' se usa _normal_zigurat; con 'box_muller' cada par de
+        normal_par sirve para dos llamadas, así que no se desperdician
+        uniformes.
         
         Args:
             mu: Media
@@ -147,10 +358,14 @@ class GeneradorVariablesAleatorias:
         Returns:
             Valor de distribución normal
         """
-        u1 = self.generador_uniforme()
-        u2 = self.generador_uniforme()
+        if self.metodo_normal == 'zigurat':
+            return mu + sigma * self._normal_zigurat()
         
-        z = math.sqrt(-2 * math.log(u1)) * math.cos(2 * math.pi * u2)
+        z = self._normal_pendiente
+        if z is None:
+            z, self._normal_pendiente = self.normal_par()
+        else:
+            self._normal_pendiente = None
         return mu + sigma * z
     
     def normal_par(self, mu: float = 0, sigma: float = 1) -> tuple:
@@ -167,11 +382,48 @@ class GeneradorVariablesAleatorias:
         u1 = self.generador_uniforme()
         u2 = self.generador_uniforme()
         
-        z1 = math.sqrt(-2 * math.log(u1)) * math.cos(2 * math.pi * u2)
-        z2 = math.sqrt(-2 * math.log(u1)) * math.sin(2 * math.pi * u2)
+        radio = math.sqrt(-2 * math.log(u1))
+        z1 = radio * math.cos(2 * math.pi * u2)
+        z2 = radio * math.sin(2 * math.pi * u2)
         
         return (mu + sigma * z1, mu + sigma * z2)
     
+    def _normal_zigurat(self) -> float:
+        """
+        N(0,1) con el zigurat de Doornik (ZIGNOR)
+        
+        Un solo uniforme w da la capa i = floor(128 w) y la abscisa
+        u = 2 (128 w - i) - 1 en (-1, 1). En cerca del 99 % de los casos
+        |u| < r[i] y el valor u x[i] se acepta con una multiplicación; si no,
+        se prueba la cuña de la capa o, en la capa 0, se muestrea la cola
+        más allá de R.
+        
+        Returns:
+            Valor N(0,1)
+        """
+        x, r = _tablas_zigurat()
+        while True:
+            w = ZIGURAT_CAPAS * self.generador_uniforme()
+            i = int(w)
+            u = 2 * (w - i) - 1
+            if abs(u) < r[i]:
+                return u * x[i]
+            if i == 0:
+                return self._cola_normal(u < 0)
+            z = u * x[i]
+            f0 = math.exp(-0.5 * (x[i] ** 2 - z * z))
+            f1 = math.exp(-0.5 * (x[i + 1] ** 2 - z * z))
+            if f1 + self.generador_uniforme() * (f0 - f1) < 1.0:
+                return z
+    
+    def _cola_normal(self, negativo: bool) -> float:
+        """Valor de la cola normal |Z| > R (método de Marsaglia)"""
+        while True:
+            x = math.log(1 - self.generador_uniforme()) / ZIGURAT_R
+            y = math.log(1 - self.generador_uniforme())
+            if -2 * y >= x * x:
+                return x - ZIGURAT_R if negativo else ZIGURAT_R - x
+    
     def triangular(self, a: float, b: float, c: float) -> float:
         """
         Genera variable aleatoria triangular
@@ -219,38 +471,273 @@ class GeneradorVariablesAleatorias:
         z = self.normal(0, 1)
         return math.exp(mu + sigma * z)
     
+    # ========== MUESTRAS EN BLOQUE ==========
+    # Cada método toma n uniformes de la fuente con llenar(n) y les aplica
+    # la transformación vectorizada. Las distribuciones que usan un solo
+    # uniforme por valor producen la misma secuencia que el método escalar.
+    
+    def uniforme_discreta_bloque(self, n: int, a: int, b: int) -> np.ndarray:
+        """n valores uniformes discretos en [a, b]"""
+        return a + ((b - a + 1) * self.fuente.llenar(n)).astype(np.int64)
+    
+    def bernoulli_bloque(self, n: int, p: float) -> np.ndarray:
+        """n valores de Bernoulli con probabilidad de éxito p"""
+        return (self.fuente.llenar(n) <= p).astype(np.int64)
+    
+    def binomial_bloque(self, n: int, ensayos: int, p: float) -> np.ndarray:
+        """
+        n valores binomiales con el método de binomial
+        
+        Con media pequeña se usa la inversión tabulada (misma secuencia que
+        binomial); con BTPE se aplican la propuesta y la aceptación a bloques
+        de pares de uniformes y se conservan los candidatos aceptados.
+        
+        Args:
+            n: Tamaño de la muestra
+            ensayos: Número de ensayos de cada valor
+            p: Probabilidad de éxito
+        
+        Returns:
+            Arreglo de enteros
+        """
+        r = min(p, 1 - p)
+        if ensayos * r < MEDIA_BTPE:
+            y = np.searchsorted(np.array(_tabla_binomial(ensayos, r)), self.fuente.llenar(n),
+                                side='right')
+            np.minimum(y, ensayos, out=y)
+        else:
+            y = self._binomial_btpe_bloque(n, ensayos, r)
+        return ensayos - y if p > 0.5 else y
+    
+    def _binomial_btpe_bloque(self, n: int, ensayos: int, r: float) -> np.ndarray:
+        """n valores Binomial(ensayos, r) por BTPE vectorizado"""
+        m, xm, xl, xr, c, lambda_l, lambda_r, p1, p2, p3, p4, log_rq, restos = \
+            _constantes_btpe(ensayos, r)
+        resultado = np.empty(n, dtype=np.int64)
+        llenos = 0
+        while llenos < n:
+            # La aceptación de BTPE es mayor que 0.8 con n r >= MEDIA_BTPE
+            pares = int((n - llenos) * 1.3) + 16
+            uniformes = self.fuente.llenar(2 * pares).reshape(pares, 2)
+            u = uniformes[:, 0] * p4
+            v = uniformes[:, 1].copy()
+            y = np.floor(xm - p1 * v + u)
+            aceptados = u <= p1
+            
+            paralelogramo = (u > p1) & (u <= p2)
+            x = xl + (u[paralelogramo] - p1) / c
+            v[paralelogramo] = v[paralelogramo] * c + 1 - np.abs(m - x + 0.5) / p1
+            y[paralelogramo] = np.floor(x)
+            with np.errstate(divide='ignore'):
+                izquierda = (u > p2) & (u <= p3)
+                y[izquierda] = np.floor(xl + np.log(v[izquierda]) / lambda_l)
+                v[izquierda] *= (u[izquierda] - p2) * lambda_l
+                derecha = u > p3
+                y[derecha] = np.floor(xr - np.log(v[derecha]) / lambda_r)
+                v[derecha] *= (u[derecha] - p3) * lambda_r
+            
+            dudosos = np.flatnonzero(~aceptados & (v > 0) & (v <= 1) & (y >= 0) & (y <= ensayos))
+            yd, vd = y[dudosos], v[dudosos]
+            x1, w, z = yd + 1, ensayos - yd + 1, ensayos - m + 1
+            log_cociente = (xm * np.log((m + 1) / x1) + (ensayos - m + 0.5) * np.log(z / w)
+                            + (yd - m) * (np.log(w / x1) + log_rq)
+                            + restos - _resto_stirling_arreglo(x1) - _resto_stirling_arreglo(w))
+            aceptados[dudosos] = np.log(vd) <= log_cociente
+            
+            valores = y[aceptados][:n - llenos]
+            resultado[llenos:llenos + len(valores)] = valores
+            llenos += len(valores)
+        return resultado
+    
+    def geometrica_bloque(self, n: int, p: float) -> np.ndarray:
+        """n valores geométricos (ensayos hasta el primer éxito)"""
+        u = self.fuente.llenar(n)
+        return (np.log(1 - u) / math.log(1 - p)).astype(np.int64) + 1
+    
+    def poisson_bloque(self, n: int, lambd: float) -> np.ndarray:
+        """
+        n valores de Poisson con el método híbrido de poisson
+        
+        Para λ < LAMBDA_PTRS cada uniforme se ubica en la tabla con
+        búsqueda binaria; para λ mayor se aplica PTRS a bloques de pares de
+        uniformes y se conservan los candidatos aceptados.
+        
+        Args:
+            n: Tamaño de la muestra
+            lambd: Parámetro λ
+        
+        Returns:
+            Arreglo de enteros
+        """
+        if lambd < LAMBDA_PTRS:
+            return np.searchsorted(np.array(_tabla_poisson(lambd)), self.fuente.llenar(n),
+                                   side='right')
+        
+        log_lambd, b, a, log_inv_alpha, v_r = _constantes_ptrs(lambd)
+        resultado = np.empty(n, dtype=np.int64)
+        llenos = 0
+        while llenos < n:
+            # La aceptación es mayor que 0.85 para toda λ >= LAMBDA_PTRS
+            pares = int((n - llenos) * 1.2) + 16
+            uniformes = self.fuente.llenar(2 * pares).reshape(pares, 2)
+            u = uniformes[:, 0] - 0.5
+            v = uniformes[:, 1]
+            us = 0.5 - np.abs(u)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                k = np.floor((2 * a / us + b) * u + lambd + 0.43)
+            
+            aceptados = (us >= 0.07) & (v <= v_r)
+            dudosos = np.flatnonzero(~aceptados & (k >= 0) & (us > 0)
+                                     & ~((us < 0.013) & (v > us)))
+            kd, ud = k[dudosos], us[dudosos]
+            aceptados[dudosos] = (np.log(v[dudosos]) + log_inv_alpha - np.log(a / (ud * ud) + b)
+                                  <= -lambd + kd * log_lambd - special.gammaln(kd + 1))
+            
+            valores = k[aceptados][:n - llenos]
+            resultado[llenos:llenos + len(valores)] = valores
+            llenos += len(valores)
+        return resultado
+    
+    def uniforme_continua_bloque(self, n: int, a: float, b: float) -> np.ndarray:
+        """n valores uniformes continuos en [a, b]"""
+        u = self.fuente.llenar(n)
+        u *= b - a
+        u += a
+        return u
+    
+    def exponencial_bloque(self, n: int, lambd: float) -> np.ndarray:
+        """n valores exponenciales por transformada inversa"""
+        u = self.fuente.llenar(n)
+        np.log(u, out=u)
+        u *= -1 / lambd
+        return u
+    
+    def normal_bloque(self, n: int, mu: float = 0, sigma: float = 1) -> np.ndarray:
+        """
+        n valores normales con el método del generador, vectorizado
+        
+        Con 'zigurat' se aceptan de una vez los valores que caen dentro de
+        las capas y sólo los pocos rechazados se vuelven a intentar. Con
+        'box_muller' cada par de uniformes da los dos valores de normal_par
+        (coseno y seno), y el valor pendiente de normal se usa primero y se
+        deja uno nuevo si sobra, de modo que la secuencia es la misma que la
+        de n llamadas a normal.
+        
+        Args:
+            n: Tamaño de la muestra
+            mu: Media
+            sigma: Desviación estándar
+        
+        Returns:
+            Arreglo de flotantes
+        """
+        if self.metodo_normal == 'zigurat':
+            z = self._normal_zigurat_bloque(n)
+        else:
+            z = np.empty(n)
+            inicio = 0
+            if n and self._normal_pendiente is not None:
+                z[0] = self._normal_pendiente
+                self._normal_pendiente = None
+                inicio = 1
+            pares = (n - inicio + 1) // 2
+            u = self.fuente.llenar(2 * pares).reshape(pares, 2)
+            radio = np.sqrt(-2 * np.log(u[:, 0]))
+            angulo = 2 * np.pi * u[:, 1]
+            np.multiply(radio, np.cos(angulo), out=u[:, 0])
+            np.multiply(radio, np.sin(angulo), out=u[:, 1])
+            valores = u.reshape(-1)
+            z[inicio:] = valores[:n - inicio]
+            if len(valores) > n - inicio:
+                self._normal_pendiente = float(valores[-1])
+        
+        if sigma != 1:
+            z *= sigma
+        if mu != 0:
+            z += mu
+        return z
+    
+    def _normal_zigurat_bloque(self, n: int) -> np.ndarray:
+        """n valores N(0,1) con el zigurat; los rechazados se repiten por rondas"""
+        z, aceptado = self._ronda_zigurat(n)
+        pendientes = np.flatnonzero(~aceptado)
+        while len(pendientes):
+            valores, aceptado = self._ronda_zigurat(len(pendientes))
+            z[pendientes[aceptado]] = valores[aceptado]
+            pendientes = pendientes[~aceptado]
+        return z
+    
+    def _ronda_zigurat(self, m: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Un intento del zigurat para m valores: (candidatos, aceptados)"""
+        x, r = (np.array(t) for t in _tablas_zigurat())
+        w = self.fuente.llenar(m)
+        w *= ZIGURAT_CAPAS
+        i = w.astype(np.int64)
+        u = w
+        u -= i
+        u *= 2
+        u -= 1
+        aceptado = np.abs(u) < r[i]
+        candidato = u * x[i]
+        
+        # Capa 0 fuera del rectángulo: cola (rara, en escalar)
+        cola = np.flatnonzero(~aceptado & (i == 0))
+        for j in cola:
+            candidato[j] = self._cola_normal(u[j] < 0)
+        aceptado[cola] = True
+        
+        # Cuñas: se acepta si un punto uniforme cae bajo la curva
+        cuna = np.flatnonzero(~aceptado)
+        if len(cuna):
+            zc, ic = candidato[cuna], i[cuna]
+            f0 = np.exp(-0.5 * (x[ic] ** 2 - zc * zc))
+            f1 = np.exp(-0.5 * (x[ic + 1] ** 2 - zc * zc))
+            aceptado[cuna] = f1 + self.fuente.llenar(len(cuna)) * (f0 - f1) < 1.0
+        return candidato, aceptado
+    
+    def triangular_bloque(self, n: int, a: float, b: float, c: float) -> np.ndarray:
+        """n valores triangulares por transformada inversa"""
+        u = self.fuente.llenar(n)
+        izquierda = u <= (c - a) / (b - a)
+        return np.where(izquierda,
+                        a + np.sqrt(u * ((b - a) * (c - a))),
+                        b - np.sqrt((1 - u) * ((b - a) * (b - c))))
+    
+    def weibull_bloque(self, n: int, alpha: float, beta: float) -> np.ndarray:
+        """n valores de Weibull (escala alpha, forma beta) por transformada inversa"""
+        u = self.fuente.llenar(n)
+        np.log(u, out=u)
+        np.negative(u, out=u)
+        np.power(u, 1 / beta, out=u)
+        u *= alpha
+        return u
+    
+    def lognormal_bloque(self, n: int, mu: float, sigma: float) -> np.ndarray:
+        """n valores lognormales: exp(mu + sigma Z)"""
+        return np.exp(self.normal_bloque(n, mu, sigma))
+    
     # ========== MÉTODOS GENERALES ==========
     
-    def generar_muestra(self, distribucion: str, n: int, **params) -> List[float]:
+    def generar_muestra(self, distribucion: str, n: int, **params) -> np.ndarray:
         """
         Genera una muestra de n valores de una distribución
         
+        La muestra se produce en bloque con el método <distribucion>_bloque,
+        sin llamadas a Python por cada valor.
+        
         Args:
-            distribucion: Nombre de la distribución
+            distribucion: Nombre de la distribución (ver DISTRIBUCIONES)
             n: Tamaño de la muestra
-            **params: Parámetros de la distribución
+            **params: Parámetros de la distribución (los del método escalar;
+                      en binomial, el número de ensayos se llama 'ensayos')
             
         Returns:
-            Lista de valores generados
-        """
-        metodos = {
-            'uniforme_discreta': lambda: self.uniforme_discreta(**params),
-            'bernoulli': lambda: self.bernoulli(**params),
-            'binomial': lambda: self.binomial(**params),
-            'geometrica': lambda: self.geometrica(**params),
-            'poisson': lambda: self.poisson(**params),
-            'uniforme_continua': lambda: self.uniforme_continua(**params),
-            'exponencial': lambda: self.exponencial(**params),
-            'normal': lambda: self.normal(**params),
-            'triangular': lambda: self.triangular(**params),
-            'weibull': lambda: self.weibull(**params),
-            'lognormal': lambda: self.lognormal(**params)
-        }
-        
-        if distribucion not in metodos:
+            Arreglo de NumPy con los valores generados
+        """
+        if distribucion not in self.DISTRIBUCIONES:
             raise ValueError(f"Distribución '{distribucion}' no soportada")
         
-        return [metodos[distribucion]() for _ in range(n)]
+        return getattr(self, distribucion + '_bloque')(n, **params)
 
 
 def ejemplo_uso():
@@ -311,6 +798,28 @@ def ejemplo_uso():
     weibulls = [gen.weibull(2, 1.5) for _ in range(5)]
     print(f"   {[f'{x:.4f}' for x in weibulls]}")
     
+    print("\n11. Muestras en bloque con generar_muestra (n = 10^6):")
+    for distribucion, params in (('exponencial', {'lambd': 0.5}),
+                                 ('normal', {'mu': 100, 'sigma': 15}),
+                                 ('weibull', {'alpha': 2, 'beta': 1.5}),
+                                 ('poisson', {'lambd': 1000}),
+                                 ('binomial', {'ensayos': 10**5, 'p': 0.02})):
+        inicio = time.perf_counter()
+        muestra = gen.generar_muestra(distribucion, 10**6, **params)
+        print(f"   {distribucion:<12} {time.perf_counter() - inicio:.3f} s, "
+              f"media = {muestra.mean():.4f}")
+    
+    print("\n12. Métodos para la normal (10^5 llamadas escalares y 10^6 en bloque):")
+    for metodo in GeneradorVariablesAleatorias.METODOS_NORMAL:
+        gen_normal = GeneradorVariablesAleatorias(FuenteLCG(semilla=1234), metodo_normal=metodo)
+        inicio = time.perf_counter()
+        for _ in range(10**5):
+            gen_normal.normal()
+        escalar = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        gen_normal.normal_bloque(10**6)
+        print(f"   {metodo:<12} escalar {escalar:.3f} s, bloque {time.perf_counter() - inicio:.3f} s")
+    
     # Ejemplo de aplicación: Simulación de tiempos de llegada
     print("\n" + "=" * 70)
     print("EJEMPLO: Simulación de llegadas a un banco")
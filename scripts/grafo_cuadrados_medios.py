@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Análisis del Grafo Funcional de Cuadrados Medios
+Aplica el método a todas las semillas de d dígitos a la vez y reporta
+ciclos, atractores (como el 0 y los puntos fijos) y longitudes de cola
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from generador_pseudoaleatorios import paso_cuadrados_medios
+
+
+def grafo_cuadrados_medios(digitos: int = 4, tam_bloque: int = 2**22) -> np.ndarray:
+    """
+    Calcula el sucesor de cada uno de los 10^d estados posibles
+    
+    Args:
+        digitos: Número de dígitos de la semilla (hasta 8)
+        tam_bloque: Estados procesados por bloque (limita la memoria temporal)
+    
+    Returns:
+        Arreglo int32 donde sucesor[x] es el estado que sigue a x
+    """
+    if not 1 <= digitos <= 8:
+        raise ValueError("El análisis exhaustivo admite de 1 a 8 dígitos")
+    
+    total = 10 ** digitos
+    sucesor = np.empty(total, dtype=np.int32)
+    for inicio in range(0, total, tam_bloque):
+        fin = min(inicio + tam_bloque, total)
+        sucesor[inicio:fin] = paso_cuadrados_medios(np.arange(inicio, fin), digitos)
+    return sucesor
+
+
+def analizar_cuadrados_medios(digitos: int = 4) -> Dict:
+    """
+    Analiza el grafo funcional x -> cuadrados_medios(x) para todas las semillas
+    
+    1. Se eliminan por rondas los estados sin predecesores (las hojas del
+       grafo); lo que sobrevive son exactamente los estados en ciclos.
+    2. Cada ciclo se etiqueta con su elemento mínimo por duplicación de
+       apuntadores, en O(log longitud) pasos vectorizados.
+    3. Recorriendo las rondas en orden inverso se propagan a cada semilla
+       la longitud de su cola y el ciclo (atractor) al que llega.
+    
+    Para d = 8 se manejan 10^8 estados y se requieren alrededor de 3 GB.
+    
+    Args:
+        digitos: Número de dígitos de la semilla (hasta 8)
+    
+    Returns:
+        Diccionario con el resumen de ciclos y, por semilla, los arreglos
+        'cola', 'ciclo' (índice en 'ciclos') y 'valores_distintos'
+    """
+    sucesor = grafo_cuadrados_medios(digitos)
+    total = len(sucesor)
+    
+    # 1. Eliminación de hojas por rondas
+    grado = np.bincount(sucesor, minlength=total).astype(np.int32)
+    frontera = np.flatnonzero(grado == 0).astype(np.int32)
+    rondas: List[np.ndarray] = []
+    while len(frontera):
+        rondas.append(frontera)
+        destinos, cuenta = np.unique(sucesor[frontera], return_counts=True)
+        grado[destinos] -= cuenta.astype(np.int32)
+        frontera = destinos[grado[destinos] == 0].astype(np.int32)
+    del grado
+    
+    en_ciclo = np.ones(total, dtype=bool)
+    for frontera in rondas:
+        en_ciclo[frontera] = False
+    nodos_ciclo = np.flatnonzero(en_ciclo).astype(np.int32)
+    del en_ciclo
+    
+    # 2. Etiquetar cada ciclo con su mínimo (duplicación de apuntadores)
+    posicion = np.searchsorted(nodos_ciclo, sucesor[nodos_ciclo])
+    etiqueta = np.arange(len(nodos_ciclo))
+    salto = posicion
+    pasos = 1
+    while pasos < len(nodos_ciclo):
+        etiqueta = np.minimum(etiqueta, etiqueta[salto])
+        salto = salto[salto]
+        pasos *= 2
+    representantes, indice_ciclo, longitudes = np.unique(
+        etiqueta, return_inverse=True, return_counts=True)
+    representantes = nodos_ciclo[representantes]
+    
+    # 3. Propagar cola y atractor desde los ciclos hacia las hojas
+    cola = np.zeros(total, dtype=np.int32)
+    ciclo = np.empty(total, dtype=np.int32)
+    ciclo[nodos_ciclo] = indice_ciclo
+    for frontera in reversed(rondas):
+        siguiente = sucesor[frontera]
+        cola[frontera] = cola[siguiente] + 1
+        ciclo[frontera] = ciclo[siguiente]
+    del rondas
+    
+    cuencas = np.bincount(ciclo, minlength=len(representantes))
+    valores_distintos = cola + longitudes[ciclo].astype(np.int32)
+    
+    # Ciclos ordenados de mayor a menor cuenca de atracción
+    orden = np.argsort(-cuencas, kind='stable')
+    ciclos = []
+    for i in orden:
+        ciclos.append({
+            'representante': int(representantes[i]),
+            'longitud': int(longitudes[i]),
+            'cuenca': int(cuencas[i]),
+            'fraccion_semillas': cuencas[i] / total,
+            'elementos': (nodos_ciclo[indice_ciclo == i].tolist()
+                          if longitudes[i] <= 20 else None)
+        })
+    ciclo = np.argsort(orden).astype(np.int32)[ciclo]
+    
+    return {
+        'digitos': digitos,
+        'estados': total,
+        'numero_ciclos': len(ciclos),
+        'ciclos': ciclos,
+        'puntos_fijos': sorted(c['representante'] for c in ciclos if c['longitud'] == 1),
+        'cuenca_del_cero': int(cuencas[indice_ciclo[0]]) if nodos_ciclo[0] == 0 else 0,
+        'ciclo_maximo': int(longitudes.max()),
+        'cola_maxima': int(cola.max()),
+        'cola_media': float(cola.mean()),
+        'cola': cola,
+        'ciclo': ciclo,
+        'valores_distintos': valores_distintos
+    }
+
+
+def semillas_utiles(reporte: Dict, minimo_valores: int,
+                    excluir_puntos_fijos: bool = True) -> np.ndarray:
+    """
+    Filtra en bloque las semillas que producen suficientes valores distintos
+    
+    Args:
+        reporte: Resultado de analizar_cuadrados_medios
+        minimo_valores: Cantidad mínima de valores distintos antes de repetir
+        excluir_puntos_fijos: Descarta semillas que terminan en un punto fijo
+                              (por ejemplo el 0)
+    
+    Returns:
+        Arreglo con las semillas que cumplen el criterio
+    """
+    validas = reporte['valores_distintos'] >= minimo_valores
+    if excluir_puntos_fijos:
+        fijos = np.array([c['longitud'] == 1 for c in reporte['ciclos']])
+        validas &= ~fijos[reporte['ciclo']]
+    return np.flatnonzero(validas)
+
+
+def ejemplo_uso():
+    """Ejemplo de análisis exhaustivo de Cuadrados Medios"""
+    print("=" * 70)
+    print("GRAFO FUNCIONAL DE CUADRADOS MEDIOS - TecNM")
+    print("=" * 70)
+    
+    for digitos in (2, 4, 6):
+        reporte = analizar_cuadrados_medios(digitos)
+        print(f"\n{digitos} dígitos ({reporte['estados']} semillas):")
+        print(f"   Ciclos distintos: {reporte['numero_ciclos']}")
+        print(f"   Puntos fijos: {reporte['puntos_fijos'][:10]}")
+        print(f"   Semillas que terminan en 0: {reporte['cuenca_del_cero']}")
+        print(f"   Ciclo más largo: {reporte['ciclo_maximo']}")
+        print(f"   Cola máxima: {reporte['cola_maxima']}, "
+              f"cola media: {reporte['cola_media']:.2f}")
+        print("   Principales atractores:")
+        for c in reporte['ciclos'][:4]:
+            print(f"      ciclo de {c['representante']:>{digitos}} "
+                  f"(longitud {c['longitud']}): "
+                  f"{c['fraccion_semillas'] * 100:.2f}% de las semillas")
+    
+    reporte = analizar_cuadrados_medios(4)
+    utiles = semillas_utiles(reporte, minimo_valores=50)
+    print(f"\nSemillas de 4 dígitos con al menos 50 valores distintos: {len(utiles)}")
+    print(f"Ejemplo: semilla 5735 produce "
+          f"{reporte['valores_distintos'][5735]} valores distintos")
+    
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    ejemplo_uso()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Periodo y Ciclos de Generadores Congruenciales
+Verifica las condiciones de Hull-Dobell y calcula el periodo exacto y la
+longitud de la cola (pre-periodo) de un conjunto de parámetros (a, c, m)
+
+Por omisión analizar_parametros usa periodo_exacto: factoriza m, parte de
+un múltiplo del periodo (función de Carmichael) y lo reduce con saltos en
+O(log k), lo que toma segundos aun para m = 2^32. La detección de ciclos
+de Brent (detectar_ciclo_brent, metodo='brent') recorre O(mu + lambda)
+estados y queda como verificación para m moderados.
+"""
+
+import math
+import random
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import numpy as np
+
+from generador_pseudoaleatorios import coeficientes_salto, estados_lcg
+
+
+# ========== ARITMÉTICA AUXILIAR ==========
+
+def es_primo(n: int) -> bool:
+    """
+    Prueba de primalidad de Miller-Rabin (determinista para n < 3.3e24)
+    
+    Args:
+        n: Entero a probar
+    
+    Returns:
+        True si n es primo
+    """
+    if n < 2:
+        return False
+    pequenos = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for p in pequenos:
+        if n % p == 0:
+            return n == p
+    
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    
+    for base in pequenos:
+        x = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _factor_pollard_brent(n: int) -> int:
+    """Encuentra un factor no trivial de n compuesto (rho de Pollard-Brent)"""
+    if n % 2 == 0:
+        return 2
+    while True:
+        y, c, m = random.randrange(1, n), random.randrange(1, n), 128
+        g, r, q = 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def factorizar(n: int) -> Dict[int, int]:
+    """
+    Factorización en primos
+    
+    Args:
+        n: Entero positivo
+    
+    Returns:
+        Diccionario {primo: exponente}
+    """
+    factores = {}
+    for p in (2, 3, 5, 7, 11, 13):
+        while n % p == 0:
+            factores[p] = factores.get(p, 0) + 1
+            n //= p
+    
+    pendientes = [n] if n > 1 else []
+    while pendientes:
+        d = pendientes.pop()
+        if es_primo(d):
+            factores[d] = factores.get(d, 0) + 1
+        else:
+            f = _factor_pollard_brent(d)
+            pendientes.extend((f, d // f))
+    
+    return dict(sorted(factores.items()))
+
+
+# ========== CONDICIONES DE HULL-DOBELL ==========
+
+def verificar_hull_dobell(a: int, c: int, m: int) -> Dict:
+    """
+    Verifica analíticamente el teorema de Hull-Dobell
+    
+    El congruencial X(n+1) = (a X(n) + c) mod m tiene periodo completo m
+    para toda semilla si y sólo si:
+        1. c y m son primos relativos
+        2. a - 1 es divisible por todos los factores primos de m
+        3. a - 1 es divisible por 4 si m es divisible por 4
+    
+    Args:
+        a: Multiplicador
+        c: Incremento
+        m: Módulo
+    
+    Returns:
+        Diccionario con cada condición y la conclusión
+    """
+    primos = list(factorizar(m))
+    condicion_1 = math.gcd(c, m) == 1
+    condicion_2 = all((a - 1) % p == 0 for p in primos)
+    condicion_3 = m % 4 != 0 or (a - 1) % 4 == 0
+    periodo_completo = condicion_1 and condicion_2 and condicion_3
+    
+    return {
+        'a': a,
+        'c': c,
+        'm': m,
+        'factores_primos_m': primos,
+        'c_primo_relativo_m': condicion_1,
+        'a_menos_1_divisible_por_primos_m': condicion_2,
+        'a_menos_1_divisible_por_4': condicion_3,
+        'periodo_completo': periodo_completo,
+        'conclusion': 'PERIODO COMPLETO' if periodo_completo else 'PERIODO INCOMPLETO'
+    }
+
+
+# ========== DETECCIÓN DE CICLOS ==========
+
+def _aplicar_salto(x: int, k: int, a: int, c: int, m: int) -> int:
+    """Estado X(k) partiendo de X(0) = x"""
+    A, C = coeficientes_salto(a, c, m, k)
+    return (A * x + C) % m
+
+
+def _buscar_cola(a: int, c: int, m: int, semilla: int, periodo: int,
+                 cota: int) -> int:
+    """
+    Longitud mínima de la cola mu, con 0 <= mu <= cota
+    
+    Una vez en el ciclo la secuencia no lo abandona, por lo que la
+    condición X(mu) == X(mu + periodo) es monótona y admite búsqueda
+    binaria con saltos O(log k).
+    """
+    inferior, superior = 0, cota
+    while inferior < superior:
+        medio = (inferior + superior) // 2
+        x = _aplicar_salto(semilla, medio, a, c, m)
+        if _aplicar_salto(x, periodo, a, c, m) == x:
+            superior = medio
+        else:
+            inferior = medio + 1
+    return inferior
+
+
+def detectar_ciclo_brent(a: int, c: int, m: int, semilla: int,
+                         tam_bloque: int = 2**20) -> Tuple[int, int]:
+    """
+    Algoritmo de Brent sobre el estado entero del congruencial
+    
+    La tortuga se fija en X(t) y la liebre recorre X(t+1), ..., X(t+P)
+    por bloques vectorizados; si no hay encuentro, la tortuga salta a
+    X(t+P) y P se duplica. No se almacena la secuencia: sólo un bloque.
+    
+    Args:
+        a: Multiplicador
+        c: Incremento
+        m: Módulo
+        semilla: Estado inicial X(0)
+        tam_bloque: Estados generados por bloque
+    
+    Returns:
+        Tupla (cola, periodo)
+    """
+    tortuga, posicion, potencia = semilla % m, 0, 1
+    periodo = None
+    
+    while periodo is None:
+        x, recorridos = tortuga, 0
+        while recorridos < potencia:
+            tam = min(tam_bloque, potencia - recorridos)
+            bloque = estados_lcg(x, tam, a, c, m)
+            coincidencias = np.flatnonzero(bloque == np.uint64(tortuga))
+            if len(coincidencias):
+                periodo = recorridos + int(coincidencias[0]) + 1
+                break
+            recorridos += tam
+            x = int(bloque[-1])
+        else:
+            tortuga, posicion, potencia = x, posicion + potencia, potencia * 2
+    
+    # La tortuga X(posicion) ya está en el ciclo, así que cola <= posicion
+    cola = _buscar_cola(a, c, m, semilla % m, periodo, posicion)
+    return cola, periodo
+
+
+def periodo_exacto(a: int, c: int, m: int, semilla: int) -> Tuple[int, int]:
+    """
+    Periodo y cola exactos por factorización de m (sin recorrer la secuencia)
+    
+    Por el teorema chino del residuo basta estudiar cada potencia p^e de m:
+    si p divide a, la secuencia módulo p^e es constante tras e pasos; si no,
+    la transformación es biyectiva y su orden divide p^e * lambda(p^e).
+    Partiendo de ese múltiplo N del periodo se eliminan factores primos
+    mientras X(k + N/q) == X(k) siga cumpliéndose.
+    
+    Args:
+        a: Multiplicador
+        c: Incremento
+        m: Módulo
+        semilla: Estado inicial X(0)
+    
+    Returns:
+        Tupla (cola, periodo)
+    """
+    factores_m = factorizar(m)
+    cota_cola = max((e for p, e in factores_m.items() if a % p == 0), default=0)
+    
+    # Múltiplo del periodo y su factorización
+    factores_n = {}
+    for p, e in factores_m.items():
+        if a % p == 0:
+            continue
+        # p^e * lambda(p^e), con lambda la función de Carmichael
+        candidatos = {p: 2 * e - 1}
+        if p == 2:
+            candidatos[2] = 2 * e - 2 if e >= 3 else 2 * e - 1
+        else:
+            for q, f in factorizar(p - 1).items():
+                candidatos[q] = candidatos.get(q, 0) + f
+        for q, f in candidatos.items():
+            factores_n[q] = max(factores_n.get(q, 0), f)
+    
+    n = 1
+    for q, f in factores_n.items():
+        n *= q ** f
+    
+    y = _aplicar_salto(semilla % m, cota_cola, a, c, m)
+    for q in factores_n:
+        while n % q == 0 and _aplicar_salto(y, n // q, a, c, m) == y:
+            n //= q
+    
+    cola = _buscar_cola(a, c, m, semilla % m, n, cota_cola)
+    return cola, n
+
+
+def analizar_parametros(a: int, c: int, m: int, semilla: int = 1234,
+                        metodo: str = 'exacto') -> Dict:
+    """
+    Analiza un conjunto de parámetros (a, c, m) antes de usarlo
+    
+    Si se cumplen las condiciones de Hull-Dobell el periodo es m sin más
+    cálculo; en otro caso se obtienen el periodo y la cola de la semilla.
+    
+    Args:
+        a: Multiplicador
+        c: Incremento
+        m: Módulo
+        semilla: Semilla a analizar
+        metodo: 'exacto' (factorización, segundos para cualquier m) o
+                'brent' (recorrido O(mu + lambda), para m moderados)
+    
+    Returns:
+        Diccionario con las condiciones, el periodo y la cola
+    """
+    resultado = verificar_hull_dobell(a, c, m)
+    resultado['semilla'] = semilla
+    
+    if resultado['periodo_completo']:
+        cola, periodo, metodo = 0, m, 'hull-dobell'
+    elif metodo == 'exacto':
+        cola, periodo = periodo_exacto(a, c, m, semilla)
+    elif metodo == 'brent':
+        cola, periodo = detectar_ciclo_brent(a, c, m, semilla)
+    else:
+        raise ValueError(f"Método '{metodo}' no soportado")
+    
+    resultado.update({
+        'metodo': metodo,
+        'periodo': periodo,
+        'cola': cola,
+        'fraccion_de_m': periodo / m
+    })
+    return resultado
+
+
+@lru_cache(maxsize=1024)
+def longitud_sin_repeticion(a: int, c: int, m: int, semilla: int) -> int:
+    """
+    Cantidad de números X(1), X(2), ... que produce la semilla antes de
+    repetir alguno: periodo + cola - 1 (periodo si no hay cola)
+    
+    Es la longitud máxima que pueden cubrir subflujos disjuntos de una
+    misma semilla. Con c = 0 y m potencia de 2 es a lo más m/4, y un
+    multiplicador que no cumple las condiciones da ciclos más cortos.
+    
+    Args:
+        a: Multiplicador
+        c: Incremento
+        m: Módulo
+        semilla: Estado inicial X(0)
+    
+    Returns:
+        Longitud sin repeticiones
+    """
+    if verificar_hull_dobell(a, c, m)['periodo_completo']:
+        return m
+    cola, periodo = periodo_exacto(a, c, m, semilla)
+    return periodo + max(cola - 1, 0)
+
+
+def ejemplo_uso():
+    """Ejemplo de análisis de parámetros de congruenciales"""
+    print("=" * 70)
+    print("PERIODO DE GENERADORES CONGRUENCIALES - TecNM")
+    print("=" * 70)
+    
+    casos = [
+        ("Congruencial lineal (ANSI C)", 1103515245, 12345, 2**31),
+        ("Congruencial mixto (Numerical Recipes)", 1664525, 1013904223, 2**32),
+        ("Multiplicativo (Park-Miller)", 16807, 0, 2**31 - 1),
+        ("Incremento par", 1664525, 1013904222, 2**32),
+        ("Multiplicador par", 1664524, 1013904223, 2**32),
+        ("RANDU", 65539, 0, 2**31),
+    ]
+    
+    print(f"\n{'Parámetros':<42}{'Periodo':>14}{'Cola':>6}  Conclusión")
+    print("-" * 70)
+    for nombre, a, c, m in casos:
+        r = analizar_parametros(a, c, m, semilla=12345)
+        print(f"{nombre:<42}{r['periodo']:>14}{r['cola']:>6}  {r['conclusion']}")
+    
+    print("\nVerificación con el algoritmo de Brent (m = 2^20, c par):")
+    r = analizar_parametros(1664525, 2, 2**20, semilla=7, metodo='brent')
+    print(f"   Periodo: {r['periodo']}, cola: {r['cola']}")
+    
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    ejemplo_uso()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Prueba Espectral de Generadores Congruenciales
+Mide la estructura de retícula de las t-tuplas (X(n), ..., X(n+t-1)) en las
+dimensiones 2 a 8 mediante reducción de bases (LLL), sin enumerar puntos
+"""
+
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence
+
+
+# Constantes de Hermite gamma_t: en una retícula de determinante D el vector
+# más corto cumple |v|^2 <= gamma_t * D^(2/t)
+CONSTANTES_HERMITE = {
+    2: (4 / 3) ** 0.5,
+    3: 2 ** (1 / 3),
+    4: 2 ** 0.5,
+    5: 8 ** (1 / 5),
+    6: (64 / 3) ** (1 / 6),
+    7: 64 ** (1 / 7),
+    8: 2.0,
+}
+
+
+# ========== REDUCCIÓN DE RETÍCULAS ==========
+
+def reducir_lll(base: List[List[int]], delta: Sequence[int] = (99, 100)) -> List[List[int]]:
+    """
+    Reducción LLL entera (Cohen, algoritmo 2.6.7)
+    
+    Toda la aritmética es exacta con enteros de Python: en lugar de los
+    coeficientes de Gram-Schmidt se llevan los determinantes d_i y los
+    enteros lambda_ij = d_j * mu_ij, por lo que no hay errores de redondeo
+    aunque las entradas sean del orden de m.
+    
+    Args:
+        base: Vectores linealmente independientes (se modifica en su lugar)
+        delta: Parámetro de Lovász como fracción (numerador, denominador)
+    
+    Returns:
+        La base reducida
+    """
+    n = len(base)
+    num, den = delta
+    d = [1] * (n + 1)               # d[i] = det de Gram de los primeros i vectores
+    lam = [[0] * n for _ in range(n)]
+    
+    def producto(u, v):
+        return sum(x * y for x, y in zip(u, v))
+    
+    def reducir(k, l):
+        # Reducción de tamaño de b_k respecto a b_l
+        if 2 * abs(lam[k][l]) > d[l + 1]:
+            q = (2 * lam[k][l] + d[l + 1]) // (2 * d[l + 1])
+            base[k] = [x - q * y for x, y in zip(base[k], base[l])]
+            lam[k][l] -= q * d[l + 1]
+            for i in range(l):
+                lam[k][i] -= q * lam[l][i]
+    
+    def intercambiar(k, k_max):
+        base[k], base[k - 1] = base[k - 1], base[k]
+        for j in range(k - 1):
+            lam[k][j], lam[k - 1][j] = lam[k - 1][j], lam[k][j]
+        mu = lam[k][k - 1]
+        nuevo = (d[k - 1] * d[k + 1] + mu * mu) // d[k]
+        for i in range(k + 1, k_max + 1):
+            t = lam[i][k]
+            lam[i][k] = (d[k + 1] * lam[i][k - 1] - mu * t) // d[k]
+            lam[i][k - 1] = (nuevo * t + mu * lam[i][k]) // d[k + 1]
+        d[k] = nuevo
+    
+    d[1] = producto(base[0], base[0])
+    k, k_max = 1, 0
+    while k < n:
+        if k > k_max:
+            # Gram-Schmidt incremental del vector k
+            k_max = k
+            for j in range(k + 1):
+                u = producto(base[k], base[j])
+                for i in range(j):
+                    u = (d[i + 1] * u - lam[k][i] * lam[j][i]) // d[i]
+                if j < k:
+                    lam[k][j] = u
+                else:
+                    if u == 0:
+                        raise ValueError("Los vectores de la base son linealmente dependientes")
+                    d[k + 1] = u
+        
+        reducir(k, k - 1)
+        # Condición de Lovász: d_k d_{k-2} >= delta d_{k-1}^2 - lambda^2
+        if den * d[k + 1] * d[k - 1] < num * d[k] ** 2 - den * lam[k][k - 1] ** 2:
+            intercambiar(k, k_max)
+            k = max(1, k - 1)
+        else:
+            for l in range(k - 2, -1, -1):
+                reducir(k, l)
+            k += 1
+    
+    return base
+
+
+def vector_mas_corto(base: List[List[int]]) -> List[int]:
+    """
+    Vector no nulo más corto de una retícula (enumeración de Fincke-Pohst)
+    
+    La base debe estar reducida con LLL, lo que acota fuertemente el
+    árbol de búsqueda. La enumeración usa Gram-Schmidt en punto flotante
+    con un pequeño margen, y la longitud de cada candidato se compara con
+    aritmética entera exacta.
+    
+    Args:
+        base: Base reducida de la retícula
+    
+    Returns:
+        Un vector más corto (como lista de enteros)
+    """
+    n = len(base)
+    estrella = []
+    mu = [[0.0] * n for _ in range(n)]
+    normas = []
+    for i in range(n):
+        v = [float(x) for x in base[i]]
+        for j in range(i):
+            mu[i][j] = sum(x * y for x, y in zip(base[i], estrella[j])) / normas[j]
+            v = [x - mu[i][j] * y for x, y in zip(v, estrella[j])]
+        estrella.append(v)
+        normas.append(sum(x * x for x in v))
+    
+    mejor = list(base[0])
+    mejor_norma = sum(x * x for x in mejor)
+    cota = [mejor_norma * (1 + 1e-9)]
+    x = [0] * n
+    
+    def enumerar(i, parcial):
+        centro = -sum(x[j] * mu[j][i] for j in range(i + 1, n))
+        radio = math.sqrt(max(cota[0] - parcial, 0.0) / normas[i])
+        for xi in range(math.ceil(centro - radio), math.floor(centro + radio) + 1):
+            x[i] = xi
+            nuevo = parcial + (xi - centro) ** 2 * normas[i]
+            if nuevo > cota[0]:
+                continue
+            if i > 0:
+                enumerar(i - 1, nuevo)
+            elif any(x):
+                nonlocal mejor, mejor_norma
+                v = [sum(x[k] * base[k][j] for k in range(n)) for j in range(n)]
+                norma = sum(c * c for c in v)
+                if norma < mejor_norma:
+                    mejor, mejor_norma = v, norma
+                    cota[0] = norma * (1 + 1e-9)
+        x[i] = 0
+    
+    enumerar(n - 1, 0.0)
+    return mejor
+
+
+# ========== PRUEBA ESPECTRAL ==========
+
+def prueba_espectral(a: int, m: int, dimension_maxima: int = 8,
+                     multiplicativo: bool = False) -> Dict:
+    """
+    Prueba espectral de X(n+1) = (a X(n) + c) mod m en dimensiones 2..t
+    
+    Las t-tuplas consecutivas caen en hiperplanos paralelos; la distancia
+    máxima entre ellos es 1 / nu_t, con nu_t la longitud del vector más
+    corto de la retícula dual
+        { u : u_1 + a u_2 + ... + a^(t-1) u_t = 0 (mod m) }.
+    La base de la dimensión t+1 se obtiene de la base reducida de la
+    dimensión t agregando un solo vector, así que cada dimensión parte
+    de una base casi reducida. La figura de mérito S_t = nu_t / cota_t
+    (cota de Hermite) vale 1 para la mejor retícula posible.
+    
+    Args:
+        a: Multiplicador
+        m: Módulo
+        dimension_maxima: Última dimensión a evaluar (2 a 8)
+        multiplicativo: Si c = 0, m es potencia de 2 y a = 5 (mod 8), la
+                        secuencia vive en una clase módulo 4 y la prueba
+                        se aplica con m / 4 (Knuth, 3.3.4)
+    
+    Returns:
+        Diccionario con nu_t^2, distancia entre hiperplanos y S_t por
+        dimensión, y la figura de mérito mínima
+    """
+    if not 2 <= dimension_maxima <= 8:
+        raise ValueError("La dimensión máxima debe estar entre 2 y 8")
+    
+    modulo = m
+    if multiplicativo and m & (m - 1) == 0 and a % 8 == 5:
+        modulo = m // 4
+    
+    dimensiones = {}
+    base = [[modulo]]
+    potencia = 1
+    for t in range(2, dimension_maxima + 1):
+        potencia = potencia * a % modulo
+        base = [v + [0] for v in base]
+        base.append([-potencia % modulo] + [0] * (t - 2) + [1])
+        base = reducir_lll(base)
+        corto = vector_mas_corto(base)
+        nu2 = sum(x * x for x in corto)
+        nu = math.sqrt(nu2)
+        dimensiones[t] = {
+            'nu2': nu2,
+            'vector': corto,
+            'distancia_hiperplanos': 1 / nu,
+            'figura_merito': nu / (math.sqrt(CONSTANTES_HERMITE[t]) * modulo ** (1 / t))
+        }
+    
+    return {
+        'a': a,
+        'm': m,
+        'modulo_efectivo': modulo,
+        'dimensiones': dimensiones,
+        'figura_merito_minima': min(d['figura_merito'] for d in dimensiones.values())
+    }
+
+
+def _evaluar(argumentos) -> Dict:
+    """Envoltura para el grupo de procesos"""
+    a, m, dimension_maxima, multiplicativo = argumentos
+    r = prueba_espectral(a, m, dimension_maxima, multiplicativo)
+    return {
+        'a': a,
+        'figura_merito_minima': r['figura_merito_minima'],
+        'figuras_merito': {t: d['figura_merito'] for t, d in r['dimensiones'].items()}
+    }
+
+
+def evaluar_multiplicadores(multiplicadores: Sequence[int], m: int,
+                            dimension_maxima: int = 8, multiplicativo: bool = False,
+                            procesos: int = None) -> List[Dict]:
+    """
+    Aplica la prueba espectral a muchos multiplicadores en paralelo
+    
+    Args:
+        multiplicadores: Valores candidatos de a
+        m: Módulo común
+        dimension_maxima: Última dimensión a evaluar
+        multiplicativo: Ver prueba_espectral
+        procesos: Procesos del grupo (None = núcleos disponibles; 1 = serial)
+    
+    Returns:
+        Lista de resultados ordenada de mejor a peor figura de mérito mínima
+    """
+    tareas = [(a, m, dimension_maxima, multiplicativo) for a in multiplicadores]
+    procesos = procesos or os.cpu_count() or 1
+    
+    if procesos == 1:
+        resultados = list(map(_evaluar, tareas))
+    else:
+        bloque = max(1, len(tareas) // (4 * procesos))
+        with ProcessPoolExecutor(max_workers=procesos) as grupo:
+            resultados = list(grupo.map(_evaluar, tareas, chunksize=bloque))
+    
+    resultados.sort(key=lambda r: r['figura_merito_minima'], reverse=True)
+    return resultados
+
+
+def ejemplo_uso():
+    """Ejemplo de la prueba espectral"""
+    print("=" * 70)
+    print("PRUEBA ESPECTRAL DE GENERADORES CONGRUENCIALES - TecNM")
+    print("=" * 70)
+    
+    casos = [
+        ("Congruencial lineal (ANSI C)", 1103515245, 2**31, False),
+        ("Multiplicativo (Park-Miller)", 16807, 2**31 - 1, True),
+        ("Multiplicativo (MINSTD 48271)", 48271, 2**31 - 1, True),
+        ("Congruencial mixto (Numerical Recipes)", 1664525, 2**32, False),
+        ("RANDU", 65539, 2**31, True),
+    ]
+    
+    print(f"\n{'Generador':<40}" + "".join(f"{'S' + str(t):>6}" for t in range(2, 9)))
+    print("-" * 82)
+    for nombre, a, m, multiplicativo in casos:
+        r = prueba_espectral(a, m, 8, multiplicativo)
+        print(f"{nombre:<40}" + "".join(
+            f"{d['figura_merito']:>6.3f}" for d in r['dimensiones'].values()))
+    
+    r = prueba_espectral(65539, 2**31, 3, True)
+    print(f"\nRANDU en 3D: vector dual {r['dimensiones'][3]['vector']}, "
+          f"{1 / r['dimensiones'][3]['distancia_hiperplanos'] ** 2:.0f} = nu^2")
+    
+    print("\nBúsqueda de multiplicadores para m = 2^31 - 1 (1000 candidatos):")
+    random.seed(5735)
+    candidatos = [random.randrange(2, 2**31 - 1) for _ in range(1000)]
+    inicio = time.perf_counter()
+    mejores = evaluar_multiplicadores(candidatos, 2**31 - 1, dimension_maxima=6)
+    print(f"   Tiempo: {time.perf_counter() - inicio:.2f} s")
+    for r in mejores[:5]:
+        print(f"   a = {r['a']:>10}  S_min(2..6) = {r['figura_merito_minima']:.4f}")
+    
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    ejemplo_uso()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Pruebas de Segundo Nivel
+Aplica la batería de PruebasEstadisticas a miles de semillas o subflujos
+de un generador y prueba la uniformidad de los p-valores obtenidos, con
+caché en disco para reanudar campañas interrumpidas
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from fuente_uniforme import FuenteLCG, FuenteUniforme, como_fuente
+from generador_contador import GeneradorPhilox
+from generador_pseudoaleatorios import GeneradorPseudoaleatorios
+from generadores_modernos import MRG32k3a, PCG64, Xoshiro256SS
+from pruebas_estadisticas import PruebasEstadisticas
+
+
+# Generadores registrados: nombre -> {'fabrica': f(semilla, parametros),
+# 'subflujo': f(semilla, i, longitud, parametros) o None}; ambas
+# funciones devuelven una FuenteUniforme
+GENERADORES: Dict[str, Dict[str, Callable]] = {}
+
+BATERIAS = {
+    'basica': PruebasEstadisticas.ejecutar_todas_pruebas,
+    'extendida': PruebasEstadisticas.ejecutar_bateria_extendida,
+}
+
+# Números por réplica: mínimo que admite cada batería y valor por omisión
+MINIMO_NUMEROS = {'basica': 1, 'extendida': 2**15}
+N_POR_OMISION = 10**4
+
+
+def registrar_generador(nombre: str, fabrica: Callable[[int, Dict], FuenteUniforme],
+                        subflujo: Callable[[int, int, int, Dict], FuenteUniforme] = None):
+    """
+    Agrega un generador a las campañas
+    
+    Args:
+        nombre: Nombre del generador
+        fabrica: Función (semilla, parametros) -> fuente uniforme
+        subflujo: Función (semilla, i, longitud, parametros) -> fuente del
+                  i-ésimo subflujo; None si el generador no los soporta
+    """
+    GENERADORES[nombre] = {'fabrica': fabrica, 'subflujo': subflujo}
+
+
+def _parametros_lcg(metodo: str, parametros: Dict):
+    a, c, m = GeneradorPseudoaleatorios.PARAMETROS_CONGRUENCIALES[metodo]
+    return parametros.get('a', a), parametros.get('c', c), parametros.get('m', m)
+
+
+def _fuente_philox(semilla: int, entidad: int) -> FuenteUniforme:
+    """Índices 0, 1, 2, ... de una entidad de Philox como fuente uniforme"""
+    generador = GeneradorPhilox(semilla)
+    siguiente = [0]
+    
+    def producir(n):
+        indices = np.arange(siguiente[0], siguiente[0] + n, dtype=np.uint64)
+        siguiente[0] += n
+        return generador.uniformes(0, entidad, indices)
+    
+    return FuenteUniforme(producir)
+
+
+for _metodo in GeneradorPseudoaleatorios.PARAMETROS_CONGRUENCIALES:
+    registrar_generador(
+        _metodo,
+        lambda s, p, m=_metodo: FuenteLCG(s, *_parametros_lcg(m, p)),
+        lambda s, i, longitud, p, m=_metodo: FuenteLCG(s, *_parametros_lcg(m, p)).subflujo(i, longitud))
+for _clase in (PCG64, Xoshiro256SS, MRG32k3a):
+    registrar_generador(
+        _clase.__name__,
+        lambda s, p, c=_clase: como_fuente(c(s, guardar_historial=False,
+                                             calcular_estadisticas=False)),
+        # Cada subflujo tiene LONGITUD_SUBFLUJO números, mucho más que cualquier n
+        lambda s, i, longitud, p, c=_clase: como_fuente(
+            c(s, guardar_historial=False, calcular_estadisticas=False).subflujo(i)))
+registrar_generador('Philox4x32', lambda s, p: _fuente_philox(s, 0),
+                    lambda s, i, longitud, p: _fuente_philox(s, i))
+
+
+def _replica(argumentos) -> Dict:
+    """Ejecuta la batería sobre una réplica (en un proceso del grupo)"""
+    generador, parametros, modo, semilla_inicial, indice, n, bateria = argumentos
+    if modo == 'semillas':
+        fuente = GENERADORES[generador]['fabrica'](semilla_inicial + indice, parametros)
+    else:
+        fuente = GENERADORES[generador]['subflujo'](semilla_inicial, indice, n, parametros)
+    resultados = BATERIAS[bateria](fuente.llenar(n))
+    return {'indice': indice,
+            'p_valores': {nombre: r['p_valor'] for nombre, r in resultados.items()}}
+
+
+def ruta_cache(directorio: str, configuracion: Dict) -> str:
+    """
+    Archivo de caché de una configuración
+    
+    La clave depende del generador, sus parámetros, el modo, la semilla
+    inicial, n y la batería, pero no de la cantidad de réplicas: ampliar
+    el rango de semillas reutiliza las réplicas ya calculadas.
+    
+    Args:
+        directorio: Directorio de la caché
+        configuracion: Configuración de la campaña
+    
+    Returns:
+        Ruta del archivo JSON lines
+    """
+    texto = json.dumps(configuracion, sort_keys=True)
+    clave = hashlib.sha256(texto.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(directorio, f"{configuracion['generador']}_{clave}.jsonl")
+
+
+def _leer_cache(ruta: str) -> Dict[int, Dict[str, float]]:
+    """Réplicas guardadas; se ignora una última línea truncada por una interrupción"""
+    guardadas = {}
+    if not os.path.exists(ruta):
+        return guardadas
+    with open(ruta, encoding='utf-8') as archivo:
+        for linea in archivo:
+            try:
+                registro = json.loads(linea)
+            except json.JSONDecodeError:
+                continue
+            if 'indice' in registro:
+                guardadas[registro['indice']] = registro['p_valores']
+    return guardadas
+
+
+def _termina_incompleto(ruta: str) -> bool:
+    """Indica si la última línea quedó sin salto de línea"""
+    with open(ruta, 'rb') as archivo:
+        archivo.seek(0, os.SEEK_END)
+        if archivo.tell() == 0:
+            return False
+        archivo.seek(-1, os.SEEK_END)
+        return archivo.read(1) != b'\n'
+
+
+def segundo_nivel(p_valores: List[float], metodo: str = 'ks', alpha: float = 0.05,
+                  k: int = 10) -> Dict:
+    """
+    Prueba de uniformidad de los p-valores de muchas réplicas
+    
+    Args:
+        p_valores: p-valores de primer nivel
+        metodo: 'ks' (Kolmogorov-Smirnov) o 'chi' (Chi-cuadrada con k clases)
+        alpha: Nivel de significancia del primer y segundo nivel
+        k: Clases de la Chi-cuadrada
+    
+    Returns:
+        Diccionario con la tasa de aprobación y el resultado de segundo nivel
+    """
+    p = np.asarray(p_valores, dtype=np.float64)
+    if metodo == 'ks':
+        prueba = PruebasEstadisticas.prueba_kolmogorov_smirnov(p, alpha)
+    elif metodo == 'chi':
+        prueba = PruebasEstadisticas.prueba_chi_cuadrada(p, k, alpha)
+    else:
+        raise ValueError(f"Método de segundo nivel '{metodo}' no soportado; use 'ks' o 'chi'")
+    
+    return {
+        'replicas': len(p),
+        'tasa_aprobacion': float(np.mean(p >= alpha)) if len(p) else None,
+        'segundo_nivel': prueba,
+        'p_valor': prueba['p_valor'],
+        'acepta_h0': prueba['acepta_h0'],
+        'conclusion': prueba['conclusion']
+    }
+
+
+def ejecutar_campana(generador: str = 'congruencial_lineal', replicas: int = 1000,
+                     n: int = None, modo: str = 'semillas', semilla_inicial: int = 1,
+                     bateria: str = 'basica', parametros: Dict = None,
+                     segundo_nivel_metodo: str = 'ks', alpha: float = 0.05,
+                     directorio_cache: str = None, procesos: int = None,
+                     progreso: bool = False) -> Dict:
+    """
+    Campaña de pruebas de segundo nivel
+    
+    La réplica i usa la semilla semilla_inicial + i (modo 'semillas') o el
+    i-ésimo subflujo de longitud n de semilla_inicial (modo 'subflujos').
+    Cada réplica terminada se agrega de inmediato al archivo de caché, así
+    que una campaña interrumpida continúa donde se quedó.
+    
+    Args:
+        generador: Nombre registrado en GENERADORES
+        replicas: Cantidad de réplicas (índices 0 a replicas - 1)
+        n: Números por réplica (None = N_POR_OMISION, o el mínimo de la
+           batería si es mayor)
+        modo: 'semillas' o 'subflujos'
+        semilla_inicial: Semilla base
+        bateria: 'basica' (ejecutar_todas_pruebas) o 'extendida'
+        parametros: Parámetros del generador (p. ej. {'a': ..., 'm': ...})
+        segundo_nivel_metodo: 'ks' o 'chi'
+        alpha: Nivel de significancia
+        directorio_cache: Directorio de la caché (None = temporal del sistema)
+        procesos: Procesos del grupo (None = núcleos disponibles; 1 = serial)
+        progreso: Imprime el avance en stderr
+    
+    Returns:
+        Diccionario con la configuración, el resultado de segundo nivel por
+        prueba y la cantidad de réplicas calculadas y leídas de la caché
+    """
+    if generador not in GENERADORES:
+        raise ValueError(f"Generador '{generador}' no registrado; use uno de {sorted(GENERADORES)}")
+    if modo not in ('semillas', 'subflujos'):
+        raise ValueError("El modo debe ser 'semillas' o 'subflujos'")
+    if modo == 'subflujos' and GENERADORES[generador]['subflujo'] is None:
+        raise ValueError(f"El generador '{generador}' no soporta subflujos")
+    if bateria not in BATERIAS:
+        raise ValueError(f"Batería '{bateria}' no soportada; use una de {sorted(BATERIAS)}")
+    if n is None:
+        n = max(N_POR_OMISION, MINIMO_NUMEROS[bateria])
+    if n < MINIMO_NUMEROS[bateria]:
+        raise ValueError(f"La batería '{bateria}' necesita al menos "
+                         f"{MINIMO_NUMEROS[bateria]} números por réplica (n = {n})")
+    
+    parametros = parametros or {}
+    configuracion = {
+        'generador': generador,
+        'parametros': parametros,
+        'modo': modo,
+        'semilla_inicial': semilla_inicial,
+        'n': n,
+        'bateria': bateria
+    }
+    directorio = directorio_cache or os.path.join(tempfile.gettempdir(), 'segundo_nivel')
+    os.makedirs(directorio, exist_ok=True)
+    ruta = ruta_cache(directorio, configuracion)
+    
+    guardadas = _leer_cache(ruta)
+    pendientes = [i for i in range(replicas) if i not in guardadas]
+    en_cache = replicas - len(pendientes)
+    
+    if pendientes:
+        tareas = [(generador, parametros, modo, semilla_inicial, i, n, bateria)
+                  for i in pendientes]
+        procesos = procesos or os.cpu_count() or 1
+        nuevo = not os.path.exists(ruta)
+        truncado = not nuevo and _termina_incompleto(ruta)
+        with open(ruta, 'a', encoding='utf-8') as archivo:
+            if nuevo:
+                archivo.write(json.dumps({'configuracion': configuracion}) + '\n')
+            elif truncado:
+                archivo.write('\n')
+            
+            def guardar(resultados):
+                for hechas, registro in enumerate(resultados, 1):
+                    guardadas[registro['indice']] = registro['p_valores']
+                    archivo.write(json.dumps(registro) + '\n')
+                    archivo.flush()
+                    if progreso and hechas % max(1, len(tareas) // 20) == 0:
+                        print(f"{generador}: {hechas}/{len(tareas)} réplicas", file=sys.stderr)
+            
+            if procesos == 1:
+                guardar(map(_replica, tareas))
+            else:
+                bloque = max(1, len(tareas) // (4 * procesos))
+                with ProcessPoolExecutor(max_workers=procesos) as grupo:
+                    guardar(grupo.map(_replica, tareas, chunksize=bloque))
+    
+    nombres = list(guardadas[0]) if replicas else []
+    pruebas = {
+        nombre: segundo_nivel([guardadas[i][nombre] for i in range(replicas)],
+                              segundo_nivel_metodo, alpha)
+        for nombre in nombres
+    }
+    
+    return {
+        'configuracion': {**configuracion, 'replicas': replicas},
+        'pruebas': pruebas,
+        'replicas_calculadas': len(pendientes),
+        'replicas_en_cache': en_cache,
+        'archivo_cache': ruta
+    }
+
+
+def ejemplo_uso():
+    """Ejemplo de campañas de segundo nivel"""
+    print("=" * 70)
+    print("PRUEBAS DE SEGUNDO NIVEL - TecNM")
+    print("=" * 70)
+    
+    directorio = os.path.join(tempfile.gettempdir(), 'segundo_nivel_ejemplo')
+    
+    for generador, modo in (('congruencial_lineal', 'subflujos'), ('PCG64', 'semillas')):
+        print(f"\n{generador} ({modo}), 500 réplicas de 10^4 números:")
+        inicio = time.perf_counter()
+        campana = ejecutar_campana(generador, replicas=500, n=10**4, modo=modo,
+                                   directorio_cache=directorio)
+        print(f"   Tiempo: {time.perf_counter() - inicio:.2f} s "
+              f"(calculadas: {campana['replicas_calculadas']}, "
+              f"en caché: {campana['replicas_en_cache']})")
+        print(f"   {'Prueba':<22}{'Aprobación':>12}{'p (KS)':>10}  Conclusión")
+        for nombre, r in campana['pruebas'].items():
+            print(f"   {nombre:<22}{r['tasa_aprobacion']:>12.3f}{r['p_valor']:>10.4f}  "
+                  f"{r['conclusion']}")
+    
+    print("\nSe repite la primera campaña con 600 réplicas (reanuda desde la caché):")
+    campana = ejecutar_campana('congruencial_lineal', replicas=600, n=10**4,
+                               modo='subflujos', directorio_cache=directorio)
+    print(f"   Calculadas: {campana['replicas_calculadas']}, "
+          f"en caché: {campana['replicas_en_cache']}")
+    
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    ejemplo_uso()
@@ -5,13 +5,264 @@ Implementa pruebas de uniformidad, independencia y aleatoriedad
 """
 
 import math
-from typing import List, Tuple, Dict
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Tuple
 from collections import Counter
 
+import numpy as np
+from scipy import fft
+
+from fuente_uniforme import FuenteLCG
+from valores_criticos import (critico_chi2, critico_ks, critico_normal,
+                              p_valor_chi2, p_valor_ks, p_valor_normal, p_valor_poisson)
+
+
+# ========== AUXILIARES VECTORIZADAS ==========
+
+def _como_arreglo(numeros) -> np.ndarray:
+    """Vista float64 de los números (sin copia si ya es un arreglo float64)"""
+    return np.asarray(numeros, dtype=np.float64).reshape(-1)
+
+
+def _frecuencias_chi(x: np.ndarray, k: int) -> np.ndarray:
+    """Frecuencia de cada una de las k clases [i/k, (i+1)/k); el 1 va a la última"""
+    clases = (x * k).astype(np.int64)
+    np.minimum(clases, k - 1, out=clases)
+    return np.bincount(clases, minlength=k)
+
+
+def _estadistico_ks(x: np.ndarray) -> float:
+    """D de Kolmogorov-Smirnov contra la U(0,1) (ordena una copia de x)"""
+    x = np.sort(x)
+    n = len(x)
+    
+    # D = max|F(x) - S(x)| con F(x) = x y S la distribución empírica:
+    # D+ = max(i/n - x_(i)) y D- = max(x_(i) - (i-1)/n)
+    d_mas = d_menos = 0.0
+    if n:
+        s_x = np.arange(1, n + 1, dtype=np.float64)
+        s_x /= n
+        d_mas = np.subtract(s_x, x, out=s_x).max()
+        s_x = np.arange(0, n, dtype=np.float64)
+        s_x /= n
+        d_menos = np.subtract(x, s_x, out=s_x).max()
+    return float(max(d_mas, d_menos, 0))
+
+
+def _contar_corridas(x: np.ndarray) -> int:
+    """
+    Corridas arriba y abajo: 1 más el número de cambios de dirección,
+    donde la dirección previa al primer paso se toma como "arriba"
+    """
+    return _total_corridas(_estado_corridas(x))
+
+
+def _estado_corridas(x: np.ndarray) -> Dict:
+    """
+    Estado de las corridas de un tramo: valores y direcciones en los
+    extremos y cambios de dirección internos
+    """
+    if len(x) == 0:
+        return {'primero': None, 'ultimo': None, 'primera_dir': None,
+                'ultima_dir': None, 'cambios': 0}
+    arriba = x[1:] > x[:-1]
+    return {
+        'primero': float(x[0]),
+        'ultimo': float(x[-1]),
+        'primera_dir': bool(arriba[0]) if len(arriba) else None,
+        'ultima_dir': bool(arriba[-1]) if len(arriba) else None,
+        'cambios': int(np.count_nonzero(arriba[1:] != arriba[:-1]))
+    }
+
+
+def _unir_corridas(a: Dict, b: Dict) -> Dict:
+    """Estado de las corridas del tramo a seguido del tramo b"""
+    if a['primero'] is None:
+        return b
+    if b['primero'] is None:
+        return a
+    
+    # Paso que cruza la frontera entre los tramos
+    frontera = b['primero'] > a['ultimo']
+    cambios = a['cambios'] + b['cambios']
+    if a['ultima_dir'] is not None and a['ultima_dir'] != frontera:
+        cambios += 1
+    if b['primera_dir'] is not None and b['primera_dir'] != frontera:
+        cambios += 1
+    
+    return {
+        'primero': a['primero'],
+        'ultimo': b['ultimo'],
+        'primera_dir': a['primera_dir'] if a['primera_dir'] is not None else frontera,
+        'ultima_dir': b['ultima_dir'] if b['ultima_dir'] is not None else frontera,
+        'cambios': cambios
+    }
+
+
+def _total_corridas(estado: Dict) -> int:
+    """Número de corridas a partir del estado de un tramo"""
+    return 1 + int(estado['primera_dir'] is False) + estado['cambios']
+
+
+def _tramos(x: np.ndarray, tam: int) -> Iterable[np.ndarray]:
+    """Vistas consecutivas de x de a lo más tam elementos"""
+    for inicio in range(0, len(x), tam):
+        yield x[inicio:inicio + tam]
+
+
+def _tam_grupos(grupo: int) -> int:
+    """Tamaño de tramo múltiplo de grupo, cercano a PruebasEstadisticas.TAM_BLOQUE"""
+    return max(1, PruebasEstadisticas.TAM_BLOQUE // grupo) * grupo
+
+
+def _celdas(x: np.ndarray, d: int) -> np.ndarray:
+    """Celda floor(d u) de cada número, en 0..d-1"""
+    celdas = (x * d).astype(np.int64)
+    np.clip(celdas, 0, d - 1, out=celdas)
+    return celdas
+
+
+def _tarea_paralela(argumentos) -> Tuple[str, int, object, float]:
+    """
+    Parte de una prueba sobre un tramo del arreglo en memoria compartida
+    
+    Se ejecuta en un proceso del grupo: se conecta al bloque por su nombre,
+    calcula el conteo parcial del tramo [inicio, fin) y devuelve también
+    el tiempo empleado.
+    """
+    nombre, n, prueba, inicio, fin, k, digitos = argumentos
+    memoria = shared_memory.SharedMemory(name=nombre)
+    try:
+        x = np.ndarray((n,), dtype=np.float64, buffer=memoria.buf)[inicio:fin]
+        reloj = time.perf_counter()
+        if prueba == 'chi_cuadrada':
+            parcial = _frecuencias_chi(x, k)
+        elif prueba == 'kolmogorov_smirnov':
+            parcial = _estadistico_ks(x)
+        elif prueba == 'corridas':
+            parcial = _estado_corridas(x)
+        else:
+            parcial = _conteo_poker(x, digitos)
+        tiempo = time.perf_counter() - reloj
+        del x  # la vista debe liberarse antes de cerrar la memoria
+    finally:
+        memoria.close()
+    return prueba, inicio, parcial, tiempo
+
+
+# Nombre de cada patrón de póker (repeticiones mayores que 1 de la mano)
+NOMBRES_POKER = {
+    (): 'TD',       # Todos diferentes
+    (2,): '1P',     # Un par
+    (2, 2): '2P',   # Dos pares
+    (3,): 'T',      # Tercia
+    (3, 2): 'TP',   # Tercia y par (full)
+    (4,): 'P',      # Póker
+    (5,): 'Q',      # Quintilla
+}
+
+# La tabla de clasificación tiene 10^d entradas (y se arma con una matriz
+# de 10^d x 10); con 7 dígitos ya ocupa cientos de MB en la caché
+DIGITOS_MAXIMOS_POKER = 6
+
+
+def _particiones(n: int, maximo: int = None) -> List[Tuple[int, ...]]:
+    """Particiones de n en partes no crecientes"""
+    maximo = n if maximo is None else maximo
+    if n == 0:
+        return [()]
+    return [(parte,) + resto for parte in range(min(n, maximo), 0, -1)
+            for resto in _particiones(n - parte, parte)]
+
+
+@lru_cache(maxsize=None)
+def _stirling2(n: int, k: int) -> int:
+    """Número de Stirling de segunda clase S(n, k)"""
+    if n == k:
+        return 1
+    if k == 0 or k > n:
+        return 0
+    return k * _stirling2(n - 1, k) + _stirling2(n - 1, k - 1)
+
+
+@lru_cache(maxsize=None)
+def _categorias_poker(digitos: int) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+    """
+    Categorías, probabilidades y tabla de clasificación del póker de d dígitos
+    
+    Una mano con r dígitos distintos tiene probabilidad
+        10 (10-1) ... (10-r+1) S(d, r) / 10^d
+    y cada patrón (p. ej. 2-2-1) se lleva la fracción de las S(d, r)
+    particiones del conjunto de posiciones que tienen su forma:
+        d! / (prod(partes!) prod(multiplicidades!)).
+    La tabla asigna su categoría a cada una de las 10^d manos; se arma
+    extrayendo los dígitos con aritmética entera.
+    
+    Returns:
+        (nombres, probabilidades, tabla) con las categorías ordenadas de
+        TD hacia la de mayor repetición
+    """
+    if not 2 <= digitos <= DIGITOS_MAXIMOS_POKER:
+        raise ValueError(f"La prueba de póker admite de 2 a {DIGITOS_MAXIMOS_POKER} "
+                         f"dígitos (se pidieron {digitos})")
+    patrones = sorted(_particiones(digitos))
+    nombres, probabilidades = [], []
+    for patron in patrones:
+        r = len(patron)
+        distintas = math.perm(10, r) * _stirling2(digitos, r)
+        forma = math.factorial(digitos)
+        for parte in patron:
+            forma //= math.factorial(parte)
+        for multiplicidad in Counter(patron).values():
+            forma //= math.factorial(multiplicidad)
+        probabilidades.append(distintas * forma / _stirling2(digitos, r) / 10 ** digitos)
+        clave = tuple(parte for parte in patron if parte > 1)
+        nombres.append(NOMBRES_POKER.get(clave) or '-'.join(map(str, patron)))
+    
+    # Conteo de cada dígito en cada mano -> patrón ordenado -> categoría
+    manos = np.arange(10 ** digitos, dtype=np.int64)
+    repeticiones = np.zeros((len(manos), 10), dtype=np.int64)
+    for _ in range(digitos):
+        repeticiones[np.arange(len(manos)), manos % 10] += 1
+        manos //= 10
+    repeticiones = -np.sort(-repeticiones, axis=1)[:, :digitos]
+    codigos = repeticiones @ (digitos + 1) ** np.arange(digitos - 1, -1, -1, dtype=np.int64)
+    codigos_patron = np.array([sum(c * (digitos + 1) ** (digitos - 1 - i)
+                                   for i, c in enumerate(patron + (0,) * (digitos - len(patron))))
+                               for patron in patrones], dtype=np.int64)
+    orden = np.argsort(codigos_patron)
+    tabla = orden[np.searchsorted(codigos_patron, codigos, sorter=orden)].astype(np.intp)
+    
+    return tuple(nombres), np.array(probabilidades), tabla
+
+
+def _conteo_poker(x: np.ndarray, digitos: int) -> np.ndarray:
+    """
+    Conteo de manos por categoría con los primeros dígitos decimales
+    
+    Se cuenta cada una de las 10^d manos posibles (por tramos) y luego se
+    agrupan los conteos por categoría con la tabla precalculada.
+    """
+    nombres, _, tabla = _categorias_poker(digitos)
+    escala = 10 ** digitos
+    por_mano = np.zeros(escala, dtype=np.int64)
+    for tramo in _tramos(x, PruebasEstadisticas.TAM_BLOQUE):
+        manos = (tramo * escala).astype(np.int64)
+        np.clip(manos, 0, escala - 1, out=manos)
+        por_mano += np.bincount(manos, minlength=escala)
+    return np.bincount(tabla, weights=por_mano, minlength=len(nombres)).astype(np.int64)
+
 
 class PruebasEstadisticas:
     """Clase para realizar pruebas estadísticas a números pseudoaleatorios"""
     
+    # Tablas de referencia de los libros de texto (α = 0.05); las pruebas
+    # calculan el valor crítico y el p-valor exactos con valores_criticos
+    
     # Valores críticos de Chi-cuadrada (α = 0.05)
     CHI_CUADRADA_CRITICOS = {
         1: 3.841, 2: 5.991, 3: 7.815, 4: 9.488, 5: 11.070,
@@ -41,14 +292,18 @@ class PruebasEstadisticas:
         Returns:
             Diccionario con resultados de la prueba
         """
-        n = len(numeros)
-        frecuencias_observadas = [0] * k
-        frecuencia_esperada = n / k
+        x = _como_arreglo(numeros)
         
         # Contar frecuencias observadas
-        for num in numeros:
-            clase = min(int(num * k), k - 1)
-            frecuencias_observadas[clase] += 1
+        frecuencias_observadas = _frecuencias_chi(x, k).tolist()
+        return PruebasEstadisticas._resultado_chi(frecuencias_observadas, alpha)
+    
+    @staticmethod
+    def _resultado_chi(frecuencias_observadas: List[int], alpha: float) -> Dict:
+        """Estadístico y decisión de la prueba Chi-cuadrada a partir de las frecuencias"""
+        k = len(frecuencias_observadas)
+        n = sum(frecuencias_observadas)
+        frecuencia_esperada = n / k
         
         # Calcular estadístico Chi-cuadrada
         chi_cuadrado = sum(
@@ -59,20 +314,19 @@ class PruebasEstadisticas:
         # Grados de libertad
         gl = k - 1
         
-        # Valor crítico
-        valor_critico = PruebasEstadisticas.CHI_CUADRADA_CRITICOS.get(gl, None)
-        if valor_critico is None and gl > 20:
-            # Aproximación para gl > 20
-            valor_critico = gl + math.sqrt(2 * gl) * 1.645
+        # Valor crítico y p-valor
+        valor_critico = critico_chi2(alpha, gl)
+        p_valor = p_valor_chi2(chi_cuadrado, gl)
         
         # Decisión
-        acepta_h0 = chi_cuadrado < valor_critico if valor_critico else None
+        acepta_h0 = chi_cuadrado < valor_critico
         
         return {
             'prueba': 'Chi-cuadrada',
             'estadistico': chi_cuadrado,
             'grados_libertad': gl,
             'valor_critico': valor_critico,
+            'p_valor': p_valor,
             'nivel_significancia': alpha,
             'acepta_h0': acepta_h0,
             'conclusion': 'ACEPTA uniformidad' if acepta_h0 else 'RECHAZA uniformidad',
@@ -93,33 +347,15 @@ class PruebasEstadisticas:
         Returns:
             Diccionario con resultados de la prueba
         """
-        n = len(numeros)
-        numeros_ordenados = sorted(numeros)
-        
-        # Calcular D = max|F(x) - S(x)|
-        d_max = 0
-        for i, x in enumerate(numeros_ordenados):
-            # F(x) para distribución uniforme [0,1] es simplemente x
-            f_x = x
-            # S(x) es la función de distribución empírica
-            s_x = (i + 1) / n
-            s_x_anterior = i / n
-            
-            # Calcular diferencias
-            d1 = abs(f_x - s_x)
-            d2 = abs(f_x - s_x_anterior)
-            d_max = max(d_max, d1, d2)
-        
-        # Valor crítico
-        valor_critico = None
-        for tam, val in sorted(PruebasEstadisticas.KS_CRITICOS.items()):
-            if n <= tam:
-                valor_critico = val
-                break
-        
-        if valor_critico is None:
-            # Aproximación para n grande
-            valor_critico = 1.36 / math.sqrt(n)
+        x = _como_arreglo(numeros)
+        return PruebasEstadisticas._resultado_ks(_estadistico_ks(x), len(x), alpha)
+    
+    @staticmethod
+    def _resultado_ks(d_max: float, n: int, alpha: float) -> Dict:
+        """Decisión de la prueba de Kolmogorov-Smirnov a partir de D"""
+        # Valor crítico y p-valor (distribución exacta para muestra finita)
+        valor_critico = critico_ks(alpha, n)
+        p_valor = p_valor_ks(d_max, n)
         
         # Decisión
         acepta_h0 = d_max < valor_critico
@@ -128,6 +364,7 @@ class PruebasEstadisticas:
             'prueba': 'Kolmogorov-Smirnov',
             'estadistico_D': d_max,
             'valor_critico': valor_critico,
+            'p_valor': p_valor,
             'nivel_significancia': alpha,
             'n': n,
             'acepta_h0': acepta_h0,
@@ -147,14 +384,15 @@ class PruebasEstadisticas:
         Returns:
             Diccionario con resultados de la prueba
         """
-        n = len(numeros)
-        
-        # Contar corridas
-        corridas = 1
-        for i in range(1, n):
-            if (numeros[i] > numeros[i-1]) != (numeros[i-1] > numeros[i-2] if i > 1 else True):
-                corridas += 1
+        x = _como_arreglo(numeros)
         
+        # Contar corridas (cambios de signo de las diferencias)
+        corridas = _contar_corridas(x)
+        return PruebasEstadisticas._resultado_corridas(corridas, len(x), alpha)
+    
+    @staticmethod
+    def _resultado_corridas(corridas: int, n: int, alpha: float) -> Dict:
+        """Estadístico Z y decisión de la prueba de corridas"""
         # Media y desviación estándar esperadas
         mu_r = (2 * n - 1) / 3
         sigma_r = math.sqrt((16 * n - 29) / 90)
@@ -162,8 +400,9 @@ class PruebasEstadisticas:
         # Estadístico Z
         z = (corridas - mu_r) / sigma_r
         
-        # Valor crítico (distribución normal)
-        z_critico = 1.96  # Para α = 0.05 (bilateral)
+        # Valor crítico y p-valor (distribución normal, bilateral)
+        z_critico = critico_normal(alpha)
+        p_valor = p_valor_normal(z)
         
         # Decisión
         acepta_h0 = abs(z) < z_critico
@@ -175,6 +414,7 @@ class PruebasEstadisticas:
             'desviacion_estandar': sigma_r,
             'estadistico_Z': z,
             'valor_critico': z_critico,
+            'p_valor': p_valor,
             'nivel_significancia': alpha,
             'acepta_h0': acepta_h0,
             'conclusion': 'ACEPTA independencia' if acepta_h0 else 'RECHAZA independencia'
@@ -186,38 +426,31 @@ class PruebasEstadisticas:
         """
         Prueba de Póker para aleatoriedad
         
+        Con 3 dígitos las categorías son TD, 1P y T; con 4 se agregan 2P y
+        P, y con 5 también TP y Q.
+        
         Args:
             numeros: Lista de números en [0,1]
-            digitos: Número de dígitos a considerar
+            digitos: Número de dígitos a considerar (2 a DIGITOS_MAXIMOS_POKER)
             alpha: Nivel de significancia
             
         Returns:
             Diccionario con resultados de la prueba
         """
-        n = len(numeros)
+        x = _como_arreglo(numeros)
         
-        # Probabilidades teóricas para 3 dígitos
-        prob_teoricas = {
-            'TD': 0.720,  # Todos diferentes
-            '1P': 0.270,  # Un par
-            'T': 0.010,   # Tercia
-        }
-        
-        # Contar categorías
-        categorias = {'TD': 0, '1P': 0, 'T': 0}
-        
-        for num in numeros:
-            # Extraer dígitos
-            num_str = f"{num:.{digitos}f}".replace('.', '')[:digitos]
-            contador = Counter(num_str)
-            frecuencias = sorted(contador.values(), reverse=True)
-            
-            if frecuencias[0] == 3:
-                categorias['T'] += 1
-            elif frecuencias[0] == 2:
-                categorias['1P'] += 1
-            else:
-                categorias['TD'] += 1
+        # Contar categorías con los primeros dígitos decimales (truncados)
+        conteos = _conteo_poker(x, digitos).tolist()
+        categorias = dict(zip(_categorias_poker(digitos)[0], conteos))
+        return PruebasEstadisticas._resultado_poker(categorias, len(x), alpha, digitos)
+    
+    @staticmethod
+    def _resultado_poker(categorias: Dict[str, int], n: int, alpha: float,
+                         digitos: int = 3) -> Dict:
+        """Estadístico y decisión de la prueba de póker a partir de los conteos"""
+        # Probabilidades teóricas (números de Stirling)
+        nombres, probabilidades, _ = _categorias_poker(digitos)
+        prob_teoricas = dict(zip(nombres, probabilidades.tolist()))
         
         # Calcular Chi-cuadrada
         chi_cuadrado = sum(
@@ -227,7 +460,8 @@ class PruebasEstadisticas:
         
         # Grados de libertad
         gl = len(categorias) - 1
-        valor_critico = PruebasEstadisticas.CHI_CUADRADA_CRITICOS.get(gl, 5.991)
+        valor_critico = critico_chi2(alpha, gl)
+        p_valor = p_valor_chi2(chi_cuadrado, gl)
         
         # Decisión
         acepta_h0 = chi_cuadrado < valor_critico
@@ -237,6 +471,7 @@ class PruebasEstadisticas:
             'estadistico': chi_cuadrado,
             'grados_libertad': gl,
             'valor_critico': valor_critico,
+            'p_valor': p_valor,
             'nivel_significancia': alpha,
             'categorias_observadas': categorias,
             'probabilidades_teoricas': prob_teoricas,
@@ -244,6 +479,349 @@ class PruebasEstadisticas:
             'conclusion': 'ACEPTA aleatoriedad' if acepta_h0 else 'RECHAZA aleatoriedad'
         }
     
+    # ========== BATERÍA EXTENDIDA ==========
+    
+    # Números procesados a la vez por las pruebas extendidas; con un
+    # memmap de 10^9 números la memoria usada es la de un tramo
+    TAM_BLOQUE = 2**22
+    
+    @staticmethod
+    def _resultado_chi_general(prueba: str, chi_cuadrado: float, gl: int,
+                               alpha: float, hipotesis: str) -> Dict:
+        """Decisión de una prueba cuyo estadístico sigue una chi-cuadrada con gl grados"""
+        valor_critico = critico_chi2(alpha, gl)
+        acepta_h0 = chi_cuadrado < valor_critico
+        return {
+            'prueba': prueba,
+            'estadistico': chi_cuadrado,
+            'grados_libertad': gl,
+            'valor_critico': valor_critico,
+            'p_valor': p_valor_chi2(chi_cuadrado, gl),
+            'nivel_significancia': alpha,
+            'acepta_h0': acepta_h0,
+            'conclusion': f"{'ACEPTA' if acepta_h0 else 'RECHAZA'} {hipotesis}"
+        }
+    
+    @staticmethod
+    def _resultado_poisson(prueba: str, observado: int, esperado: float,
+                           alpha: float, hipotesis: str) -> Dict:
+        """Decisión bilateral de un conteo con distribución de Poisson"""
+        p_valor = p_valor_poisson(observado, esperado)
+        acepta_h0 = p_valor >= alpha
+        return {
+            'prueba': prueba,
+            'observado': observado,
+            'esperado': esperado,
+            'p_valor': p_valor,
+            'nivel_significancia': alpha,
+            'acepta_h0': acepta_h0,
+            'conclusion': f"{'ACEPTA' if acepta_h0 else 'RECHAZA'} {hipotesis}"
+        }
+    
+    @staticmethod
+    def prueba_huecos(numeros, alfa: float = 0.0, beta: float = 0.0625,
+                      t: int = None, alpha: float = 0.05) -> Dict:
+        """
+        Prueba de huecos (Knuth, 3.3.2 D)
+        
+        Cuenta la longitud de los huecos entre números consecutivos que caen
+        en [alfa, beta); con p = beta - alfa, un hueco de longitud r ocurre
+        con probabilidad p (1-p)^r. Las longitudes >= t se agrupan.
+        
+        Args:
+            numeros: Lista o arreglo de números en [0,1]
+            alfa: Límite inferior del intervalo
+            beta: Límite superior del intervalo
+            t: Longitud a partir de la cual se agrupan los huecos (None elige
+               la mayor con al menos 5 huecos esperados por clase)
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de la prueba
+        """
+        x = _como_arreglo(numeros)
+        p = beta - alfa
+        if not 0 < p < 1:
+            raise ValueError("Se requiere 0 <= alfa < beta <= 1 con beta - alfa < 1")
+        if t is None:
+            # G p (1-p)^(t-1) >= 5, con G = n p huecos esperados
+            esperados = len(x) * p
+            t = int(1 + math.log(5 / (esperados * p)) / math.log(1 - p)) if esperados * p > 5 else 1
+            t = max(t, 1)
+        
+        conteos = np.zeros(t + 1, dtype=np.int64)
+        ultimo = -1
+        desplazamiento = 0
+        for tramo in _tramos(x, PruebasEstadisticas.TAM_BLOQUE):
+            aciertos = np.flatnonzero((tramo >= alfa) & (tramo < beta)) + desplazamiento
+            if len(aciertos):
+                huecos = np.diff(aciertos, prepend=ultimo) - 1
+                np.minimum(huecos, t, out=huecos)
+                conteos += np.bincount(huecos, minlength=t + 1)
+                ultimo = int(aciertos[-1])
+            desplazamiento += len(tramo)
+        
+        total = int(conteos.sum())
+        probabilidades = p * (1 - p) ** np.arange(t + 1, dtype=np.float64)
+        probabilidades[t] = (1 - p) ** t
+        esperadas = total * probabilidades
+        chi_cuadrado = float(np.sum((conteos - esperadas) ** 2 / esperadas)) if total else 0.0
+        
+        resultado = PruebasEstadisticas._resultado_chi_general(
+            'Huecos', chi_cuadrado, t, alpha, 'independencia')
+        resultado.update({
+            'intervalo': (alfa, beta),
+            'huecos': total,
+            'frecuencias_observadas': conteos.tolist(),
+            'frecuencias_esperadas': esperadas.tolist()
+        })
+        return resultado
+    
+    @staticmethod
+    def prueba_serial(numeros, dimension: int = 2, d: int = None,
+                      alpha: float = 0.05) -> Dict:
+        """
+        Prueba serial con t-tuplas traslapadas (estadístico de Good)
+        
+        Cada número se reduce a una celda floor(d u) y se cuentan las n
+        t-tuplas traslapadas (u_i, ..., u_{i+t-1}), tomando la secuencia
+        como circular. Con psi2_t = d^t / n * sum(N^2) - n, la diferencia
+        psi2_t - psi2_{t-1} sigue una chi-cuadrada con d^t - d^(t-1) grados
+        de libertad, aun cuando las tuplas no son independientes.
+        
+        Args:
+            numeros: Lista o arreglo de números en [0,1]
+            dimension: Tamaño t de las tuplas (2 = pares, 3 = ternas)
+            d: Divisiones por eje (None elige la mayor potencia de 2, hasta
+               256, con al menos 5 tuplas esperadas por celda)
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de la prueba
+        """
+        x = _como_arreglo(numeros)
+        n = len(x)
+        t = dimension
+        if t < 2:
+            raise ValueError("La dimensión debe ser al menos 2")
+        if n < t:
+            raise ValueError(f"Se necesitan al menos {t} números")
+        if d is None:
+            d = 2 ** int(math.log2(max(n / 5, 1)) / t)
+            d = min(max(d, 2), 256)
+        
+        conteos = np.zeros(d ** t, dtype=np.int64)
+        pesos = d ** np.arange(t - 1, -1, -1, dtype=np.int64)
+        acarreo = np.empty(0, dtype=np.int64)
+        
+        def contar(celdas):
+            codigos = np.zeros(len(celdas) - t + 1, dtype=np.int64)
+            for j in range(t):
+                codigos += pesos[j] * celdas[j:len(celdas) - t + 1 + j]
+            conteos[:] += np.bincount(codigos, minlength=d ** t)
+        
+        for tramo in _tramos(x, PruebasEstadisticas.TAM_BLOQUE):
+            celdas = np.concatenate((acarreo, _celdas(tramo, d)))
+            if len(celdas) >= t:
+                contar(celdas)
+            acarreo = celdas[len(celdas) - (t - 1):]
+        # Tuplas que dan la vuelta al inicio de la secuencia
+        contar(np.concatenate((acarreo, _celdas(x[:t - 1], d))))
+        
+        def psi2(conteos_t, celdas_t):
+            return celdas_t / n * float(np.dot(conteos_t, conteos_t.astype(np.float64))) - n
+        
+        # Los conteos de (t-1)-tuplas son marginales de los de t-tuplas
+        anteriores = conteos.reshape(d ** (t - 1), d).sum(axis=1)
+        chi_cuadrado = psi2(conteos, d ** t) - psi2(anteriores, d ** (t - 1))
+        
+        resultado = PruebasEstadisticas._resultado_chi_general(
+            f"Serial (t = {t})", chi_cuadrado, d ** t - d ** (t - 1), alpha, 'independencia')
+        resultado.update({'dimension': t, 'divisiones': d})
+        return resultado
+    
+    @staticmethod
+    def prueba_espaciamientos_cumpleanos(numeros, cumpleanos: int = 2**9,
+                                         dimension: int = 3, d: int = 2**10,
+                                         alpha: float = 0.05) -> Dict:
+        """
+        Prueba de espaciamientos de cumpleaños (Marsaglia)
+        
+        Cada réplica toma m puntos en t dimensiones, los convierte en m
+        "cumpleaños" en un año de N = d^t días, los ordena y cuenta los
+        valores repetidos entre los m - 1 espaciamientos. El total de
+        repeticiones en R réplicas es aproximadamente Poisson con media
+        R m^3 / (4 N); la aproximación sólo es buena si m^3 / (4 N) es
+        pequeña, como en TestU01 (con m = 2^10 y N = 2^24 la media real
+        queda ~1.5 % por debajo y la prueba rechaza generadores buenos con
+        10^8 números). Los valores por omisión (m = 2^9, N = 2^30, media
+        1/32 por réplica) no muestran sesgo con PCG64 a 10^8 números, y los
+        congruenciales fallan porque N se acerca al módulo.
+        
+        Args:
+            numeros: Lista o arreglo de números en [0,1]
+            cumpleanos: Puntos m por réplica
+            dimension: Dimensión t de cada punto
+            d: Divisiones por eje
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de la prueba
+        """
+        x = _como_arreglo(numeros)
+        grupo = cumpleanos * dimension
+        replicas = len(x) // grupo
+        if replicas == 0:
+            raise ValueError(f"Se necesitan al menos {grupo} números")
+        dias = d ** dimension
+        
+        repetidos = 0
+        for tramo in _tramos(x[:replicas * grupo], _tam_grupos(grupo)):
+            celdas = _celdas(tramo, d).reshape(-1, cumpleanos, dimension)
+            fechas = np.sort(celdas @ (d ** np.arange(dimension - 1, -1, -1, dtype=np.int64)), axis=1)
+            espacios = np.sort(np.diff(fechas, axis=1), axis=1)
+            repetidos += int(np.count_nonzero(espacios[:, 1:] == espacios[:, :-1]))
+        
+        resultado = PruebasEstadisticas._resultado_poisson(
+            'Espaciamientos de cumpleaños', repetidos,
+            replicas * cumpleanos ** 3 / (4 * dias), alpha, 'aleatoriedad')
+        resultado.update({'replicas': replicas, 'cumpleanos': cumpleanos, 'dias': dias})
+        return resultado
+    
+    @staticmethod
+    def prueba_colisiones(numeros, bolas: int = 2**14, dimension: int = 2,
+                          d: int = 2**10, alpha: float = 0.05) -> Dict:
+        """
+        Prueba de colisiones (Knuth, 3.3.2 I)
+        
+        Cada réplica lanza m bolas (puntos en t dimensiones) en N = d^t
+        urnas y cuenta las colisiones: bolas que caen en una urna ya
+        ocupada. Con m mucho menor que N el total de colisiones es
+        aproximadamente Poisson con media R (m - N + N (1 - 1/N)^m).
+        
+        Args:
+            numeros: Lista o arreglo de números en [0,1]
+            bolas: Puntos m por réplica
+            dimension: Dimensión t de cada punto
+            d: Divisiones por eje
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de la prueba
+        """
+        x = _como_arreglo(numeros)
+        grupo = bolas * dimension
+        replicas = len(x) // grupo
+        if replicas == 0:
+            raise ValueError(f"Se necesitan al menos {grupo} números")
+        urnas = d ** dimension
+        
+        colisiones = 0
+        for tramo in _tramos(x[:replicas * grupo], _tam_grupos(grupo)):
+            celdas = _celdas(tramo, d).reshape(-1, bolas, dimension)
+            urna = np.sort(celdas @ (d ** np.arange(dimension - 1, -1, -1, dtype=np.int64)), axis=1)
+            colisiones += int(np.count_nonzero(urna[:, 1:] == urna[:, :-1]))
+        
+        esperado = replicas * (bolas - urnas + urnas * math.exp(bolas * math.log1p(-1 / urnas)))
+        resultado = PruebasEstadisticas._resultado_poisson(
+            'Colisiones', colisiones, esperado, alpha, 'uniformidad')
+        resultado.update({'replicas': replicas, 'bolas': bolas, 'urnas': urnas})
+        return resultado
+    
+    @staticmethod
+    def prueba_maximo_de_t(numeros, t: int = 5, k: int = 10,
+                           alpha: float = 0.05) -> Dict:
+        """
+        Prueba del máximo de t (Knuth, 3.3.2 G)
+        
+        Si U_1..U_t son uniformes independientes, max(U)^t es uniforme; se
+        aplica la Chi-cuadrada con k clases a los máximos de grupos
+        consecutivos de t números.
+        
+        Args:
+            numeros: Lista o arreglo de números en [0,1]
+            t: Tamaño de cada grupo
+            k: Número de clases de la Chi-cuadrada
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de la prueba
+        """
+        x = _como_arreglo(numeros)
+        grupos = len(x) // t
+        if grupos == 0:
+            raise ValueError(f"Se necesitan al menos {t} números")
+        
+        frecuencias = np.zeros(k, dtype=np.int64)
+        for tramo in _tramos(x[:grupos * t], _tam_grupos(t)):
+            maximos = tramo.reshape(-1, t).max(axis=1) ** t
+            frecuencias += _frecuencias_chi(maximos, k)
+        
+        resultado = PruebasEstadisticas._resultado_chi(frecuencias.tolist(), alpha)
+        resultado.update({
+            'prueba': f"Máximo de t (t = {t})",
+            'conclusion': resultado['conclusion'].replace('uniformidad', 'independencia'),
+            'grupos': grupos
+        })
+        return resultado
+    
+    @staticmethod
+    def prueba_autocorrelacion(numeros, retardo_maximo: int = 100,
+                               alpha: float = 0.05) -> Dict:
+        """
+        Prueba de autocorrelación en todos los retardos 1..L (Ljung-Box)
+        
+        Las autocovarianzas de todos los retardos se obtienen a la vez con
+        la FFT, en O(n log n): cada tramo se correlaciona con él mismo más
+        los L números siguientes. Para cada retardo k,
+            Z_k = r_k / sqrt((n - k) / (n (n + 2)))
+        es aproximadamente N(0,1), y Q = sum(Z_k^2) es el estadístico de
+        Ljung-Box, con distribución chi-cuadrada de L grados de libertad.
+        
+        Args:
+            numeros: Lista o arreglo de números en [0,1]
+            retardo_maximo: Último retardo L a evaluar
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de la prueba; 'retardos_significativos'
+            usa la corrección de Bonferroni (alpha / L) para que al revisar
+            miles de retardos no aparezcan falsos positivos por azar
+        """
+        x = _como_arreglo(numeros)
+        n = len(x)
+        L = retardo_maximo
+        if not 1 <= L < n:
+            raise ValueError("El retardo máximo debe estar entre 1 y n - 1")
+        
+        media = float(np.mean(x))
+        tam = max(min(PruebasEstadisticas.TAM_BLOQUE, n), 4 * L)
+        tam_fft = fft.next_fast_len(tam + L, real=True)
+        covarianzas = np.zeros(L + 1)
+        for inicio in range(0, n, tam):
+            a = x[inicio:inicio + tam] - media
+            b = x[inicio:inicio + tam + L] - media
+            # sum_i a_i b_(i+k): correlación cruzada sin vuelta circular
+            espectro = np.conj(fft.rfft(a, tam_fft)) * fft.rfft(b, tam_fft)
+            covarianzas += fft.irfft(espectro, tam_fft)[:L + 1]
+        
+        r = covarianzas[1:] / covarianzas[0] if covarianzas[0] > 0 else np.zeros(L)
+        k = np.arange(1, L + 1)
+        z = r / np.sqrt((n - k) / (n * (n + 2.0)))
+        q = float(np.dot(z, z))
+        
+        resultado = PruebasEstadisticas._resultado_chi_general(
+            'Autocorrelación (Ljung-Box)', q, L, alpha, 'independencia')
+        z_bonferroni = critico_normal(alpha / L)
+        resultado.update({
+            'retardo_maximo': L,
+            'autocorrelaciones': r,
+            'estadisticos_Z': z,
+            'p_valores_retardo': p_valor_normal(z),
+            'retardos_significativos': (np.flatnonzero(np.abs(z) > z_bonferroni) + 1).tolist()
+        })
+        return resultado
+    
     @staticmethod
     def ejecutar_todas_pruebas(numeros: List[float]) -> Dict:
         """
@@ -261,6 +839,245 @@ class PruebasEstadisticas:
             'corridas': PruebasEstadisticas.prueba_corridas_arriba_abajo(numeros),
             'poker': PruebasEstadisticas.prueba_poker(numeros)
         }
+    
+    @staticmethod
+    def ejecutar_todas_pruebas_paralelo(numeros, k: int = 10, digitos: int = 3,
+                                        alpha: float = 0.05, procesos: int = None,
+                                        tramos: int = None) -> Dict:
+        """
+        Ejecuta todas las pruebas en un grupo de procesos
+        
+        Los números se copian una sola vez a un bloque de memoria compartida
+        y cada proceso lee de ahí su tramo, sin recibir los datos por pickle.
+        Chi-cuadrada, corridas y póker se dividen en tramos cuyos conteos se
+        suman (las corridas se unen con su estado en los extremos);
+        Kolmogorov-Smirnov necesita ordenar toda la muestra y se ejecuta
+        completa en un proceso.
+        
+        Args:
+            numeros: Lista o arreglo de números en [0,1]
+            k: Número de clases de la prueba Chi-cuadrada
+            digitos: Número de dígitos de la prueba de póker
+            alpha: Nivel de significancia
+            procesos: Procesos del grupo (None = núcleos disponibles; 1 = serial)
+            tramos: Tramos por prueba divisible (None = uno por proceso)
+        
+        Returns:
+            Diccionario con el mismo formato que ejecutar_todas_pruebas; cada
+            resultado incluye 'tiempo_segundos' (suma de sus tramos)
+        """
+        x = _como_arreglo(numeros)
+        n = len(x)
+        procesos = procesos or os.cpu_count() or 1
+        limites = np.linspace(0, n, (tramos or procesos) + 1).astype(np.int64).tolist()
+        
+        memoria = shared_memory.SharedMemory(create=True, size=max(x.nbytes, 1))
+        try:
+            compartido = np.ndarray((n,), dtype=np.float64, buffer=memoria.buf)
+            compartido[:] = x
+            del compartido
+            
+            # K-S primero: es la tarea más larga
+            tareas = [(memoria.name, n, 'kolmogorov_smirnov', 0, n, k, digitos)]
+            tareas += [(memoria.name, n, prueba, inicio, fin, k, digitos)
+                       for prueba in ('chi_cuadrada', 'corridas', 'poker')
+                       for inicio, fin in zip(limites[:-1], limites[1:])]
+            
+            if procesos == 1:
+                parciales = list(map(_tarea_paralela, tareas))
+            else:
+                with ProcessPoolExecutor(max_workers=procesos) as grupo:
+                    parciales = list(grupo.map(_tarea_paralela, tareas))
+        finally:
+            memoria.close()
+            memoria.unlink()
+        
+        # Combinar los tramos en orden
+        por_prueba: Dict[str, List] = {}
+        tiempos: Dict[str, float] = {}
+        for prueba, inicio, parcial, tiempo in sorted(parciales, key=lambda p: (p[0], p[1])):
+            por_prueba.setdefault(prueba, []).append(parcial)
+            tiempos[prueba] = tiempos.get(prueba, 0.0) + tiempo
+        
+        corridas = _estado_corridas(np.empty(0))
+        for estado in por_prueba['corridas']:
+            corridas = _unir_corridas(corridas, estado)
+        
+        resultados = {
+            'chi_cuadrada': PruebasEstadisticas._resultado_chi(
+                sum(por_prueba['chi_cuadrada']).tolist(), alpha),
+            'kolmogorov_smirnov': PruebasEstadisticas._resultado_ks(
+                por_prueba['kolmogorov_smirnov'][0], n, alpha),
+            'corridas': PruebasEstadisticas._resultado_corridas(
+                _total_corridas(corridas), n, alpha),
+            'poker': PruebasEstadisticas._resultado_poker(
+                dict(zip(_categorias_poker(digitos)[0], sum(por_prueba['poker']).tolist())),
+                n, alpha, digitos)
+        }
+        for nombre, resultado in resultados.items():
+            resultado['tiempo_segundos'] = tiempos[nombre]
+        return resultados
+    
+    @staticmethod
+    def ejecutar_todas_pruebas_flujo(bloques: Iterable, k: int = 10, digitos: int = 3,
+                                     bins_ks: int = 2**22, alpha: float = 0.05) -> Dict:
+        """
+        Ejecuta todas las pruebas sobre un flujo de bloques con memoria constante
+        
+        Args:
+            bloques: Iterable de bloques de números en [0,1], p. ej.
+                     GeneradorPseudoaleatorios.iterar(n) o tramos de un memmap
+            k: Número de clases de la prueba Chi-cuadrada
+            digitos: Número de dígitos de la prueba de póker
+            bins_ks: Clases del histograma de Kolmogorov-Smirnov
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de todas las pruebas
+        """
+        bateria = BateriaIncremental(k, digitos, bins_ks)
+        for bloque in bloques:
+            bateria.actualizar(bloque)
+        return bateria.resultados(alpha)
+    
+    @staticmethod
+    def ejecutar_bateria_extendida(numeros, alpha: float = 0.05) -> Dict:
+        """
+        Ejecuta las pruebas extendidas con sus tamaños por omisión
+        
+        Con los valores por omisión se requieren al menos 2^15 números; con
+        10^8 a 10^9 números (p. ej. un memmap de almacen_aleatorios) los
+        tamaños se acercan a los de SmallCrush.
+        
+        Args:
+            numeros: Lista o arreglo de números en [0,1]
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de todas las pruebas extendidas
+        """
+        return {
+            'huecos': PruebasEstadisticas.prueba_huecos(numeros, alpha=alpha),
+            'serial_pares': PruebasEstadisticas.prueba_serial(numeros, 2, alpha=alpha),
+            'serial_ternas': PruebasEstadisticas.prueba_serial(numeros, 3, alpha=alpha),
+            'espaciamientos_cumpleanos': PruebasEstadisticas.prueba_espaciamientos_cumpleanos(
+                numeros, alpha=alpha),
+            'colisiones': PruebasEstadisticas.prueba_colisiones(numeros, alpha=alpha),
+            'maximo_de_t': PruebasEstadisticas.prueba_maximo_de_t(numeros, alpha=alpha),
+            'autocorrelacion': PruebasEstadisticas.prueba_autocorrelacion(numeros, alpha=alpha)
+        }
+
+
+class BateriaIncremental:
+    """
+    Estado acumulado de la batería de pruebas para datos por bloques
+    
+    Sólo se conservan conteos: las k frecuencias de la Chi-cuadrada, las
+    categorías de póker, un histograma fino para Kolmogorov-Smirnov y el
+    estado de las corridas en los extremos del flujo, de modo que la
+    memoria no depende de la cantidad de números.
+    
+    Kolmogorov-Smirnov: con B clases la distribución empírica se conoce
+    exactamente en los bordes j/B, y dentro de una clase tanto S como F
+    varían a lo más lo que en sus bordes, así que
+        D_bordes <= D <= D_bordes + 1/B.
+    Se reporta D_bordes y la cota 1/B en 'cota_error'.
+    """
+    
+    def __init__(self, k: int = 10, digitos: int = 3, bins_ks: int = 2**22):
+        """
+        Inicializa la batería vacía
+        
+        Args:
+            k: Número de clases de la prueba Chi-cuadrada
+            digitos: Número de dígitos de la prueba de póker
+            bins_ks: Clases del histograma de Kolmogorov-Smirnov
+        """
+        self.k = k
+        self.digitos = digitos
+        self.bins_ks = bins_ks
+        self.n = 0
+        self.frecuencias = np.zeros(k, dtype=np.int64)
+        self.histograma = np.zeros(bins_ks, dtype=np.int64)
+        self.poker = np.zeros(len(_categorias_poker(digitos)[0]), dtype=np.int64)
+        self.corridas = _estado_corridas(np.empty(0))
+    
+    def actualizar(self, bloque) -> 'BateriaIncremental':
+        """
+        Incorpora el siguiente bloque del flujo
+        
+        Args:
+            bloque: Números en [0,1] que siguen a los ya procesados
+        
+        Returns:
+            La misma batería (para encadenar llamadas)
+        """
+        x = _como_arreglo(bloque)
+        self.n += len(x)
+        self.frecuencias += _frecuencias_chi(x, self.k)
+        self.histograma += _frecuencias_chi(x, self.bins_ks)
+        self.poker += _conteo_poker(x, self.digitos)
+        self.corridas = _unir_corridas(self.corridas, _estado_corridas(x))
+        return self
+    
+    def combinar(self, otro: 'BateriaIncremental') -> 'BateriaIncremental':
+        """
+        Une la batería de un tramo que sigue inmediatamente a éste
+        
+        Permite procesar tramos consecutivos en paralelo; el orden importa
+        sólo para las corridas.
+        
+        Args:
+            otro: Batería del tramo siguiente (mismos k, dígitos y clases)
+        
+        Returns:
+            Nueva batería equivalente a haber procesado ambos tramos
+        """
+        if (self.k, self.digitos, self.bins_ks) != (otro.k, otro.digitos, otro.bins_ks):
+            raise ValueError("Las baterías deben usar los mismos parámetros")
+        
+        unida = BateriaIncremental(self.k, self.digitos, self.bins_ks)
+        unida.n = self.n + otro.n
+        unida.frecuencias = self.frecuencias + otro.frecuencias
+        unida.histograma = self.histograma + otro.histograma
+        unida.poker = self.poker + otro.poker
+        unida.corridas = _unir_corridas(self.corridas, otro.corridas)
+        return unida
+    
+    def estadistico_ks(self) -> float:
+        """D de Kolmogorov-Smirnov evaluado en los bordes del histograma"""
+        if self.n == 0:
+            return 0.0
+        acumulada = np.cumsum(self.histograma) / self.n
+        bordes = np.arange(1, self.bins_ks + 1) / self.bins_ks
+        # S(b-) con b el borde izquierdo de cada clase, y S(b) en el derecho
+        anterior = np.concatenate(([0.0], acumulada[:-1]))
+        inicio = bordes - 1 / self.bins_ks
+        return float(max(np.max(acumulada - bordes), np.max(inicio - anterior), 0))
+    
+    def resultados(self, alpha: float = 0.05) -> Dict:
+        """
+        Resultados de las cuatro pruebas con lo acumulado hasta ahora
+        
+        Args:
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con el mismo formato que ejecutar_todas_pruebas
+        """
+        if self.n == 0:
+            raise ValueError("La batería no tiene números acumulados")
+        ks = PruebasEstadisticas._resultado_ks(self.estadistico_ks(), self.n, alpha)
+        ks['cota_error'] = 1 / self.bins_ks
+        corridas = _total_corridas(self.corridas)
+        return {
+            'chi_cuadrada': PruebasEstadisticas._resultado_chi(self.frecuencias.tolist(), alpha),
+            'kolmogorov_smirnov': ks,
+            'corridas': PruebasEstadisticas._resultado_corridas(corridas, self.n, alpha),
+            'poker': PruebasEstadisticas._resultado_poker(
+                dict(zip(_categorias_poker(self.digitos)[0], self.poker.tolist())),
+                self.n, alpha, self.digitos)
+        }
 
 
 def ejemplo_uso():
@@ -270,13 +1087,7 @@ def ejemplo_uso():
     print("=" * 70)
     
     # Generar números de ejemplo (usando congruencial lineal)
-    numeros = []
-    x = 5735
-    a, c, m = 1103515245, 12345, 2**31
-    
-    for _ in range(100):
-        x = (a * x + c) % m
-        numeros.append(x / m)
+    numeros = FuenteLCG(semilla=5735).llenar(100).tolist()
     
     print(f"\nNúmeros generados: {len(numeros)}")
     print(f"Primeros 10: {[f'{n:.6f}' for n in numeros[:10]]}")
@@ -292,6 +1103,7 @@ def ejemplo_uso():
     resultado = PruebasEstadisticas.prueba_chi_cuadrada(numeros)
     print(f"   Estadístico χ²: {resultado['estadistico']:.4f}")
     print(f"   Valor crítico: {resultado['valor_critico']:.4f}")
+    print(f"   p-valor: {resultado['p_valor']:.4f}")
     print(f"   Grados de libertad: {resultado['grados_libertad']}")
     print(f"   Conclusión: {resultado['conclusion']}")
     
@@ -301,6 +1113,7 @@ def ejemplo_uso():
     resultado = PruebasEstadisticas.prueba_kolmogorov_smirnov(numeros)
     print(f"   Estadístico D: {resultado['estadistico_D']:.6f}")
     print(f"   Valor crítico: {resultado['valor_critico']:.6f}")
+    print(f"   p-valor: {resultado['p_valor']:.4f}")
     print(f"   Conclusión: {resultado['conclusion']}")
     
     # Corridas
@@ -310,7 +1123,8 @@ def ejemplo_uso():
     print(f"   Corridas observadas: {resultado['corridas_observadas']}")
     print(f"   Corridas esperadas: {resultado['corridas_esperadas']:.2f}")
     print(f"   Estadístico Z: {resultado['estadistico_Z']:.4f}")
-    print(f"   Valor crítico: ±{resultado['valor_critico']}")
+    print(f"   Valor crítico: ±{resultado['valor_critico']:.4f}")
+    print(f"   p-valor: {resultado['p_valor']:.4f}")
     print(f"   Conclusión: {resultado['conclusion']}")
     
     # Póker
@@ -319,8 +1133,55 @@ def ejemplo_uso():
     resultado = PruebasEstadisticas.prueba_poker(numeros)
     print(f"   Estadístico χ²: {resultado['estadistico']:.4f}")
     print(f"   Valor crítico: {resultado['valor_critico']:.4f}")
+    print(f"   p-valor: {resultado['p_valor']:.4f}")
     print(f"   Categorías observadas: {resultado['categorias_observadas']}")
     print(f"   Conclusión: {resultado['conclusion']}")
+    muestra = FuenteLCG(semilla=5735).llenar(10**5)
+    for digitos in (4, 5):
+        resultado = PruebasEstadisticas.prueba_poker(muestra, digitos)
+        print(f"   {digitos} dígitos (10^5 números): {resultado['categorias_observadas']}")
+        print(f"      p-valor: {resultado['p_valor']:.4f}, {resultado['conclusion']}")
+    
+    # Modo de flujo
+    print("\n5. BATERÍA POR BLOQUES (10^7 números, memoria constante)")
+    print("-" * 70)
+    fuente = FuenteLCG(semilla=5735)
+    resultados = PruebasEstadisticas.ejecutar_todas_pruebas_flujo(
+        fuente.llenar(2**20) for _ in range(10))
+    for nombre, resultado in resultados.items():
+        print(f"   {nombre}: {resultado['conclusion']} (p = {resultado['p_valor']:.4f})")
+    print(f"   D de K-S: {resultados['kolmogorov_smirnov']['estadistico_D']:.6f} "
+          f"(± {resultados['kolmogorov_smirnov']['cota_error']:.1e})")
+    
+    # Modo paralelo
+    print("\n6. BATERÍA EN PARALELO (10^7 números en memoria compartida)")
+    print("-" * 70)
+    muestra = FuenteLCG(semilla=5735).llenar(10**7)
+    inicio = time.perf_counter()
+    resultados = PruebasEstadisticas.ejecutar_todas_pruebas_paralelo(muestra)
+    print(f"   Procesos: {os.cpu_count()}, tiempo total: {time.perf_counter() - inicio:.2f} s")
+    for nombre, resultado in resultados.items():
+        print(f"   {nombre}: {resultado['conclusion']} "
+              f"({resultado['tiempo_segundos']:.2f} s)")
+    
+    # Batería extendida
+    print("\n7. BATERÍA EXTENDIDA (2^20 números)")
+    print("-" * 70)
+    for nombre, fuente in (("Congruencial lineal (ANSI C)", FuenteLCG(semilla=5735)),
+                           ("RANDU", FuenteLCG(1, 65539, 0, 2**31))):
+        print(f"   {nombre}:")
+        resultados = PruebasEstadisticas.ejecutar_bateria_extendida(fuente.llenar(2**20))
+        for prueba, resultado in resultados.items():
+            print(f"      {prueba:<28}{resultado['conclusion']:<24}p = {resultado['p_valor']:.4f}")
+    
+    # Calibración con un generador bueno: a 10^8 números la prueba de
+    # espaciamientos no debe rechazar por sesgo de la media de Poisson
+    print("\n8. ESPACIAMIENTOS DE CUMPLEAÑOS CON PCG64 (10^8 números)")
+    print("-" * 70)
+    muestra = np.random.Generator(np.random.PCG64(5735)).random(10**8)
+    resultado = PruebasEstadisticas.prueba_espaciamientos_cumpleanos(muestra)
+    print(f"   Observados: {resultado['observado']}, esperados: {resultado['esperado']:.1f}, "
+          f"p = {resultado['p_valor']:.4f}  {resultado['conclusion']}")
     
     print("\n" + "=" * 70)
 
@@ -5,10 +5,12 @@ Implementa simulación de sistemas M/M/1, M/M/c y análisis de resultados
 """
 
 import math
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Tuple
 from dataclasses import dataclass
 import heapq
 
+from fuente_uniforme import FuenteLCG, como_fuente
+
 
 @dataclass
 class Cliente:
@@ -37,27 +39,88 @@ class Cliente:
 class SimuladorColas:
     """Simulador de sistemas de colas"""
     
-    def __init__(self, semilla: int = 1234):
+    # Parámetros (a, c, m) del congruencial lineal interno
+    PARAMETROS_LCG = (1103515245, 12345, 2**31)
+    
+    def __init__(self, semilla: int = 1234,
+                 generador_uniforme: Callable[[], float] = None,
+                 generador_contador=None):
         """
         Inicializa el simulador
         
         Args:
             semilla: Semilla para el generador de números aleatorios
+            generador_uniforme: Fuente de números uniformes en [0,1): una
+                               FuenteUniforme, un generador con generar_bloque
+                               o una función (p. ej. PCG64(semilla).siguiente).
+                               Si es None, usa FuenteLCG con PARAMETROS_LCG
+            generador_contador: Generador con método uniforme(flujo, entidad,
+                                indice), p. ej. GeneradorPhilox. Si se indica,
+                                el tiempo entre llegadas y el de servicio de
+                                cada cliente dependen sólo de su id, lo que
+                                permite números aleatorios comunes
         """
         self.semilla = semilla
-        self.x = semilla
+        if generador_uniforme is None:
+            self.fuente = FuenteLCG(semilla, *self.PARAMETROS_LCG)
+        else:
+            self.fuente = como_fuente(generador_uniforme)
+        self.generador_contador = generador_contador
         self.clientes_atendidos: List[Cliente] = []
         self.eventos = []  # Cola de prioridad de eventos
     
     def _uniforme(self) -> float:
         """Genera número uniforme en [0,1]"""
-        a, c, m = 1103515245, 12345, 2**31
-        self.x = (a * self.x + c) % m
-        return self.x / m
+        return self.fuente.siguiente()
+    
+    def saltar(self, k: int):
+        """
+        Avanza k pasos la fuente uniforme (en O(log k) con FuenteLCG)
+        
+        Args:
+            k: Número de pasos a saltar
+        """
+        self.fuente.saltar(k)
     
-    def _exponencial(self, lambd: float) -> float:
-        """Genera tiempo exponencial"""
-        return -math.log(self._uniforme()) / lambd
+    def subflujo(self, i: int, longitud: int = 2**20) -> 'SimuladorColas':
+        """
+        Crea un simulador que usa el i-ésimo subflujo disjunto de números
+        
+        Útil para réplicas independientes: la réplica i consume los números
+        [i * longitud, (i + 1) * longitud) de la secuencia de la fuente. Se
+        requiere una fuente con subflujos (FuenteLCG, la fuente por omisión);
+        con un generador basado en contador se lanza ValueError.
+        
+        Args:
+            i: Índice de la réplica/subflujo
+            longitud: Cantidad de números garantizada por subflujo
+        
+        Returns:
+            Nuevo simulador posicionado al inicio del subflujo
+        """
+        if self.generador_contador is not None:
+            raise ValueError("Con un generador basado en contador las réplicas "
+                             "se obtienen con semillas distintas del generador")
+        if not hasattr(self.fuente, 'subflujo'):
+            raise ValueError(f"La fuente {type(self.fuente).__name__} no soporta subflujos")
+        fuente = self.fuente.subflujo(i, longitud)
+        return SimuladorColas(semilla=fuente.semilla, generador_uniforme=fuente)
+    
+    def _exponencial(self, lambd: float, flujo: str = None,
+                     entidad: int = None) -> float:
+        """
+        Genera tiempo exponencial
+        
+        Args:
+            lambd: Tasa
+            flujo: Flujo del generador basado en contador ('llegadas', 'servicio')
+            entidad: Id del cliente al que corresponde el tiempo
+        """
+        if self.generador_contador is not None and flujo is not None:
+            u = self.generador_contador.uniforme(flujo, entidad)
+        else:
+            u = self._uniforme()
+        return -math.log(u) / lambd
     
     def simular_mm1(self, lambd: float, mu: float, 
                     tiempo_simulacion: float) -> Dict:
@@ -88,7 +151,7 @@ class SimuladorColas:
         cliente_id = 0
         
         # Generar primer cliente
-        tiempo_proxima_llegada = self._exponencial(lambd)
+        tiempo_proxima_llegada = self._exponencial(lambd, 'llegadas', 1)
         
         # Estadísticas
         suma_tiempo_cola = 0
@@ -108,7 +171,7 @@ class SimuladorColas:
                 if tiempo_fin_servicio == float('inf'):
                     # Servidor libre, atender inmediatamente
                     cliente.tiempo_inicio_servicio = tiempo_actual
-                    tiempo_servicio = self._exponencial(mu)
+                    tiempo_servicio = self._exponencial(mu, 'servicio', cliente.id)
                     cliente.tiempo_fin_servicio = tiempo_actual + tiempo_servicio
                     tiempo_fin_servicio = cliente.tiempo_fin_servicio
                 else:
@@ -116,7 +179,8 @@ class SimuladorColas:
                     cola.append(cliente)
                 
                 # Generar próxima llegada
-                tiempo_proxima_llegada = tiempo_actual + self._exponencial(lambd)
+                tiempo_proxima_llegada = tiempo_actual + self._exponencial(
+                    lambd, 'llegadas', cliente_id + 1)
             else:
                 # Evento: Fin de servicio
                 tiempo_actual = tiempo_fin_servicio
@@ -131,7 +195,8 @@ class SimuladorColas:
                     # Atender siguiente cliente en cola
                     self.cliente_en_servicio = cola.pop(0)
                     self.cliente_en_servicio.tiempo_inicio_servicio = tiempo_actual
-                    tiempo_servicio = self._exponencial(mu)
+                    tiempo_servicio = self._exponencial(
+                        mu, 'servicio', self.cliente_en_servicio.id)
                     self.cliente_en_servicio.tiempo_fin_servicio = tiempo_actual + tiempo_servicio
                     tiempo_fin_servicio = self.cliente_en_servicio.tiempo_fin_servicio
                 else: